@@ -88,6 +88,7 @@ to the `api_token` argument when initializing Neptune.
 
 Learn more in the docs: https://docs-legacy.neptune.ai/api/neptune/
 """
+
 __all__ = [
     "ANONYMOUS_API_TOKEN",
     "init_model",
@@ -102,22 +103,53 @@ __all__ = [
 ]
 
 
-from neptune.constants import ANONYMOUS_API_TOKEN
-from neptune.internal.extensions import load_extensions
-from neptune.internal.patches import apply_patches
-from neptune.objects import (
-    Model,
-    ModelVersion,
-    Project,
-    Run,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
 )
-from neptune.version import __version__
 
-# Apply patches of external libraries
-apply_patches()
-load_extensions()
+from neptune.constants import ANONYMOUS_API_TOKEN
+from neptune.version import __version__
 
-init_run = Run
-init_model = Model
-init_model_version = ModelVersion
-init_project = Project
+if TYPE_CHECKING:
+    from neptune.objects import (
+        Model,
+        ModelVersion,
+        Project,
+        Run,
+    )
+
+    init_run = Run
+    init_model = Model
+    init_model_version = ModelVersion
+    init_project = Project
+
+# Neptune objects pull in the HTTP clients, API specs and integrations, so they are imported on first access
+_LAZY_OBJECTS = {
+    "Run": "Run",
+    "Model": "Model",
+    "ModelVersion": "ModelVersion",
+    "Project": "Project",
+    "init_run": "Run",
+    "init_model": "Model",
+    "init_model_version": "ModelVersion",
+    "init_project": "Project",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_OBJECTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import neptune.objects
+    from neptune.internal.initialization import ensure_initialized
+
+    ensure_initialized()
+    value = getattr(neptune.objects, _LAZY_OBJECTS[name])
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
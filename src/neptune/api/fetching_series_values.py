@@ -13,13 +13,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ("fetch_series_values",)
+__all__ = (
+    "fetch_series_values",
+    "fetch_series_values_after",
+    "fetch_series_values_as_arrays",
+    "points_to_arrays",
+    "SeriesArrays",
+)
 
+import math
+from array import array
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from itertools import (
+    chain,
+    islice,
+)
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
+    Iterable,
     Iterator,
+    List,
+    NamedTuple,
     Optional,
+    Protocol,
     TypeVar,
 )
 
@@ -28,14 +51,47 @@ from neptune.api.models import (
     StringPointValue,
 )
 from neptune.internal.backends.utils import construct_progress_bar
-from neptune.typing import ProgressBarType
+from neptune.typing import (
+    ProgressBarCallback,
+    ProgressBarType,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
 PointValue = TypeVar("PointValue", StringPointValue, FloatPointValue)
 
 
+class SeriesPage(Protocol[PointValue]):
+    """A page of points returned by a getter, such as `StringSeriesValues` or `FloatSeriesValues`."""
+
+    total: int
+    values: List[PointValue]
+
+
+SeriesGetter = Callable[..., SeriesPage[PointValue]]
+
+PAGES_PER_SHARD = 10
+
+
+class SeriesArrays(NamedTuple):
+    steps: "np.ndarray"
+    values: "np.ndarray"
+    timestamps: "np.ndarray"
+
+
 def fetch_series_values(
-    getter: Callable[..., Any], path: str, step_size: int = 1000, progress_bar: Optional[ProgressBarType] = None
+    getter: SeriesGetter[PointValue],
+    path: str,
+    step_size: int = 1000,
+    progress_bar: Optional[ProgressBarType] = None,
+    max_workers: int = 1,
 ) -> Iterator[PointValue]:
+    """Yields all points of a series in step order, fetching `step_size` points per request.
+
+    With `max_workers` greater than 1, the steps following the first page are split into shards of
+    `PAGES_PER_SHARD` pages each, which are fetched concurrently.
+    """
     first_batch = getter(from_step=None, limit=1)
     data_count = 0
     total = first_batch.total
@@ -49,6 +105,10 @@ def fetch_series_values(
     with construct_progress_bar(progress_bar, f"Fetching {path} values") as bar:
         bar.update(by=data_count, total=total)
 
+        if max_workers > 1 and total > 2 * step_size:
+            yield from _fetch_sharded(getter, last_step_value, total, step_size, max_workers, bar)
+            return
+
         while data_count < first_batch.total:
             batch = getter(from_step=last_step_value, limit=step_size)
 
@@ -58,3 +118,135 @@ def fetch_series_values(
 
             last_step_value = batch.values[-1].step if batch.values else None
             data_count += len(batch.values)
+
+
+def fetch_series_values_as_arrays(
+    getter: SeriesGetter[PointValue],
+    path: str,
+    step_size: int = 1000,
+    progress_bar: Optional[ProgressBarType] = None,
+    max_workers: int = 1,
+) -> SeriesArrays:
+    """Fetches a series like `fetch_series_values`, returning steps, values and timestamps as NumPy arrays.
+
+    Values of float series are `float64`, values of string series are Python objects. Timestamps are
+    `datetime64[ms]` in UTC.
+    """
+    return points_to_arrays(fetch_series_values(getter, path, step_size, progress_bar, max_workers))
+
+
+def fetch_series_values_after(getter: SeriesGetter[PointValue], step: float, step_size: int = 1000) -> List[PointValue]:
+    """Fetches all points with steps greater than `step`."""
+    return _fetch_range(getter, step, None, step_size)
+
+
+def points_to_arrays(points: Iterable[PointValue]) -> SeriesArrays:
+    """Collects `points` into typed buffers as they arrive, so no intermediate list of points is kept."""
+    import numpy as np
+
+    steps = array("d")
+    float_values = array("d")
+    object_values: List[Any] = []
+    timestamps = array("q")
+
+    iterator = iter(points)
+    first = next(iterator, None)
+    is_float = isinstance(first, FloatPointValue)
+
+    # separate loops for float and string series, so the type of the values is checked only once
+    if isinstance(first, FloatPointValue):
+        for point in chain((first,), iterator):
+            steps.append(point.step)
+            float_values.append(point.value)
+            timestamps.append(round(point.timestamp.timestamp() * 1000))
+    elif first is not None:
+        for point in chain((first,), iterator):
+            steps.append(point.step)
+            object_values.append(point.value)
+            timestamps.append(round(point.timestamp.timestamp() * 1000))
+
+    return SeriesArrays(
+        steps=np.array(steps, dtype=np.float64),
+        values=np.array(float_values, dtype=np.float64) if is_float else np.array(object_values, dtype=object),
+        timestamps=np.array(timestamps, dtype=np.int64).astype("datetime64[ms]"),
+    )
+
+
+def _fetch_sharded(
+    getter: SeriesGetter[PointValue],
+    from_step: Optional[float],
+    total: int,
+    step_size: int,
+    max_workers: int,
+    bar: ProgressBarCallback,
+) -> Iterator[PointValue]:
+    first_page = getter(from_step=from_step, limit=step_size).values
+    bar.update(by=len(first_page), total=total)
+    yield from first_page
+
+    if len(first_page) >= total or len(first_page) < step_size:
+        return
+
+    start = first_page[-1].step
+    if len(first_page) < 2 or start <= first_page[0].step:
+        # the density of steps cannot be estimated, so the remaining pages are fetched one after another
+        for page in _pages_after(getter, start, step_size):
+            bar.update(by=len(page), total=total)
+            yield from page
+        return
+
+    # Shard boundaries are estimated from the density of steps on the first page. Every shard ends where the
+    # next one starts and the last one is unbounded, so a poor estimate only affects how the work is balanced.
+    shard_width = (start - first_page[0].step) / (len(first_page) - 1) * step_size * PAGES_PER_SHARD
+    shard_count = math.ceil((total - len(first_page)) / (step_size * PAGES_PER_SHARD))
+
+    def fetch_shard(index: int) -> List[PointValue]:
+        after = start + index * shard_width
+        up_to = start + (index + 1) * shard_width if index < shard_count - 1 else None
+        return _fetch_range(getter, after, up_to, step_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="NeptuneFetchSeries") as executor:
+        shards = iter(range(shard_count))
+        pending: Deque[Future] = deque(executor.submit(fetch_shard, index) for index in islice(shards, 2 * max_workers))
+        try:
+            while pending:
+                values = pending.popleft().result()
+                next_index = next(shards, None)
+                if next_index is not None:
+                    pending.append(executor.submit(fetch_shard, next_index))
+
+                bar.update(by=len(values), total=total)
+                yield from values
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _pages_after(getter: SeriesGetter[PointValue], after: float, step_size: int) -> Iterator[List[PointValue]]:
+    """Yields pages of points with steps greater than `after`."""
+    from_step = after
+    while True:
+        page = getter(from_step=from_step, limit=step_size).values
+        if page:
+            yield page
+        if len(page) < step_size or page[-1].step <= from_step:
+            return
+        from_step = page[-1].step
+
+
+def _fetch_range(
+    getter: SeriesGetter[PointValue], after: float, up_to: Optional[float], step_size: int
+) -> List[PointValue]:
+    """Fetches points with steps in the range (`after`, `up_to`]."""
+    values: List[PointValue] = []
+    from_step = after
+    while True:
+        batch = getter(from_step=from_step, limit=step_size).values
+        if up_to is not None and batch and batch[-1].step > up_to:
+            values.extend(value for value in batch if value.step <= up_to)
+            return values
+
+        values.extend(batch)
+        if len(batch) < step_size or batch[-1].step <= from_step:
+            return values
+        from_step = batch[-1].step
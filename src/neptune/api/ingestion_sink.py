@@ -0,0 +1,154 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["IngestionSink", "NullIngestionSink", "LocalIngestionSink", "ApiIngestionSink"]
+
+import abc
+import threading
+from http import HTTPStatus
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import httpx
+from neptune_api.api.data_ingestion import submit_operation
+
+from neptune.api.operations import (
+    RunOperation,
+    Serializable,
+)
+from neptune.internal.exceptions import (
+    NeptuneConnectionLostException,
+    NeptuneException,
+)
+from neptune.internal.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    import neptune_api.proto.neptune_pb.ingest.v1.pub.ingest_pb2 as ingest_pb2
+    from neptune_api import AuthenticatedClient
+
+logger = get_logger()
+
+# client errors that are worth retrying, unlike operations the endpoint rejects
+RETRYABLE_CLIENT_ERRORS = (HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.TOO_MANY_REQUESTS)
+
+
+class IngestionSink(abc.ABC):
+    """Destination of the operations produced by the asynchronous operation processor."""
+
+    @abc.abstractmethod
+    def submit(self, operations: Sequence[Serializable]) -> int:
+        """Sends `operations` in order and returns how many leading ones were accepted.
+
+        Accepting only a prefix is allowed; the caller acknowledges what was accepted and submits the rest again.
+        A sink that cannot accept anything should raise `NeptuneConnectionLostException`.
+        """
+
+
+class NullIngestionSink(IngestionSink):
+    """Accepts and drops all operations."""
+
+    def submit(self, operations: Sequence[Serializable]) -> int:
+        return len(operations)
+
+
+class LocalIngestionSink(IngestionSink):
+    """Keeps serialized operations in memory, for tests and local inspection.
+
+    `max_batch_size` limits how many operations a single `submit` call accepts, which simulates partial acks.
+    """
+
+    def __init__(self, project: str = "local", run_id: str = "local", max_batch_size: Optional[int] = None) -> None:
+        self._project = project
+        self._run_id = run_id
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._received: List["ingest_pb2.RunOperation"] = []
+        self.submit_calls: int = 0
+
+    @property
+    def received(self) -> List["ingest_pb2.RunOperation"]:
+        with self._lock:
+            return list(self._received)
+
+    def submit(self, operations: Sequence[Serializable]) -> int:
+        accepted = operations if self._max_batch_size is None else operations[: self._max_batch_size]
+        protos = [
+            proto
+            for operation in accepted
+            for proto in RunOperation(self._project, self._run_id, operation).to_protos()
+        ]
+        with self._lock:
+            self._received.extend(protos)
+            self.submit_calls += 1
+        return len(accepted)
+
+
+class ApiIngestionSink(IngestionSink):
+    """Submits operations one by one to the Neptune ingestion endpoint.
+
+    An operation may be submitted as several requests. If sending stops in the middle of an operation, the requests
+    already accepted are skipped when the same operation is submitted again. Operations the endpoint rejects are
+    logged and skipped, like errors reported by the backend.
+    """
+
+    def __init__(self, client: "AuthenticatedClient", project: str, run_id: str) -> None:
+        self._client = client
+        self._project = project
+        self._run_id = run_id
+        # the operation whose requests were only partially accepted, and how many of them
+        self._partial: Optional[Tuple[Serializable, int]] = None
+
+    def submit(self, operations: Sequence[Serializable]) -> int:
+        for accepted, operation in enumerate(operations):
+            protos = RunOperation(self._project, self._run_id, operation).to_protos()
+            sent = self._partial[1] if self._partial is not None and self._partial[0] is operation else 0
+            self._partial = None
+
+            for index in range(sent, len(protos)):
+                try:
+                    response = submit_operation.sync_detailed(client=self._client, body=protos[index])
+                except httpx.TransportError as e:
+                    return self._interrupted(operation, index, accepted, e)
+
+                status = response.status_code
+                if status >= HTTPStatus.INTERNAL_SERVER_ERROR or status in RETRYABLE_CLIENT_ERRORS:
+                    return self._interrupted(
+                        operation,
+                        index,
+                        accepted,
+                        NeptuneException(f"Ingestion endpoint responded with status {status}"),
+                    )
+                if status != HTTPStatus.OK:
+                    logger.error(
+                        "Error occurred during asynchronous operation processing: "
+                        "ingestion endpoint rejected an operation with status %s: %r",
+                        status,
+                        response.content,
+                    )
+
+        return len(operations)
+
+    def _interrupted(self, operation: Serializable, sent: int, accepted: int, error: Exception) -> int:
+        if sent:
+            self._partial = (operation, sent)
+        if accepted:
+            return accepted
+        raise NeptuneConnectionLostException(error) from error
@@ -43,6 +43,7 @@ __all__ = (
 
 import abc
 import re
+import sys
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from datetime import (
@@ -95,10 +96,18 @@ class FieldType(Enum):
 
 @dataclass
 class Field(abc.ABC):
+    # Fields of large tables are numerous, so they have no `__dict__`, and their paths, repeated in every row,
+    # are interned to be shared between rows
+    __slots__ = ("path",)
+
     path: str
     type: ClassVar[FieldType] = dataclass_field(init=False)
     _registry: ClassVar[Dict[str, Type[Field]]] = {}
 
+    def __post_init__(self) -> None:
+        if type(self.path) is str:
+            self.path = sys.intern(self.path)
+
     def __init_subclass__(cls, *args: Any, field_type: FieldType, **kwargs: Any) -> None:
         super().__init_subclass__(*args, **kwargs)
         cls.type = field_type
@@ -172,6 +181,8 @@ class FieldVisitor(Generic[Ret], abc.ABC):
 
 @dataclass
 class FloatField(Field, field_type=FieldType.FLOAT):
+    __slots__ = ("value",)
+
     value: float
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -192,6 +203,8 @@ class FloatField(Field, field_type=FieldType.FLOAT):
 
 @dataclass
 class IntField(Field, field_type=FieldType.INT):
+    __slots__ = ("value",)
+
     value: int
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -212,6 +225,8 @@ class IntField(Field, field_type=FieldType.INT):
 
 @dataclass
 class BoolField(Field, field_type=FieldType.BOOL):
+    __slots__ = ("value",)
+
     value: bool
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -232,6 +247,8 @@ class BoolField(Field, field_type=FieldType.BOOL):
 
 @dataclass
 class StringField(Field, field_type=FieldType.STRING):
+    __slots__ = ("value",)
+
     value: str
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -252,6 +269,8 @@ class StringField(Field, field_type=FieldType.STRING):
 
 @dataclass
 class DateTimeField(Field, field_type=FieldType.DATETIME):
+    __slots__ = ("value",)
+
     value: datetime
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -274,7 +293,10 @@ class DateTimeField(Field, field_type=FieldType.DATETIME):
 
 @dataclass
 class FloatSeriesField(Field, field_type=FieldType.FLOAT_SERIES):
+    __slots__ = ("last", "last_step")
+
     last: Optional[float]
+    last_step: Optional[float]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
         return visitor.visit_float_series(self)
@@ -282,21 +304,26 @@ class FloatSeriesField(Field, field_type=FieldType.FLOAT_SERIES):
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> FloatSeriesField:
         last = float(data["last"]) if "last" in data else None
-        return FloatSeriesField(path=data["attributeName"], last=last)
+        last_step = float(data["lastStep"]) if data.get("lastStep") is not None else None
+        return FloatSeriesField(path=data["attributeName"], last=last, last_step=last_step)
 
     @staticmethod
     def from_model(model: Any) -> FloatSeriesField:
-        return FloatSeriesField(path=model.attributeName, last=model.last)
+        return FloatSeriesField(path=model.attributeName, last=model.last, last_step=getattr(model, "lastStep", None))
 
     @staticmethod
     def from_proto(data: ProtoFloatSeriesAttributeDTO) -> FloatSeriesField:
         last = data.last if data.HasField("last") else None
-        return FloatSeriesField(path=data.attribute_name, last=last)
+        last_step = data.last_step if data.HasField("last_step") else None
+        return FloatSeriesField(path=data.attribute_name, last=last, last_step=last_step)
 
 
 @dataclass
 class StringSeriesField(Field, field_type=FieldType.STRING_SERIES):
+    __slots__ = ("last", "last_step")
+
     last: Optional[str]
+    last_step: Optional[float]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
         return visitor.visit_string_series(self)
@@ -304,11 +331,12 @@ class StringSeriesField(Field, field_type=FieldType.STRING_SERIES):
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> StringSeriesField:
         last = str(data["last"]) if "last" in data else None
-        return StringSeriesField(path=data["attributeName"], last=last)
+        last_step = float(data["lastStep"]) if data.get("lastStep") is not None else None
+        return StringSeriesField(path=data["attributeName"], last=last, last_step=last_step)
 
     @staticmethod
     def from_model(model: Any) -> StringSeriesField:
-        return StringSeriesField(path=model.attributeName, last=model.last)
+        return StringSeriesField(path=model.attributeName, last=model.last, last_step=getattr(model, "lastStep", None))
 
     @staticmethod
     def from_proto(data: Any) -> StringSeriesField:
@@ -317,6 +345,8 @@ class StringSeriesField(Field, field_type=FieldType.STRING_SERIES):
 
 @dataclass
 class StringSetField(Field, field_type=FieldType.STRING_SET):
+    __slots__ = ("values",)
+
     values: Set[str]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -337,6 +367,8 @@ class StringSetField(Field, field_type=FieldType.STRING_SET):
 
 @dataclass
 class ObjectStateField(Field, field_type=FieldType.OBJECT_STATE):
+    __slots__ = ("value",)
+
     value: str
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -359,6 +391,8 @@ class ObjectStateField(Field, field_type=FieldType.OBJECT_STATE):
 
 @dataclass
 class NotebookRefField(Field, field_type=FieldType.NOTEBOOK_REF):
+    __slots__ = ("notebook_name",)
+
     notebook_name: Optional[str]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -380,6 +414,8 @@ class NotebookRefField(Field, field_type=FieldType.NOTEBOOK_REF):
 
 @dataclass
 class LeaderboardEntry:
+    __slots__ = ("object_id", "fields")
+
     object_id: str
     fields: List[Field]
 
@@ -13,6 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+__all__ = ["OperationToApiVisitor", "CoalescedOperations", "coalesce_operations"]
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import neptune_api.proto.neptune_pb.ingest.v1.common_pb2 as common_pb2
+from google.protobuf import timestamp_pb2
 
 import neptune.api.operations as api_operations
 from neptune.api.operations import Serializable
@@ -24,8 +40,12 @@ from neptune.core.operations import (
     AssignString,
     LogFloats,
 )
-from neptune.core.operations.operation import RunCreation
+from neptune.core.operations.operation import (
+    Operation,
+    RunCreation,
+)
 from neptune.core.operations.operation_visitor import OperationVisitor
+from neptune.core.operations.series_columns import SeriesColumns
 from neptune.internal.utils.paths import path_to_str
 
 
@@ -53,3 +73,94 @@ class OperationToApiVisitor(OperationVisitor[Serializable]):
 
     def visit_run_creation(self, op: RunCreation) -> Serializable:
         return api_operations.Run(op.created_at, op.custom_id)
+
+
+@dataclass
+class CoalescedOperations:
+    operations: List[Serializable]
+    # for each source operation, the index of the last coalesced operation carrying its data (-1 if none)
+    last_indices: List[int]
+
+    def covered_count(self, submitted: int) -> int:
+        """Returns the length of the longest prefix of source operations fully contained
+        in the first `submitted` coalesced operations."""
+        return bisect_left(list(accumulate(self.last_indices, max)), submitted)
+
+
+def coalesce_operations(operations: Sequence[Operation]) -> CoalescedOperations:
+    """Merges assignments, and series points logged at the same step, into shared `UpdateRunSnapshot`s.
+
+    Assignments are merged into a snapshot without a step. Order is preserved per field: a path appended twice
+    at the same step, or any operation following a run creation, starts a new snapshot.
+    """
+    visitor = OperationToSnapshotsVisitor()
+    last_indices = [visitor.add(op) for op in operations]
+    return CoalescedOperations(operations=visitor.operations, last_indices=last_indices)
+
+
+class OperationToSnapshotsVisitor(OperationVisitor[None]):
+    def __init__(self) -> None:
+        self.operations: List[Serializable] = []
+        self._open: Dict[Optional[float], Tuple[int, api_operations.UpdateRunSnapshot]] = {}
+        # assignments get a snapshot of their own, so they never take the step or timestamp of a series point
+        self._assignments: Optional[Tuple[int, api_operations.UpdateRunSnapshot]] = None
+        self._last_index: int = -1
+
+    def add(self, op: Operation) -> int:
+        self._last_index = -1
+        op.accept(self)
+        return self._last_index
+
+    def _append_operation(self, operation: Serializable) -> int:
+        self.operations.append(operation)
+        return len(self.operations) - 1
+
+    def _snapshot_to_append(self, path: str, step: Optional[float], ts: float) -> api_operations.UpdateRunSnapshot:
+        index, snapshot = self._open.get(step, (-1, None))
+        if snapshot is None or path in snapshot.append:
+            snapshot = api_operations.UpdateRunSnapshot(step=step, timestamp=ts)
+            index = self._append_operation(snapshot)
+            self._open[step] = (index, snapshot)
+        self._last_index = max(self._last_index, index)
+        return snapshot
+
+    def _assign(self, path: List[str], value: common_pb2.Value) -> None:
+        if self._assignments is None:
+            snapshot = api_operations.UpdateRunSnapshot()
+            self._assignments = (self._append_operation(snapshot), snapshot)
+        index, snapshot = self._assignments
+        # a later assignment of the same path replaces the earlier one, as it would on the server
+        snapshot.assign[path_to_str(path)] = value
+        self._last_index = index
+
+    def visit_assign_float(self, op: AssignFloat) -> None:
+        self._assign(op.path, common_pb2.Value(float64=op.value))
+
+    def visit_assign_int(self, op: AssignInt) -> None:
+        self._assign(op.path, common_pb2.Value(int64=op.value))
+
+    def visit_assign_bool(self, op: AssignBool) -> None:
+        self._assign(op.path, common_pb2.Value(bool=op.value))
+
+    def visit_assign_datetime(self, op: AssignDatetime) -> None:
+        self._assign(op.path, common_pb2.Value(timestamp=timestamp_pb2.Timestamp(seconds=int(op.value.timestamp()))))
+
+    def visit_assign_string(self, op: AssignString) -> None:
+        self._assign(op.path, common_pb2.Value(string=op.value))
+
+    def visit_log_floats(self, op: LogFloats) -> None:
+        path = path_to_str(op.path)
+        values = op.values
+        points: Iterable[Tuple[float, Optional[float], float]]
+        if isinstance(values, SeriesColumns):
+            points = zip(values.values, values.steps, values.timestamps)
+        else:
+            points = ((point.value, point.step, point.ts) for point in values)
+
+        for value, step, ts in points:
+            self._snapshot_to_append(path, step, ts).append[path] = common_pb2.Value(float64=value)
+
+    def visit_run_creation(self, op: RunCreation) -> None:
+        self._last_index = self._append_operation(api_operations.Run(op.created_at, op.custom_id))
+        self._open.clear()
+        self._assignments = None
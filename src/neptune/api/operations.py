@@ -23,16 +23,23 @@ __all__ = [
     "AssignBool",
     "AssignString",
     "AssignDatetime",
+    "UpdateRunSnapshot",
     "RunOperation",
 ]
 
 
 import abc
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    field,
+)
 from datetime import datetime
+from functools import lru_cache
 from typing import (
+    Dict,
     List,
     Optional,
+    Tuple,
 )
 
 import neptune_api.proto.neptune_pb.ingest.v1.common_pb2 as common_pb2
@@ -45,6 +52,9 @@ class Serializable(abc.ABC):
     def to_proto(self, run_op: "RunOperation") -> ingest_pb2.RunOperation:
         pass
 
+    def to_protos(self, run_op: "RunOperation") -> List[ingest_pb2.RunOperation]:
+        return [self.to_proto(run_op)]
+
 
 @dataclass
 class Run(Serializable):
@@ -77,23 +87,26 @@ class LogFloats(Serializable):
     items: List[FloatValue]
 
     def to_proto(self, run_op: "RunOperation") -> ingest_pb2.RunOperation:
-        first_item = self.items[0]
-
-        step = (
-            common_pb2.Step(whole=int(first_item.step), micro=int((first_item.step - int(first_item.step)) * 1e6))
-            if first_item.step is not None
-            else None
-        )
-
-        return ingest_pb2.RunOperation(
-            project=run_op.project,
-            run_id=run_op.run_id,
-            update=common_pb2.UpdateRunSnapshot(
-                step=step,
-                append={f"{self.path}": common_pb2.Value(float64=first_item.value)},
-                timestamp=timestamp_pb2.Timestamp(seconds=int(first_item.timestamp)),
-            ),
-        )
+        """Returns the update of the first point only; operations are sent with `to_protos`, covering every point."""
+        return self.to_protos(run_op)[0]
+
+    def to_protos(self, run_op: "RunOperation") -> List[ingest_pb2.RunOperation]:
+        # a snapshot holds one value per path, so every point becomes a separate update
+        template = _run_operation_template(run_op.project, run_op.run_id)
+        path = self.path
+        protos = []
+        for item in self.items:
+            proto = ingest_pb2.RunOperation()
+            proto.CopyFrom(template)
+            update = proto.update
+            if item.step is not None:
+                update.step.whole, update.step.micro = _split_step(item.step)
+            seconds = int(item.timestamp)
+            update.timestamp.seconds = seconds
+            update.timestamp.nanos = int((item.timestamp - seconds) * 1e9)
+            update.append[path].float64 = item.value
+            protos.append(proto)
+        return protos
 
 
 @dataclass
@@ -175,6 +188,53 @@ class AssignDatetime(Serializable):
         )
 
 
+@dataclass
+class UpdateRunSnapshot(Serializable):
+    """Assignments and appended series points that share a step, sent as a single update."""
+
+    step: Optional[float] = None
+    timestamp: Optional[float] = None
+    assign: Dict[str, common_pb2.Value] = field(default_factory=dict)
+    append: Dict[str, common_pb2.Value] = field(default_factory=dict)
+
+    def to_proto(self, run_op: "RunOperation") -> ingest_pb2.RunOperation:
+        proto = ingest_pb2.RunOperation()
+        proto.CopyFrom(_run_operation_template(run_op.project, run_op.run_id))
+        proto.update.CopyFrom(
+            common_pb2.UpdateRunSnapshot(
+                step=_step_to_proto(self.step),
+                timestamp=_timestamp_to_proto(self.timestamp),
+                assign=self.assign,
+                append=self.append,
+            )
+        )
+        return proto
+
+
+@lru_cache(maxsize=64)
+def _run_operation_template(project: str, run_id: str) -> ingest_pb2.RunOperation:
+    # copied, never modified
+    return ingest_pb2.RunOperation(project=project, run_id=run_id)
+
+
+def _split_step(step: float) -> Tuple[int, int]:
+    return divmod(round(step * 1_000_000), 1_000_000)
+
+
+def _step_to_proto(step: Optional[float]) -> Optional[common_pb2.Step]:
+    if step is None:
+        return None
+    whole, micro = _split_step(step)
+    return common_pb2.Step(whole=whole, micro=micro)
+
+
+def _timestamp_to_proto(timestamp: Optional[float]) -> Optional[timestamp_pb2.Timestamp]:
+    if timestamp is None:
+        return None
+    seconds = int(timestamp)
+    return timestamp_pb2.Timestamp(seconds=seconds, nanos=int((timestamp - seconds) * 1e9))
+
+
 @dataclass
 class RunOperation:
     project: str
@@ -183,3 +243,6 @@ class RunOperation:
 
     def to_proto(self) -> ingest_pb2.RunOperation:
         return self.operation.to_proto(run_op=self)
+
+    def to_protos(self) -> List[ingest_pb2.RunOperation]:
+        return self.operation.to_protos(run_op=self)
@@ -15,13 +15,23 @@
 #
 __all__ = ["get_single_page", "iter_over_pages"]
 
+import sys
+import time
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Deque,
     Dict,
     Generator,
     Iterable,
     Optional,
+    Tuple,
 )
 
 from bravado.exception import HTTPBadRequest  # type: ignore
@@ -65,25 +75,10 @@ SUPPORTED_ATTRIBUTE_TYPES = {item.value for item in FieldType}
 
 SORT_BY_COLUMN_TYPE: TypeAlias = Literal["string", "datetime", "integer", "boolean", "float"]
 
-
-class NoLimit(int):
-    def __gt__(self, other: Any) -> bool:
-        return True
-
-    def __lt__(self, other: Any) -> bool:
-        return False
-
-    def __ge__(self, other: Any) -> bool:
-        return True
-
-    def __le__(self, other: Any) -> bool:
-        return False
-
-    def __eq__(self, other: Any) -> bool:
-        return False
-
-    def __ne__(self, other: Any) -> bool:
-        return True
+MIN_TABLE_STEP_SIZE = 10
+MAX_TABLE_STEP_SIZE = 1000
+TABLE_PAGE_TARGET_LATENCY = 1.0
+TABLE_PAGE_MAX_FIELDS = 100_000
 
 
 def get_single_page(
@@ -163,6 +158,98 @@ def find_attribute(*, entry: LeaderboardEntry, path: str) -> Optional[Field]:
     return next((attr for attr in entry.fields if attr.path == path), None)
 
 
+class _StepSizeTuner:
+    """Adjusts the number of entries requested per page to the observed latency and size of responses.
+
+    Unless `adaptive`, the step size stays fixed. Otherwise, pages are sized so that fetching one takes about
+    `TABLE_PAGE_TARGET_LATENCY` seconds and it holds at most `TABLE_PAGE_MAX_FIELDS` fields. The step size
+    at most doubles or halves between consecutive pages.
+    """
+
+    def __init__(self, step_size: int, adaptive: bool) -> None:
+        self.step_size = step_size
+        self._adaptive = adaptive
+        self._max_step_size = max(MAX_TABLE_STEP_SIZE, step_size)
+
+    def update(self, page: LeaderboardEntriesSearchResult, latency: float) -> None:
+        entries = len(page.entries)
+        if not self._adaptive or entries == 0:
+            return
+
+        fields = sum(len(entry.fields) for entry in page.entries)
+
+        ideal = TABLE_PAGE_TARGET_LATENCY * entries / latency if latency > 0 else float("inf")
+        if fields > 0:
+            ideal = min(ideal, TABLE_PAGE_MAX_FIELDS * entries / fields)
+
+        ideal = min(max(ideal, self.step_size / 2, MIN_TABLE_STEP_SIZE), self.step_size * 2, self._max_step_size)
+        self.step_size = int(ideal)
+
+
+def _fetch_page(**kwargs: Any) -> Tuple[LeaderboardEntriesSearchResult, float]:
+    start = time.monotonic()
+    result = get_single_page(**kwargs)
+    return result, time.monotonic() - start
+
+
+def _iter_window(
+    *,
+    executor: Optional[ThreadPoolExecutor],
+    prefetch: int,
+    tuner: _StepSizeTuner,
+    first_page: LeaderboardEntriesSearchResult,
+    offset: int,
+    max_offset: int,
+    remaining: int,
+    **kwargs: Any,
+) -> Generator[LeaderboardEntriesSearchResult, None, None]:
+    """Yields pages of a single `searching_after` window in order, starting with the already fetched `first_page`,
+    which was requested with a limit of `offset` entries.
+
+    Page offsets within a window do not depend on the fetched entries, so up to `prefetch` pages are requested
+    ahead, as long as they are expected to hold entries according to the count reported by the first page.
+    """
+    expected = first_page.matching_item_count
+    remaining -= offset
+    pending: Deque[Future] = deque()
+
+    def submit() -> None:
+        nonlocal offset, remaining
+        page_limit = min(tuner.step_size, max_offset - offset, remaining)
+        if executor is None:
+            pending.append(_completed(_fetch_page, limit=page_limit, offset=offset, **kwargs))
+        else:
+            pending.append(executor.submit(_fetch_page, limit=page_limit, offset=offset, **kwargs))
+        offset += page_limit
+        remaining -= page_limit
+
+    yield first_page
+
+    try:
+        while True:
+            while (
+                offset < max_offset
+                and remaining > 0
+                and (not pending or (len(pending) < prefetch and offset <= expected))
+            ):
+                submit()
+            if not pending:
+                return
+
+            result, latency = pending.popleft().result()
+            tuner.update(result, latency)
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _completed(fn: Callable[..., Any], **kwargs: Any) -> Future:
+    future: Future = Future()
+    future.set_result(fn(**kwargs))
+    return future
+
+
 def iter_over_pages(
     *,
     step_size: int,
@@ -172,77 +259,83 @@ def iter_over_pages(
     ascending: bool,
     progress_bar: Optional[ProgressBarType],
     max_offset: int = MAX_SERVER_OFFSET,
+    prefetch: int = 1,
+    adaptive_step_size: bool = False,
     **kwargs: Any,
 ) -> Generator[Any, None, None]:
+    """Yields entries page by page, continuing with `searching_after` the last entry every `max_offset` entries.
+
+    With `prefetch` greater than 1, that many page requests are kept in flight on a thread pool, which also
+    decodes the responses. With `adaptive_step_size`, `step_size` is only the size of the first page.
+    """
+    limit = limit if limit is not None else sys.maxsize
+    tuner = _StepSizeTuner(step_size, adaptive=adaptive_step_size)
+    page_kwargs = dict(sort_by=sort_by, sort_by_column_type=sort_by_column_type, ascending=ascending, **kwargs)
+
     searching_after = None
-    last_page = None
-
-    data = get_single_page(
-        limit=0,
-        offset=0,
-        sort_by=sort_by,
-        ascending=ascending,
-        sort_by_column_type=sort_by_column_type,
-        searching_after=None,
-        **kwargs,
+    extracted_records = 0
+    field_to_value_visitor = FieldToValueVisitor()
+    executor = (
+        ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="NeptuneFetchTable") if prefetch > 1 else None
     )
-    total = data.matching_item_count
 
-    limit = limit if limit is not None else NoLimit()
+    try:
+        # the first page also reports the number of matching entries
+        first_limit = min(tuner.step_size, max_offset, limit)
+        first_page, latency = _fetch_page(limit=first_limit, offset=0, searching_after=None, **page_kwargs)
+        tuner.update(first_page, latency)
+        total = min(first_page.matching_item_count, limit)
+
+        progress_bar = False if total <= step_size else progress_bar  # disable progress bar if only one page is fetched
+
+        with construct_progress_bar(progress_bar, "Fetching table...") as bar:
+            # beginning of the first page
+            bar.update(
+                by=0,
+                total=total,
+            )
 
-    total = total if total < limit else limit
+            while True:
+                for result in _iter_window(
+                    executor=executor,
+                    prefetch=prefetch,
+                    tuner=tuner,
+                    first_page=first_page,
+                    offset=first_limit,
+                    max_offset=max_offset,
+                    remaining=limit - extracted_records,
+                    searching_after=searching_after,
+                    **page_kwargs,
+                ):
+                    page = result.entries
+                    extracted_records += len(page)
+                    bar.update(by=len(page), total=total)
 
-    progress_bar = False if total <= step_size else progress_bar  # disable progress bar if only one page is fetched
+                    if not page:
+                        return
 
-    extracted_records = 0
+                    yield from page
 
-    field_to_value_visitor = FieldToValueVisitor()
+                    if extracted_records == limit:
+                        return
 
-    with construct_progress_bar(progress_bar, "Fetching table...") as bar:
-        # beginning of the first page
-        bar.update(
-            by=0,
-            total=total,
-        )
+                    last_page = page
 
-        while True:
-            if last_page:
                 searching_after_field = find_attribute(entry=last_page[-1], path=sort_by)
                 if not searching_after_field:
                     raise ValueError(f"Cannot find attribute {sort_by} in last page")
                 searching_after = field_to_value_visitor.visit(searching_after_field)
 
-            for offset in range(0, max_offset, step_size):
-                local_limit = min(step_size, max_offset - offset)
-                if extracted_records + local_limit > limit:
-                    local_limit = limit - extracted_records
-
-                result = get_single_page(
-                    limit=local_limit,
-                    offset=offset,
-                    sort_by=sort_by,
-                    sort_by_column_type=sort_by_column_type,
+                # the first page of every window reports the number of entries after `searching_after`
+                first_limit = min(tuner.step_size, max_offset, limit - extracted_records)
+                first_page, latency = _fetch_page(
+                    limit=first_limit,
+                    offset=0,
                     searching_after=searching_after,
-                    ascending=ascending,
-                    **kwargs,
+                    **page_kwargs,
                 )
-
-                # fetch the item count everytime a new page is started (except for the very fist page)
-                if offset == 0 and last_page is not None:
-                    total += result.matching_item_count
-
-                total = min(total, limit)
-
-                page = result.entries
-                extracted_records += len(page)
-                bar.update(by=len(page), total=total)
-
-                if not page:
-                    return
-
-                yield from page
-
-                if extracted_records == limit:
-                    return
-
-                last_page = page
+                tuner.update(first_page, latency)
+                total = min(extracted_records + first_page.matching_item_count, limit)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,207 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SeriesCache", "get_series_cache"]
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+)
+
+from neptune.api.fetching_series_values import (
+    SeriesArrays,
+    fetch_series_values_after,
+    fetch_series_values_as_arrays,
+    points_to_arrays,
+)
+from neptune.constants import (
+    NEPTUNE_DATA_DIRECTORY,
+    SERIES_CACHE_DIRECTORY,
+)
+from neptune.envs import (
+    NEPTUNE_SERIES_CACHE,
+    NEPTUNE_SERIES_CACHE_MAX_SIZE,
+)
+from neptune.internal.utils.logger import get_logger
+from neptune.typing import ProgressBarType
+
+logger = get_logger()
+
+CACHE_FORMAT_VERSION = 2
+DEFAULT_MAX_SIZE_BYTES = 1024**3
+
+
+class SeriesCache:
+    """Fetched series values stored on disk as NumPy arrays, keyed by project, object and attribute path.
+
+    A cached series is extended by fetching only the points after its last cached step. It is fetched anew
+    when the series on the server has fewer points than the cache, or starts at a different step, which means
+    it was cleared in the meantime. Least recently used series are evicted once the cache exceeds `max_size` bytes.
+
+    Values of string series are stored as one buffer of UTF-8 bytes with the offset of every value, so that
+    a few long values do not make every value take as much space, and values are cached exactly as fetched.
+    """
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE_BYTES) -> None:
+        self._directory = directory
+        self._max_size = max_size
+
+    def path_for(self, key: Sequence[str]) -> Path:
+        digest = hashlib.sha256("|".join([str(CACHE_FORMAT_VERSION), *key]).encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.npz"
+
+    def fetch(
+        self,
+        key: Sequence[str],
+        getter: Callable[..., Any],
+        path: str,
+        step_size: int = 1000,
+        progress_bar: Optional[ProgressBarType] = None,
+        max_workers: int = 1,
+    ) -> SeriesArrays:
+        cache_path = self.path_for(key)
+        cached = self._read(cache_path)
+
+        if cached is not None:
+            updated = self._update(cached, getter, step_size)
+            if updated is cached:
+                self._touch(cache_path)
+                return cached
+            if updated is not None:
+                self._write(cache_path, updated)
+                return updated
+            logger.debug("Series %s was reset since it was cached, fetching it again", path)
+
+        arrays = fetch_series_values_as_arrays(getter, path, step_size, progress_bar, max_workers)
+        if len(arrays.steps) > 0:
+            self._write(cache_path, arrays)
+        return arrays
+
+    @staticmethod
+    def _update(cached: SeriesArrays, getter: Callable[..., Any], step_size: int) -> Optional[SeriesArrays]:
+        """Returns `cached` if it is up to date, the extended series, or None if the cache is no longer valid."""
+        import numpy as np
+
+        first_batch = getter(from_step=None, limit=1)
+        cached_count = len(cached.steps)
+        if first_batch.total < cached_count or not first_batch.values or first_batch.values[0].step != cached.steps[0]:
+            return None
+        if first_batch.total == cached_count:
+            return cached
+
+        new_points = fetch_series_values_after(getter, float(cached.steps[-1]), step_size)
+        if cached_count + len(new_points) != first_batch.total:
+            return None
+
+        new_arrays = points_to_arrays(new_points)
+        return SeriesArrays(
+            steps=np.concatenate([cached.steps, new_arrays.steps]),
+            values=np.concatenate([cached.values, new_arrays.values]),
+            timestamps=np.concatenate([cached.timestamps, new_arrays.timestamps]),
+        )
+
+    @staticmethod
+    def _read(path: Path) -> Optional[SeriesArrays]:
+        import numpy as np
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if "values" in data:
+                    values = data["values"]
+                else:
+                    buffer = data["value_bytes"].tobytes()
+                    offsets = data["value_offsets"].tolist()
+                    values = np.array(
+                        [buffer[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])], dtype=object
+                    )
+                return SeriesArrays(steps=data["steps"], values=values, timestamps=data["timestamps"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, path: Path, arrays: SeriesArrays) -> None:
+        import numpy as np
+
+        values: Dict[str, Any]
+        if arrays.values.dtype.kind == "f":
+            values = {"values": arrays.values}
+        else:
+            encoded = [str(value).encode("utf-8") for value in arrays.values]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(value) for value in encoded], out=offsets[1:])
+            values = {
+                "value_bytes": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+                "value_offsets": offsets,
+            }
+
+        # written to a temporary file first, so concurrent processes never read a partial series
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=path.stem, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    np.savez(file, steps=arrays.steps, timestamps=arrays.timestamps, **values)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Could not cache series values in %s: %s", self._directory, e)
+            return
+
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        entries = []
+        for entry in self._directory.glob("*.npz"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry in sorted(entries, key=lambda item: item[0]):
+            if size <= self._max_size:
+                break
+            if entry == keep:
+                continue
+            try:
+                entry.unlink()
+                size -= entry_size
+            except OSError:
+                pass
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+def get_series_cache() -> Optional[SeriesCache]:
+    """Returns the series cache if enabled with `NEPTUNE_SERIES_CACHE`."""
+    if os.getenv(NEPTUNE_SERIES_CACHE, "False").lower() not in ("true", "t", "1"):
+        return None
+
+    max_size = int(os.getenv(NEPTUNE_SERIES_CACHE_MAX_SIZE) or DEFAULT_MAX_SIZE_BYTES)
+    return SeriesCache(Path(NEPTUNE_DATA_DIRECTORY) / SERIES_CACHE_DIRECTORY, max_size=max_size)
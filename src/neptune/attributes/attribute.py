@@ -42,7 +42,10 @@ class Attribute:
         raise TypeDoesNotSupportAttributeException(type_=type(self), attribute=attr)
 
     def _enqueue_operation(self, operation: Operation, *, wait: bool):
-        self._container._op_processor.enqueue_operation(operation, wait=wait)
+        self._container._enqueue_operation(operation, wait=wait)
+
+    def _enqueue_operations(self, operations: List[Operation], *, wait: bool):
+        self._container._enqueue_operations(operations, wait=wait)
 
     @property
     def _backend(self) -> NeptuneBackend:
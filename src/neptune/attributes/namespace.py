@@ -88,8 +88,9 @@ class Namespace(Attribute, MutableMapping):
     ) -> None:
         if not isinstance(value, NamespaceVal):
             value = NamespaceVal(value)
-        for k, v in value.value.items():
-            self._container[f"{self._str_path}/{k}"].extend(v, steps=steps, timestamps=timestamps, wait=wait, **kwargs)
+        with self._container._batch_operations(wait=wait):
+            for k, v in value.value.items():
+                self._container[f"{self._str_path}/{k}"].extend(v, steps=steps, timestamps=timestamps, **kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
         result = {}
@@ -106,8 +107,9 @@ class Namespace(Attribute, MutableMapping):
         elif not isinstance(value, NamespaceVal):
             value = NamespaceVal(value)
 
-        for k, v in value.value.items():
-            self._container[f"{self._str_path}/{k}"].assign(v, wait=wait)
+        with self._container._batch_operations(wait=wait):
+            for k, v in value.value.items():
+                self._container[f"{self._str_path}/{k}"].assign(v)
 
     def _collect_atom_values(self, attribute_dict) -> dict:
         result = {}
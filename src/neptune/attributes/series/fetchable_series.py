@@ -16,53 +16,82 @@
 __all__ = ["FetchableSeries"]
 
 import abc
-from datetime import datetime
+import os
 from typing import (
-    Dict,
     Generic,
     Optional,
+    Tuple,
     TypeVar,
-    Union,
 )
 
-from neptune.api.fetching_series_values import fetch_series_values
+from neptune.api.fetching_series_values import (
+    SeriesArrays,
+    fetch_series_values_as_arrays,
+)
 from neptune.api.models import (
     FloatPointValue,
     StringPointValue,
 )
+from neptune.envs import (
+    NEPTUNE_FETCH_SERIES_MAX_WORKERS,
+    NEPTUNE_FETCH_SERIES_STEP_SIZE,
+)
 from neptune.internal.utils.paths import path_to_str
 from neptune.typing import ProgressBarType
 
 Row = TypeVar("Row", StringPointValue, FloatPointValue)
 
 
-def make_row(entry: Row, include_timestamp: bool = True) -> Dict[str, Union[str, float, datetime]]:
-    row: Dict[str, Union[str, float, datetime]] = {
-        "step": entry.step,
-        "value": entry.value,
-    }
-
-    if include_timestamp:
-        row["timestamp"] = entry.timestamp
-
-    return row
-
-
 class FetchableSeries(Generic[Row]):
     @abc.abstractmethod
     def _fetch_values_from_backend(self, limit: int, from_step: Optional[float] = None) -> Row: ...
 
     def fetch_values(self, *, include_timestamp: bool = True, progress_bar: Optional[ProgressBarType] = None):
-        import pandas as pd
+        from neptune.api.series_cache import get_series_cache
 
         path = path_to_str(self._path) if hasattr(self, "_path") else ""
-        data = fetch_series_values(
-            getter=self._fetch_values_from_backend,
-            path=path,
-            progress_bar=progress_bar,
+        step_size = int(os.getenv(NEPTUNE_FETCH_SERIES_STEP_SIZE, "1000"))
+        max_workers = int(os.getenv(NEPTUNE_FETCH_SERIES_MAX_WORKERS, "4"))
+
+        series_cache = get_series_cache()
+        if series_cache is not None:
+            arrays = series_cache.fetch(
+                key=self._series_cache_key(path),
+                getter=self._fetch_values_from_backend,
+                path=path,
+                step_size=step_size,
+                progress_bar=progress_bar,
+                max_workers=max_workers,
+            )
+        else:
+            arrays = fetch_series_values_as_arrays(
+                getter=self._fetch_values_from_backend,
+                path=path,
+                step_size=step_size,
+                progress_bar=progress_bar,
+                max_workers=max_workers,
+            )
+
+        return _arrays_to_data_frame(arrays, include_timestamp=include_timestamp)
+
+    def _series_cache_key(self, path: str) -> Tuple[str, ...]:
+        container = self._container
+        return (
+            str(getattr(container, "_project_id", "")),
+            container.container_type.value,
+            str(self._container_id),
+            path,
         )
 
-        rows = dict((n, make_row(entry=entry, include_timestamp=include_timestamp)) for (n, entry) in enumerate(data))
 
-        df = pd.DataFrame.from_dict(data=rows, orient="index")
-        return df
+def _arrays_to_data_frame(arrays: SeriesArrays, include_timestamp: bool):
+    import pandas as pd
+
+    if len(arrays.steps) == 0:
+        return pd.DataFrame.from_dict(data={}, orient="index")
+
+    columns = {"step": arrays.steps, "value": arrays.values}
+    if include_timestamp:
+        columns["timestamp"] = pd.to_datetime(arrays.timestamps, utc=True)
+
+    return pd.DataFrame(columns)
@@ -15,8 +15,10 @@
 #
 __all__ = ["FloatSeries"]
 
+import time
 from typing import (
     Iterable,
+    List,
     Optional,
     Union,
 )
@@ -40,7 +42,7 @@ LogOperation = LogFloats
 
 
 class FloatSeries(
-    Series[Val, Data, LogOperation], FetchableSeries[FloatSeriesValues], max_batch_size=1, operation_cls=LogOperation
+    Series[Val, Data, LogOperation], FetchableSeries[FloatSeriesValues], max_batch_size=1000, operation_cls=LogOperation
 ):
     def configure(
         self,
@@ -55,6 +57,25 @@ class FloatSeries(
         with self._container.lock():
             self._enqueue_operation(ConfigFloatSeries(self._path, min, max, unit), wait=wait)
 
+    def append_float(self, value: Data, step: float, timestamp: Optional[float] = None, wait: bool = False) -> None:
+        """Appends a single number, building its operation directly instead of going through a `FloatSeries` value."""
+        if not FloatSeriesVal.is_unsupported_float_with_warn(value):
+            return
+        op = LogOperation.from_columns(
+            self._path, [float(value)], [step], [time.time() if timestamp is None else timestamp]
+        )
+        with self._container.lock():
+            self._enqueue_operation(op, wait=wait)
+
+    def _get_log_operations_from_value(self, value: Val) -> List[LogOperation]:
+        values, steps, timestamps, size = value.values, value.steps, value.timestamps, self.max_batch_size
+        return [
+            LogOperation.from_columns(
+                self._path, values[start : start + size], steps[start : start + size], timestamps[start : start + size]
+            )
+            for start in range(0, len(values), size)
+        ]
+
     def _get_clear_operation(self) -> Operation:
         return ClearFloatLog(self._path)
 
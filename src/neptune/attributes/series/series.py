@@ -31,6 +31,7 @@ from neptune.internal.operation import LogOperation
 from neptune.internal.types.stringify_value import StringifyValue
 from neptune.internal.utils import (
     is_collection,
+    is_numeric_array,
     is_stringify_value,
     verify_collection_type,
     verify_type,
@@ -86,16 +87,12 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
             value = self._data_to_value(value)
         clear_op = self._get_clear_operation()
         config_op = self._get_config_operation_from_value(value)
+        ops = [config_op] if config_op else []
+        ops.append(clear_op)
+        if value.values:
+            ops.extend(self._get_log_operations_from_value(value))
         with self._container.lock():
-            if config_op:
-                self._enqueue_operation(config_op, wait=False)
-            if not value.values:
-                self._enqueue_operation(clear_op, wait=wait)
-            else:
-                self._enqueue_operation(clear_op, wait=False)
-                ops = self._get_log_operations_from_value(value)
-                for op in ops:
-                    self._enqueue_operation(op, wait=wait)
+            self._enqueue_operations(ops, wait=wait)
 
     def log(
         self,
@@ -128,8 +125,7 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         ops = self._get_log_operations_from_value(value)
 
         with self._container.lock():
-            for op in ops:
-                self._enqueue_operation(op, wait=wait)
+            self._enqueue_operations(ops, wait=wait)
 
     def extend(
         self,
@@ -143,12 +139,14 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
             values = self._handle_stringified_value(values)
 
         if steps is not None:
-            verify_collection_type("steps", steps, (float, int))
+            if not is_numeric_array(steps):
+                verify_collection_type("steps", steps, (float, int))
             if len(steps) != len(values):
                 raise ValueError(f"Number of steps must be equal to number of values ({len(steps)} != {len(values)}")
 
         if timestamps is not None:
-            verify_collection_type("timestamps", timestamps, (float, int))
+            if not is_numeric_array(timestamps):
+                verify_collection_type("timestamps", timestamps, (float, int))
             if len(timestamps) != len(values):
                 raise ValueError(
                     f"Number of timestamps must be equal to number of values ({len(timestamps)} != {len(values)}"
@@ -158,8 +156,7 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         ops = self._get_log_operations_from_value(value)
 
         with self._container.lock():
-            for op in ops:
-                self._enqueue_operation(op, wait=wait)
+            self._enqueue_operations(ops, wait=wait)
 
     def _clear_impl(self, wait: bool = False) -> None:
         op = self._get_clear_operation()
@@ -30,10 +30,14 @@ from neptune.cli.containers import (
     ExecutionDirectory,
     OfflineContainer,
 )
+from neptune.cli.lookup import (
+    get_container_lookup_cache,
+    get_metadata_containers,
+)
 from neptune.cli.utils import (
     detect_async_dir,
     detect_offline_dir,
-    get_metadata_container,
+    get_recorded_project,
     is_single_execution_dir_synced,
 )
 from neptune.constants import (
@@ -85,9 +89,18 @@ def collect_containers(*, path: Path, backend: "NeptuneBackend") -> CollectedCon
 
 def collect_async_containers(*, path: Path, backend: "NeptuneBackend") -> Iterable[AsyncContainer]:
     container_to_execution_dirs = collect_by_container(base_path=path / ASYNC_DIRECTORY, detect_by=detect_async_dir)
+    projects = {
+        key: get_recorded_project(execution_dirs) for key, execution_dirs in container_to_execution_dirs.items()
+    }
+    experiments = get_metadata_containers(
+        backend=backend,
+        keys=container_to_execution_dirs.keys(),
+        projects={key: project for key, project in projects.items() if project is not None},
+        cache=get_container_lookup_cache(path),
+    )
 
     for (container_type, container_id), execution_dirs in container_to_execution_dirs.items():
-        experiment = get_metadata_container(backend=backend, container_type=container_type, container_id=container_id)
+        experiment = experiments[(container_type, container_id)]
         found = experiment is not None
 
         yield AsyncContainer(
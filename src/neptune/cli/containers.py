@@ -38,11 +38,18 @@ from typing import (
     Optional,
 )
 
+from neptune.cli.pipeline import (
+    AdaptiveBatchSize,
+    BatchReader,
+)
 from neptune.cli.utils import get_qualified_name
 from neptune.constants import ASYNC_DIRECTORY
 from neptune.core.components.operation_storage import OperationStorage
 from neptune.core.components.queue.disk_queue import DiskQueue
-from neptune.envs import NEPTUNE_SYNC_BATCH_TIMEOUT_ENV
+from neptune.envs import (
+    NEPTUNE_SYNC_BATCH_TIMEOUT_ENV,
+    NEPTUNE_SYNC_READ_AHEAD_BATCHES,
+)
 from neptune.internal.container_type import ContainerType
 from neptune.internal.exceptions import NeptuneConnectionLostException
 from neptune.internal.id_formats import UniqueId
@@ -52,6 +59,7 @@ from neptune.internal.utils.logger import get_logger
 from neptune.objects.structure_version import StructureVersion
 
 if TYPE_CHECKING:
+    from neptune.cli.progress import SyncProgress
     from neptune.internal.backends.api_model import (
         ApiExperiment,
         Project,
@@ -61,6 +69,7 @@ if TYPE_CHECKING:
 
 logger = get_logger(with_prefix=False)
 retries_timeout = int(os.getenv(NEPTUNE_SYNC_BATCH_TIMEOUT_ENV, "3600"))
+read_ahead = int(os.getenv(NEPTUNE_SYNC_READ_AHEAD_BATCHES, "2"))
 
 
 class ExecutionDirectory:
@@ -90,9 +99,18 @@ class ExecutionDirectory:
         if self.path.exists():
             remove_directory_structure(self.path)
 
-    def sync(self, *, backend: "NeptuneBackend", container_id: UniqueId, container_type: ContainerType) -> None:
+    def sync(
+        self,
+        *,
+        backend: "NeptuneBackend",
+        container_id: UniqueId,
+        container_type: ContainerType,
+        progress: Optional["SyncProgress"] = None,
+    ) -> None:
         operation_storage = OperationStorage(self.path)
         serializer: Callable[[Operation], Dict[str, Any]] = lambda op: op.to_dict()
+        batch_size = AdaptiveBatchSize()
+        queue_lock = threading.Lock()
 
         with DiskQueue(
             data_path=self.path,
@@ -100,38 +118,47 @@ class ExecutionDirectory:
             from_dict=Operation.from_dict,
             lock=threading.RLock(),
         ) as disk_queue:
-            while True:
-                raw_batch = disk_queue.get_batch(1000)
-                if not raw_batch:
-                    break
-                version = raw_batch[-1].ver
-                batch = [element.obj for element in raw_batch]
-
-                start_time = time.monotonic()
-                expected_count = len(batch)
-                version_to_ack = version - expected_count
-                while True:
-                    try:
-                        processed_count, _ = backend.execute_operations(
-                            container_id=container_id,
-                            container_type=container_type,
-                            operations=batch,
-                            operation_storage=operation_storage,
-                        )
-                        version_to_ack += processed_count
-                        batch = batch[processed_count:]
-                        disk_queue.ack(version)
-                        if version_to_ack == version:
-                            break
-                    except NeptuneConnectionLostException as ex:
-                        if time.monotonic() - start_time > retries_timeout:
-                            raise ex
-                        logger.warning(
-                            "Experiencing connection interruptions."
-                            " Will try to reestablish communication with Neptune."
-                            " Internal exception was: %s",
-                            ex.cause.__class__.__name__,
-                        )
+            if progress is not None:
+                progress.add_pending(disk_queue.size())
+
+            with BatchReader(disk_queue, batch_size=batch_size, lock=queue_lock, read_ahead=read_ahead) as reader:
+                for batch in reader:
+                    version = batch.version
+                    operations = batch.operations
+
+                    start_time = time.monotonic()
+                    version_to_ack = version - len(operations)
+                    while True:
+                        try:
+                            request_start = time.monotonic()
+                            processed_count, _ = backend.execute_operations(
+                                container_id=container_id,
+                                container_type=container_type,
+                                operations=operations,
+                                operation_storage=operation_storage,
+                            )
+                            batch_size.record(
+                                count=len(operations),
+                                size_bytes=batch.size_bytes,
+                                latency=time.monotonic() - request_start,
+                            )
+                            version_to_ack += processed_count
+                            operations = operations[processed_count:]
+                            with queue_lock:
+                                disk_queue.ack(version_to_ack)
+                            if progress is not None:
+                                progress.advance(processed_count)
+                            if version_to_ack == version:
+                                break
+                        except NeptuneConnectionLostException as ex:
+                            if time.monotonic() - start_time > retries_timeout:
+                                raise ex
+                            logger.warning(
+                                "Experiencing connection interruptions."
+                                " Will try to reestablish communication with Neptune."
+                                " Internal exception was: %s",
+                                ex.cause.__class__.__name__,
+                            )
 
     def move(self, *, base_path: Path, target_container_id: UniqueId, container_type: ContainerType) -> None:
         new_online_dir = get_container_dir(container_id=target_container_id, container_type=container_type)
@@ -160,7 +187,14 @@ class Container(ABC):
         return all(map(lambda execution_dir: execution_dir.synced, self.execution_dirs))
 
     @abstractmethod
-    def sync(self, *, base_path: Path, backend: "NeptuneBackend", project: Optional["Project"] = None) -> None: ...
+    def sync(
+        self,
+        *,
+        base_path: Path,
+        backend: "NeptuneBackend",
+        project: Optional["Project"] = None,
+        progress: Optional["SyncProgress"] = None,
+    ) -> None: ...
 
     def clear(self) -> None:
         for execution_dir in self.execution_dirs:
@@ -207,7 +241,14 @@ class AsyncContainer(Container):
     def experiment(self) -> Optional["ApiExperiment"]:
         return self._experiment
 
-    def sync(self, *, base_path: Path, backend: "NeptuneBackend", project: Optional["Project"] = None) -> None:
+    def sync(
+        self,
+        *,
+        base_path: Path,
+        backend: "NeptuneBackend",
+        project: Optional["Project"] = None,
+        progress: Optional["SyncProgress"] = None,
+    ) -> None:
         assert self.experiment is not None  # mypy fix
 
         qualified_container_name = get_qualified_name(self.experiment)
@@ -219,6 +260,7 @@ class AsyncContainer(Container):
                     backend=backend,
                     container_id=self.container_id,
                     container_type=self.container_type,
+                    progress=progress,
                 )
 
         self.clear()
@@ -254,7 +296,14 @@ class OfflineContainer(Container):
     def found(self) -> bool:
         return self._found
 
-    def sync(self, *, base_path: Path, backend: "NeptuneBackend", project: Optional["Project"] = None) -> None:
+    def sync(
+        self,
+        *,
+        base_path: Path,
+        backend: "NeptuneBackend",
+        project: Optional["Project"] = None,
+        progress: Optional["SyncProgress"] = None,
+    ) -> None:
         assert project is not None  # mypy fix
 
         experiment = register_offline_container(
@@ -284,6 +333,7 @@ class OfflineContainer(Container):
                 backend=backend,
                 container_id=self.container_id,
                 container_type=self.container_type,
+                progress=progress,
             )
 
         self.clear()
@@ -0,0 +1,308 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["ContainerLookupCache", "get_container_lookup_cache", "get_metadata_containers"]
+
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from neptune.constants import CONTAINER_LOOKUP_CACHE_FILE
+from neptune.envs import NEPTUNE_CONTAINER_LOOKUP_CACHE_TTL
+from neptune.exceptions import MetadataContainerNotFound
+from neptune.internal.backends.api_model import ApiExperiment
+from neptune.internal.backends.nql import (
+    NQLAggregator,
+    NQLAttributeOperator,
+    NQLAttributeType,
+    NQLQueryAggregate,
+    NQLQueryAttribute,
+)
+from neptune.internal.container_type import ContainerType
+from neptune.internal.exceptions import NeptuneException
+from neptune.internal.id_formats import (
+    QualifiedName,
+    SysId,
+    UniqueId,
+)
+from neptune.internal.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from neptune.api.models import (
+        Field,
+        LeaderboardEntry,
+    )
+    from neptune.internal.backends.api_model import Project
+    from neptune.internal.backends.neptune_backend import NeptuneBackend
+
+logger = get_logger(with_prefix=False)
+
+ContainerKey = Tuple[ContainerType, UniqueId]
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_TTL_SECONDS = 600
+LOOKUP_CHUNK_SIZE = 50
+LOOKUP_MAX_WORKERS = 16
+LOOKUP_COLUMNS = ["sys/id", "sys/custom_run_id", "sys/trashed"]
+
+
+class ContainerLookupCache:
+    """Results of looking up containers on the server, stored in a JSON file and valid for `ttl` seconds.
+
+    Both found containers and containers the server reported as not existing are cached, so that repeated
+    `neptune status`, `sync` and `clear` invocations do not query them again.
+    """
+
+    def __init__(self, path: Path, ttl: float = DEFAULT_CACHE_TTL_SECONDS) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._entries: Dict[str, Dict] = self._read()
+        self._modified = False
+
+    def get(self, key: ContainerKey) -> Tuple[bool, Optional[ApiExperiment]]:
+        """Returns whether `key` is cached and the cached container, None if it does not exist."""
+        entry = self._entries.get(_cache_key(key))
+        if entry is None or entry["expires"] < time.time():
+            return False, None
+
+        experiment = entry["experiment"]
+        if experiment is None:
+            return True, None
+        return True, ApiExperiment(**{**experiment, "type": ContainerType(experiment["type"])})
+
+    def put(self, key: ContainerKey, experiment: Optional[ApiExperiment]) -> None:
+        self._entries[_cache_key(key)] = {
+            "expires": time.time() + self._ttl,
+            "experiment": None if experiment is None else {**asdict(experiment), "type": experiment.type.value},
+        }
+        self._modified = True
+
+    def save(self) -> None:
+        if not self._modified:
+            return
+
+        now = time.time()
+        entries = {key: entry for key, entry in self._entries.items() if entry["expires"] >= now}
+
+        # written to a temporary file first, so concurrent processes never read a partial cache
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._path.parent, prefix=self._path.stem, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as file:
+                    json.dump({"version": CACHE_FORMAT_VERSION, "entries": entries}, file)
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Could not cache looked up containers in %s: %s", self._path, e)
+            return
+
+        self._modified = False
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self._path, "r") as file:
+                data = json.load(file)
+            if data.get("version") == CACHE_FORMAT_VERSION:
+                return dict(data["entries"])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+
+def get_container_lookup_cache(path: Path) -> Optional[ContainerLookupCache]:
+    """Returns the lookup cache of containers in the `path` data directory, unless disabled with a TTL of 0."""
+    ttl = float(os.getenv(NEPTUNE_CONTAINER_LOOKUP_CACHE_TTL) or DEFAULT_CACHE_TTL_SECONDS)
+    if ttl <= 0:
+        return None
+    return ContainerLookupCache(path / CONTAINER_LOOKUP_CACHE_FILE, ttl=ttl)
+
+
+def get_metadata_containers(
+    backend: "NeptuneBackend",
+    keys: Iterable[ContainerKey],
+    projects: Optional[Mapping[ContainerKey, str]] = None,
+    cache: Optional[ContainerLookupCache] = None,
+    max_workers: int = LOOKUP_MAX_WORKERS,
+) -> Dict[ContainerKey, Optional[ApiExperiment]]:
+    """Looks up containers on the server, returning None for the ones that do not exist.
+
+    Custom run ids are unique only within a project, so containers are searched in bulk only in the projects
+    they were created in, as given by `projects`, with chunked queries issued concurrently.
+    The remaining ones are looked up one by one, also concurrently.
+    """
+    projects = projects or {}
+    results: Dict[ContainerKey, Optional[ApiExperiment]] = {}
+    pending: List[ContainerKey] = []
+    for key in keys:
+        cached, experiment = cache.get(key) if cache is not None else (False, None)
+        if cached:
+            results[key] = experiment
+        else:
+            pending.append(key)
+
+    by_project: Dict[str, List[ContainerKey]] = {}
+    for key in pending:
+        if key in projects:
+            by_project.setdefault(projects[key], []).append(key)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for project_name, project_keys in by_project.items():
+            found = _search_project(executor, backend, project_name, project_keys)
+            _record(results, cache, found)
+            pending = [key for key in pending if key not in found]
+
+        outcomes = executor.map(lambda key: _get_metadata_container(backend, key), pending)
+        found = {}
+        for (container_type, container_id), outcome in zip(pending, outcomes):
+            if isinstance(outcome, ApiExperiment):
+                found[(container_type, container_id)] = outcome
+                continue
+
+            results[(container_type, container_id)] = None
+            if isinstance(outcome, MetadataContainerNotFound):
+                logger.warning("Can't fetch %s %s. Skipping.", container_type, container_id)
+                if cache is not None:
+                    cache.put((container_type, container_id), None)
+            else:
+                logger.warning("Exception while fetching %s %s. Skipping.", container_type, container_id)
+                logger.exception(outcome)
+
+        _record(results, cache, found)
+
+    if cache is not None:
+        cache.save()
+
+    return results
+
+
+def _search_project(
+    executor: ThreadPoolExecutor, backend: "NeptuneBackend", project_name: str, keys: Sequence[ContainerKey]
+) -> Dict[ContainerKey, ApiExperiment]:
+    try:
+        project = backend.get_project(QualifiedName(project_name))
+    except NeptuneException as e:
+        logger.debug("Could not search containers in project %s: %s", project_name, e)
+        return {}
+
+    chunks: List[Tuple[ContainerType, List[UniqueId]]] = []
+    for container_type in dict.fromkeys(container_type for container_type, _ in keys):
+        ids = [container_id for key_type, container_id in keys if key_type == container_type]
+        chunks += [(container_type, ids[i : i + LOOKUP_CHUNK_SIZE]) for i in range(0, len(ids), LOOKUP_CHUNK_SIZE)]
+
+    found: Dict[ContainerKey, ApiExperiment] = {}
+    pages = executor.map(lambda chunk: _search_chunk(backend, project, *chunk), chunks)
+    for (container_type, ids), entries in zip(chunks, pages):
+        requested = set(ids)
+        for entry in entries:
+            fields = {field.path: field for field in entry.fields}
+            experiment = _to_api_experiment(entry, fields, container_type, project)
+            if experiment is None:
+                # left to the lookup of the container alone
+                continue
+            # containers are stored under their custom run id, or the object id by older clients
+            for container_id in (getattr(fields.get("sys/custom_run_id"), "value", None), entry.object_id):
+                if container_id in requested:
+                    found[(container_type, UniqueId(container_id))] = experiment
+
+    return found
+
+
+def _search_chunk(
+    backend: "NeptuneBackend", project: "Project", container_type: ContainerType, ids: List[UniqueId]
+) -> List["LeaderboardEntry"]:
+    query = NQLQueryAggregate(
+        items=[
+            NQLQueryAttribute(
+                name="sys/custom_run_id",
+                type=NQLAttributeType.STRING,
+                operator=NQLAttributeOperator.EQUALS,
+                value=container_id,
+            )
+            for container_id in ids
+        ],
+        aggregator=NQLAggregator.OR,
+    )
+    try:
+        return list(
+            backend.search_leaderboard_entries(
+                project_id=project.id,
+                types=[container_type],
+                query=query,
+                columns=LOOKUP_COLUMNS,
+                limit=len(ids),
+                progress_bar=False,
+            )
+        )
+    except NeptuneException as e:
+        logger.debug("Could not search containers in project %s/%s: %s", project.workspace, project.name, e)
+        return []
+
+
+def _get_metadata_container(backend: "NeptuneBackend", key: ContainerKey) -> Union[ApiExperiment, NeptuneException]:
+    container_type, container_id = key
+    try:
+        return backend.get_metadata_container(container_id=container_id, expected_container_type=container_type)
+    except NeptuneException as e:
+        return e
+
+
+def _to_api_experiment(
+    entry: "LeaderboardEntry", fields: Dict[str, "Field"], container_type: ContainerType, project: "Project"
+) -> Optional[ApiExperiment]:
+    sys_id = getattr(fields.get("sys/id"), "value", None)
+    if sys_id is None:
+        return None
+    return ApiExperiment(
+        id=UniqueId(entry.object_id),
+        type=container_type,
+        sys_id=SysId(sys_id),
+        workspace=project.workspace,
+        project_name=project.name,
+        trashed=bool(getattr(fields.get("sys/trashed"), "value", False)),
+    )
+
+
+def _record(
+    results: Dict[ContainerKey, Optional[ApiExperiment]],
+    cache: Optional[ContainerLookupCache],
+    found: Dict[ContainerKey, ApiExperiment],
+) -> None:
+    results.update(found)
+    if cache is not None:
+        for key, experiment in found.items():
+            cache.put(key, experiment)
+
+
+def _cache_key(key: ContainerKey) -> str:
+    container_type, container_id = key
+    return f"{container_type.value}/{container_id}"
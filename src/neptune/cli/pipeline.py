@@ -0,0 +1,164 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "AdaptiveBatchSize",
+    "Batch",
+    "BatchReader",
+]
+
+import queue
+import threading
+from dataclasses import dataclass
+from types import TracebackType
+from typing import (
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from neptune.core.components.queue.disk_queue import DiskQueue
+
+T = TypeVar("T")
+
+
+class AdaptiveBatchSize:
+    """Number of operations to send in a single request, tuned from the observed request latency and payload size.
+
+    The size grows while requests finish well below `target_latency` and stay small in bytes, and it is halved as soon
+    as a request takes longer than `target_latency`.
+    """
+
+    def __init__(
+        self,
+        initial: int = 1000,
+        minimum: int = 100,
+        maximum: int = 10000,
+        target_latency: float = 2.0,
+        max_payload_bytes: int = 16 * 1024**2,
+    ) -> None:
+        self._value: int = initial
+        self._minimum: int = minimum
+        self._maximum: int = maximum
+        self._target_latency: float = target_latency
+        self._max_payload_bytes: int = max_payload_bytes
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def record(self, *, count: int, size_bytes: int, latency: float) -> None:
+        if count <= 0:
+            return
+
+        if latency > self._target_latency:
+            self._value = max(self._minimum, self._value // 2)
+        elif latency < self._target_latency / 2 and count >= self._value:
+            grown = int(self._value * 1.5)
+            # Do not grow past the number of operations that would fit in the payload limit
+            fitting = self._max_payload_bytes * count // max(size_bytes, 1)
+            self._value = max(self._value, min(self._maximum, grown, fitting))
+
+
+@dataclass
+class Batch(Generic[T]):
+    operations: List[T]
+    version: int
+    size_bytes: int
+
+
+class BatchReader(Generic[T]):
+    """Reads batches from a disk queue on a background thread, up to `read_ahead` batches ahead of the consumer.
+
+    Decoding of the next batches overlaps with sending of the current one. Batches are yielded in queue order.
+    The `lock` guards the queue reader against acknowledgements done concurrently by the consumer.
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        disk_queue: DiskQueue[T],
+        batch_size: AdaptiveBatchSize,
+        lock: threading.Lock,
+        read_ahead: int = 2,
+    ) -> None:
+        self._disk_queue: DiskQueue[T] = disk_queue
+        self._batch_size: AdaptiveBatchSize = batch_size
+        self._lock: threading.Lock = lock
+        self._batches: "queue.Queue[Union[Batch[T], BaseException, object]]" = queue.Queue(maxsize=max(read_ahead, 1))
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="NeptuneSyncReader", daemon=True)
+
+    def __enter__(self) -> "BatchReader[T]":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self._stopped.set()
+        # Unblock the reader if it waits for a free slot
+        while self._thread.is_alive():
+            try:
+                self._batches.get_nowait()
+            except queue.Empty:
+                pass
+            self._thread.join(timeout=0.05)
+
+    def __iter__(self) -> Iterator[Batch[T]]:
+        while True:
+            item = self._batches.get()
+            if item is self._END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            assert isinstance(item, Batch)  # mypy fix
+            yield item
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                with self._lock:
+                    raw_batch = self._disk_queue.get_batch(self._batch_size.value)
+                if not raw_batch:
+                    break
+                self._put(
+                    Batch(
+                        operations=[element.obj for element in raw_batch],
+                        version=raw_batch[-1].ver,
+                        size_bytes=sum(element.size for element in raw_batch),
+                    )
+                )
+        except BaseException as e:
+            self._put(e)
+            return
+        self._put(self._END)
+
+    def _put(self, item: object) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._batches.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
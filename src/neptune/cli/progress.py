@@ -0,0 +1,109 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SyncProgress"]
+
+import threading
+import time
+from typing import Optional
+
+from neptune.internal.utils.logger import get_logger
+
+logger = get_logger(with_prefix=False)
+
+
+class SyncProgress:
+    """Thread-safe tracker of operations and containers pushed by `neptune sync`.
+
+    Every execution directory registers its pending operations once its queue is opened and then reports each
+    acknowledged batch, so the aggregated throughput and ETA stay meaningful while containers are synchronized
+    concurrently.
+    """
+
+    def __init__(self, total_containers: int, report_interval: float = 5.0) -> None:
+        self._total_containers: int = total_containers
+        self._report_interval: float = report_interval
+        self._lock = threading.Lock()
+        self._start_time: float = time.monotonic()
+        self._last_report_time: float = self._start_time
+        self._pending_operations: int = 0
+        self._synced_operations: int = 0
+        self._synced_containers: int = 0
+
+    @property
+    def synced_operations(self) -> int:
+        return self._synced_operations
+
+    @property
+    def synced_containers(self) -> int:
+        return self._synced_containers
+
+    @property
+    def pending_operations(self) -> int:
+        return self._pending_operations
+
+    @property
+    def throughput(self) -> float:
+        """Synchronized operations per second since the tracker was created."""
+        elapsed = time.monotonic() - self._start_time
+        return self._synced_operations / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds left to push the operations known so far, or `None` before the first batch is acknowledged."""
+        throughput = self.throughput
+        if throughput <= 0:
+            return None
+        return self._pending_operations / throughput
+
+    def add_pending(self, count: int) -> None:
+        with self._lock:
+            self._pending_operations += count
+
+    def advance(self, count: int) -> None:
+        with self._lock:
+            self._synced_operations += count
+            self._pending_operations = max(self._pending_operations - count, 0)
+            now = time.monotonic()
+            if now - self._last_report_time < self._report_interval:
+                return
+            self._last_report_time = now
+        self._log_progress()
+
+    def container_done(self) -> None:
+        with self._lock:
+            self._synced_containers += 1
+
+    def summary(self) -> None:
+        logger.info(
+            "Synchronized %d operations from %d/%d objects in %.1f s (%.1f operations/s).",
+            self._synced_operations,
+            self._synced_containers,
+            self._total_containers,
+            time.monotonic() - self._start_time,
+            self.throughput,
+        )
+
+    def _log_progress(self) -> None:
+        eta = self.eta
+        logger.info(
+            "Synchronized %d operations (%.1f operations/s), %d/%d objects completed, ETA %s.",
+            self._synced_operations,
+            self.throughput,
+            self._synced_containers,
+            self._total_containers,
+            f"{eta:.0f} s" if eta is not None else "unknown",
+        )
@@ -16,6 +16,11 @@
 
 __all__ = ["SyncRunner"]
 
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -25,6 +30,7 @@ from typing import (
 )
 
 from neptune.cli.collect import collect_containers
+from neptune.cli.progress import SyncProgress
 from neptune.cli.utils import (
     get_metadata_container,
     get_project,
@@ -40,8 +46,10 @@ from neptune.internal.utils.logger import get_logger
 if TYPE_CHECKING:
     from neptune.cli.containers import (
         AsyncContainer,
+        Container,
         OfflineContainer,
     )
+    from neptune.internal.backends.api_model import Project
     from neptune.internal.backends.neptune_backend import NeptuneBackend
 
 
@@ -50,23 +58,44 @@ logger = get_logger(with_prefix=False)
 
 class SyncRunner:
     @staticmethod
-    def sync_all_offline(*, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None) -> None:
+    def sync_all_offline(
+        *, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None, jobs: int = 1
+    ) -> None:
         containers = collect_containers(path=base_path, backend=backend)
 
         project = get_project(project_name_flag=QualifiedName(project_name) if project_name else None, backend=backend)
         if not project:
             raise CannotSynchronizeOfflineRunsWithoutProject
 
-        for container in containers.offline_containers:
-            container.sync(base_path=base_path, backend=backend, project=project)
+        progress = SyncProgress(total_containers=len(containers.offline_containers))
+        sync_containers(
+            backend=backend,
+            base_path=base_path,
+            containers=containers.offline_containers,
+            project=project,
+            jobs=jobs,
+            progress=progress,
+        )
+        progress.summary()
 
     @staticmethod
-    def sync_all(*, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None) -> None:
+    def sync_all(
+        *, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None, jobs: int = 1
+    ) -> None:
         containers = collect_containers(path=base_path, backend=backend)
+        progress = SyncProgress(
+            total_containers=len(containers.unsynced_containers) + len(containers.offline_containers)
+        )
 
         if containers.unsynced_containers:
-            for async_container in containers.unsynced_containers:
-                async_container.sync(base_path=base_path, backend=backend, project=None)
+            sync_containers(
+                backend=backend,
+                base_path=base_path,
+                containers=containers.unsynced_containers,
+                project=None,
+                jobs=jobs,
+                progress=progress,
+            )
 
         if containers.offline_containers:
             project = get_project(
@@ -75,15 +104,29 @@ class SyncRunner:
             if not project:
                 raise CannotSynchronizeOfflineRunsWithoutProject
 
-            for offline_container in containers.offline_containers:
-                offline_container.sync(base_path=base_path, backend=backend, project=project)
+            sync_containers(
+                backend=backend,
+                base_path=base_path,
+                containers=containers.offline_containers,
+                project=project,
+                jobs=jobs,
+                progress=progress,
+            )
+
+        progress.summary()
 
     @staticmethod
     def sync_selected(
-        *, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None, object_names: Sequence[str]
+        *,
+        backend: "NeptuneBackend",
+        base_path: Path,
+        project_name: Optional[str] = None,
+        object_names: Sequence[str],
+        jobs: int = 1,
     ) -> None:
         containers = collect_containers(path=base_path, backend=backend)
         async_selected = [QualifiedName(name) for name in object_names if not name.startswith(OFFLINE_NAME_PREFIX)]
+        progress = SyncProgress(total_containers=len(object_names))
 
         if async_selected:
             sync_selected_async(
@@ -91,6 +134,8 @@ class SyncRunner:
                 base_path=base_path,
                 container_names=async_selected,
                 containers=containers.async_containers,
+                jobs=jobs,
+                progress=progress,
             )
 
         offline_selected = [
@@ -103,8 +148,50 @@ class SyncRunner:
                 container_names=offline_selected,
                 containers=containers.offline_containers,
                 project_name=project_name,
+                jobs=jobs,
+                progress=progress,
             )
 
+        progress.summary()
+
+
+def sync_containers(
+    *,
+    backend: "NeptuneBackend",
+    base_path: Path,
+    containers: Sequence["Container"],
+    project: Optional["Project"],
+    jobs: int = 1,
+    progress: Optional[SyncProgress] = None,
+) -> None:
+    """Synchronizes containers, up to `jobs` of them at a time.
+
+    Operations of a single container are always sent in order by one worker; only independent containers are
+    synchronized concurrently. Workers share the backend and therefore its pooled HTTP session.
+    The first failure stops scheduling of the remaining containers and is re-raised once the running ones finish.
+    """
+
+    def _sync(container: "Container") -> None:
+        container.sync(base_path=base_path, backend=backend, project=project, progress=progress)
+        if progress is not None:
+            progress.container_done()
+
+    if jobs <= 1 or len(containers) <= 1:
+        for container in containers:
+            _sync(container)
+        return
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="NeptuneSync") as executor:
+        futures = [executor.submit(_sync, container) for container in containers]
+        _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+
+    for future in futures:
+        exception = None if future.cancelled() else future.exception()
+        if exception is not None:
+            raise exception
+
 
 def sync_selected_async(
     *,
@@ -112,6 +199,8 @@ def sync_selected_async(
     base_path: Path,
     container_names: List["QualifiedName"],
     containers: List["AsyncContainer"],
+    jobs: int = 1,
+    progress: Optional[SyncProgress] = None,
 ) -> None:
     async_containers_ids = set()
     for container_name in container_names:
@@ -126,8 +215,14 @@ def sync_selected_async(
 
     selected_async_containers = [x for x in containers if x.container_id in async_containers_ids]
 
-    for container in selected_async_containers:
-        container.sync(base_path=base_path, backend=backend, project=None)
+    sync_containers(
+        backend=backend,
+        base_path=base_path,
+        containers=selected_async_containers,
+        project=None,
+        jobs=jobs,
+        progress=progress,
+    )
 
 
 def sync_selected_offline(
@@ -137,6 +232,8 @@ def sync_selected_offline(
     container_names: List["UniqueId"],
     containers: List["OfflineContainer"],
     project_name: Optional[str] = None,
+    jobs: int = 1,
+    progress: Optional[SyncProgress] = None,
 ) -> None:
     project = get_project(project_name_flag=QualifiedName(project_name) if project_name else None, backend=backend)
     if not project:
@@ -151,5 +248,11 @@ def sync_selected_offline(
         else:
             logger.warning("Offline container %s not found on disk.", container_id)
 
-    for container in selected_offline_containers:
-        container.sync(base_path=base_path, backend=backend, project=project)
+    sync_containers(
+        backend=backend,
+        base_path=base_path,
+        containers=selected_offline_containers,
+        project=project,
+        jobs=jobs,
+        progress=progress,
+    )
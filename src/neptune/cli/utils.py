@@ -18,6 +18,7 @@ __all__ = [
     "get_metadata_container",
     "get_project",
     "get_qualified_name",
+    "get_recorded_project",
     "is_single_execution_dir_synced",
     "detect_offline_dir",
     "detect_async_dir",
@@ -25,18 +26,17 @@ __all__ = [
 
 import os
 import textwrap
-import threading
 from pathlib import Path
 from typing import (
-    Any,
-    Callable,
-    Dict,
+    TYPE_CHECKING,
+    Iterable,
     Optional,
     Tuple,
     Union,
 )
 
-from neptune.core.components.queue.disk_queue import DiskQueue
+from neptune.core.components.metadata_file import MetadataFile
+from neptune.core.components.queue.disk_queue import inspect_queue
 from neptune.envs import PROJECT_ENV_NAME
 from neptune.exceptions import (
     MetadataContainerNotFound,
@@ -53,10 +53,12 @@ from neptune.internal.id_formats import (
     QualifiedName,
     UniqueId,
 )
-from neptune.internal.operation import Operation
 from neptune.internal.utils.logger import get_logger
 from neptune.objects.structure_version import StructureVersion
 
+if TYPE_CHECKING:
+    from neptune.cli.containers import ExecutionDirectory
+
 logger = get_logger(with_prefix=False)
 
 
@@ -113,13 +115,20 @@ def get_qualified_name(experiment: ApiExperiment) -> QualifiedName:
     return QualifiedName(f"{experiment.workspace}/{experiment.project_name}/{experiment.sys_id}")
 
 
-def is_single_execution_dir_synced(execution_path: Path) -> bool:
-    serializer: Callable[[Operation], Dict[str, Any]] = lambda op: op.to_dict()
+def get_recorded_project(execution_dirs: Iterable["ExecutionDirectory"]) -> Optional[str]:
+    """Returns the qualified name of the project the container was created in, recorded by newer clients."""
+    for execution_dir in execution_dirs:
+        try:
+            project = MetadataFile(data_path=execution_dir.path)["project"]
+        except KeyError:
+            continue
+        if project:
+            return str(project)
+    return None
 
-    with DiskQueue(execution_path, serializer, Operation.from_dict, threading.RLock()) as disk_queue:
-        is_queue_empty: bool = disk_queue.is_empty()
 
-    return is_queue_empty
+def is_single_execution_dir_synced(execution_path: Path) -> bool:
+    return inspect_queue(execution_path).is_empty
 
 
 def detect_async_dir(dir_name: str) -> Tuple[ContainerType, UniqueId, StructureVersion]:
@@ -19,6 +19,10 @@ __all__ = [
     "OFFLINE_DIRECTORY",
     "ASYNC_DIRECTORY",
     "SYNC_DIRECTORY",
+    "SWAGGER_SPEC_CACHE_DIRECTORY",
+    "SERIES_CACHE_DIRECTORY",
+    "CONTAINER_LOOKUP_CACHE_FILE",
+    "TOKEN_CACHE_DIRECTORY",
     "OFFLINE_NAME_PREFIX",
     "MAX_32_BIT_INT",
     "MIN_32_BIT_INT",
@@ -34,6 +38,10 @@ NEPTUNE_DATA_DIRECTORY = ".neptune"
 OFFLINE_DIRECTORY = "offline"
 ASYNC_DIRECTORY = "async"
 SYNC_DIRECTORY = "sync"
+SWAGGER_SPEC_CACHE_DIRECTORY = "swagger_specs"
+SERIES_CACHE_DIRECTORY = "series_cache"
+CONTAINER_LOOKUP_CACHE_FILE = "container_lookup_cache.json"
+TOKEN_CACHE_DIRECTORY = "token_cache"
 
 OFFLINE_NAME_PREFIX = "offline/"
 
@@ -34,6 +34,7 @@ from neptune.core.components.queue.disk_queue import (
     DiskQueue,
     QueueElement,
 )
+from neptune.core.components.queue.log_format import LogFormat
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -70,6 +71,9 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
         max_file_size: int = 64 * 1024**2,
         max_batch_size_bytes: Optional[int] = None,
         extension: str = "log",
+        offset_commit_period: Optional[float] = None,
+        offset_commit_count: Optional[int] = None,
+        log_format: Optional[LogFormat] = None,
     ) -> None:
         self._disk_queue = DiskQueue[CategoryQueueElement[T, K]](
             data_path=data_path,
@@ -79,6 +83,9 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
             max_file_size=max_file_size,
             max_batch_size_bytes=max_batch_size_bytes,
             extension=extension,
+            offset_commit_period=offset_commit_period,
+            offset_commit_count=offset_commit_count,
+            log_format=log_format,
         )
         self._stored_element: Optional[QueueElement[CategoryQueueElement[T, K]]] = None
         self._empty_cond = threading.Condition(threading.Lock())
@@ -86,6 +93,17 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
     def put(self, obj: T, category: Optional[K] = None) -> int:
         return self._disk_queue.put(CategoryQueueElement(obj, category))
 
+    def put_many(self, objs: List[T], categories: Optional[List[Optional[K]]] = None) -> int:
+        if categories is None:
+            return self._disk_queue.put_many([CategoryQueueElement(obj) for obj in objs])
+        if len(categories) != len(objs):
+            raise ValueError(
+                f"Number of categories must be equal to number of objects ({len(categories)} != {len(objs)})"
+            )
+        return self._disk_queue.put_many(
+            [CategoryQueueElement(obj, category) for obj, category in zip(objs, categories)]
+        )
+
     def get(self) -> Optional[QueueElement[CategoryQueueElement[T, K]]]:
         if self._stored_element is not None:
             tmp = self._stored_element
@@ -154,6 +172,13 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
     def is_empty(self) -> bool:
         return self._disk_queue.is_empty() and self._stored_element is None
 
+    @property
+    def pending_bytes(self) -> int:
+        return self._disk_queue.pending_bytes
+
+    def flush_writer(self) -> None:
+        self._disk_queue.flush_writer()
+
     def cleanup(self) -> None:
         self._disk_queue.cleanup()
 
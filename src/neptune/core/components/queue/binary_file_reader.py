@@ -0,0 +1,115 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["BinaryFileReader"]
+
+import os
+import zlib
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    IO,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from neptune.core.components.queue.log_format import (
+    FILE_HEADER,
+    FRAME_HEADER,
+    decode_payload,
+)
+from neptune.exceptions import MalformedOperation
+from neptune.internal.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class BinaryFileReader:
+    """Reads records from a binary log file, one frame at a time.
+
+    A frame that is not complete yet is left in place, so that it can be read once the writer flushes it.
+    A frame with a mismatched checksum marks the rest of the file as corrupted and is never returned.
+    """
+
+    def __init__(self, file_path: Union[str, Path]):
+        self._file_path = file_path
+        self._file: IO[bytes] = open(file_path, "rb")
+        self._header_read: bool = False
+        self._corrupted: bool = False
+
+    @property
+    def corrupted(self) -> bool:
+        return self._corrupted
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def get(self) -> Optional[dict]:
+        return self.get_with_size()[0]
+
+    def get_with_size(self) -> Tuple[Optional[dict], int]:
+        if self._corrupted or not self._read_file_header():
+            return None, 0
+
+        position = self._file.tell()
+        header = self._file.read(FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            self._file.seek(position)
+            return None, 0
+
+        length, checksum = FRAME_HEADER.unpack(header)
+        if length > os.fstat(self._file.fileno()).st_size - position - FRAME_HEADER.size:
+            # the frame is not completely written yet
+            self._file.seek(position)
+            return None, 0
+
+        payload = self._file.read(length)
+        if zlib.crc32(payload) != checksum:
+            self._corrupted = True
+            logger.warning(
+                "Corrupted record found in %s at offset %d. Skipping the rest of file.", self._file_path, position
+            )
+            return None, 0
+
+        return decode_payload(payload), length
+
+    def _read_file_header(self) -> bool:
+        if self._header_read:
+            return True
+
+        header = self._file.read(len(FILE_HEADER))
+        if len(header) < len(FILE_HEADER):
+            self._file.seek(0)
+            return False
+        if header != FILE_HEADER:
+            raise MalformedOperation(f"Unsupported log file format: {self._file_path}")
+
+        self._header_read = True
+        return True
+
+    def __enter__(self) -> "BinaryFileReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -13,13 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["QueueElement", "DiskQueue"]
+__all__ = ["QueueElement", "DiskQueue", "inspect_queue"]
 
 import json
 import os
 import threading
+import zlib
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    replace,
+)
 from glob import glob
 from pathlib import Path
 from time import time
@@ -34,13 +38,34 @@ from typing import (
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
 
 from neptune.core.components.abstract import WithResources
+from neptune.core.components.queue.binary_file_reader import BinaryFileReader
 from neptune.core.components.queue.json_file_splitter import JsonFileSplitter
 from neptune.core.components.queue.log_file import LogFile
+from neptune.core.components.queue.log_format import (
+    FILE_HEADER,
+    FRAME_HEADER,
+    LogFormat,
+    decode_payload,
+    detect_log_format,
+    encode_record,
+)
+from neptune.core.components.queue.queue_manifest import (
+    QueueManifest,
+    QueueManifestFile,
+    read_manifest,
+)
 from neptune.core.components.queue.sync_offset_file import SyncOffsetFile
+from neptune.envs import (
+    NEPTUNE_QUEUE_LOG_FORMAT,
+    NEPTUNE_QUEUE_OFFSET_COMMIT_COUNT,
+    NEPTUNE_QUEUE_OFFSET_COMMIT_PERIOD,
+)
 from neptune.exceptions import MalformedOperation
+from neptune.internal.utils.disk_utilization import get_disk_utilization_monitor
 from neptune.internal.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -54,6 +79,9 @@ _logger = get_logger()
 
 
 DEFAULT_MAX_BATCH_SIZE_BYTES = 100 * 1024**2
+TAIL_READ_SIZE = 64 * 1024
+
+LogReader = Union[JsonFileSplitter, BinaryFileReader]
 
 
 @dataclass
@@ -75,6 +103,9 @@ class DiskQueue(WithResources, Generic[T]):
         max_file_size: int = 64 * 1024**2,
         max_batch_size_bytes: Optional[int] = None,
         extension: str = "log",
+        offset_commit_period: Optional[float] = None,
+        offset_commit_count: Optional[int] = None,
+        log_format: Optional[LogFormat] = None,
     ) -> None:
         self._data_path: Path = data_path.resolve()
         self._to_dict: Callable[[T], dict] = to_dict
@@ -84,20 +115,61 @@ class DiskQueue(WithResources, Generic[T]):
             os.environ.get("NEPTUNE_MAX_BATCH_SIZE_BYTES") or str(DEFAULT_MAX_BATCH_SIZE_BYTES)
         )
         self._extension: str = extension
+        self._log_format: LogFormat = log_format or LogFormat(
+            os.environ.get(NEPTUNE_QUEUE_LOG_FORMAT) or LogFormat.JSON.value
+        )
 
-        self._last_ack_file = SyncOffsetFile(data_path / "last_ack_version", default=0)
-        self._last_put_file = SyncOffsetFile(data_path / "last_put_version", default=0)
+        if offset_commit_period is None and os.environ.get(NEPTUNE_QUEUE_OFFSET_COMMIT_PERIOD):
+            offset_commit_period = float(os.environ[NEPTUNE_QUEUE_OFFSET_COMMIT_PERIOD])
+        if offset_commit_count is None and os.environ.get(NEPTUNE_QUEUE_OFFSET_COMMIT_COUNT):
+            offset_commit_count = int(os.environ[NEPTUNE_QUEUE_OFFSET_COMMIT_COUNT])
 
-        self._log_files: Deque[LogFile] = get_all_log_files(data_path, extension)
+        self._last_ack_file = SyncOffsetFile(
+            data_path / "last_ack_version",
+            default=0,
+            commit_period=offset_commit_period,
+            commit_count=offset_commit_count,
+        )
+        self._last_put_file = SyncOffsetFile(
+            data_path / "last_put_version",
+            default=0,
+            commit_period=offset_commit_period,
+            commit_count=offset_commit_count,
+        )
+
+        self._log_files: Deque[LogFile] = get_all_log_files(data_path, extension, self._log_format)
+        # In group-commit mode the persisted put version may lag behind the data files after a crash
+        self._last_put_file.recover(read_last_version(self._log_files[-1]))
         self._write_file_version: int = self._log_files[-1].min_version
         self._writer = self._log_files[-1]
         self._read_file_version: int = self._log_files[0].min_version
-        self._reader = JsonFileSplitter(self._log_files[0].file_path)
+        self._reader: LogReader = open_log_reader(self._log_files[0].file_path)
+
+        # Never append to a file in a different format, nor to a binary file that may end with a partial frame
+        self._needs_new_writer: bool = self._writer.has_records and (
+            self._writer.log_format != self._log_format or self._log_format == LogFormat.BINARY
+        )
 
         self._should_skip_to_ack = True
 
+        # Bytes of records put in this session and read back, for schedulers tracking how much is pending
+        self._opened_at_version: int = self._last_put_file.read_local()
+        self._bytes_put: int = 0
+        self._bytes_read: int = 0
+        # readers report sizes without the newline or the frame header of a record
+        self._record_overhead: int = FRAME_HEADER.size if self._log_format == LogFormat.BINARY else 1
+
+        self._disk_utilization_monitor = get_disk_utilization_monitor()
+        self._disk_utilization_monitor.acquire()
+        self._holds_disk_utilization_monitor = True
+
         self._empty_cond = threading.Condition(lock)
 
+        # Guards data and offset writes, so the manifest never describes a record without its version
+        self._write_lock = threading.RLock()
+        self._manifest_file = QueueManifestFile(data_path)
+        self._write_manifest()
+
     @property
     def data_path(self) -> Path:
         return self._data_path
@@ -107,16 +179,56 @@ class DiskQueue(WithResources, Generic[T]):
         return (
             self._last_put_file,
             self._last_ack_file,
+            self._manifest_file,
         ) + tuple(self._log_files)
 
     def put(self, obj: T) -> int:
         version = self._last_put_file.read_local() + 1
-        serialized_obj = json.dumps(self._serialize(obj=obj, version=version, at=time()))
+        serialized_obj = encode_record(self._serialize(obj=obj, version=version, at=time()), self._log_format)
+
+        with self._write_lock:
+            self._create_new_writer_if_file_size_exceeded(len(serialized_obj), version)
+
+            self._writer.write(serialized_obj)
+            self._last_put_file.write(version)
+            self._bytes_put += len(serialized_obj)
+        self._disk_utilization_monitor.record_written(len(serialized_obj))
 
-        self._create_new_writer_if_file_size_exceeded(len(serialized_obj), version)
+        return version
 
-        self._writer.write(serialized_obj)
-        self._last_put_file.write(version)
+    def put_many(self, objs: List[T]) -> int:
+        """Puts all objects with a contiguous range of versions, writing them in as few calls as possible.
+
+        Returns the version of the last object.
+        """
+        version = self._last_put_file.read_local()
+        if not objs:
+            return version
+
+        at = time()
+        pending: List[bytes] = []
+        pending_size = 0
+        written_size = 0
+        with self._write_lock:
+            for obj in objs:
+                version += 1
+                serialized_obj = encode_record(self._serialize(obj=obj, version=version, at=at), self._log_format)
+
+                if pending and self._writer.file_size + pending_size + len(serialized_obj) > self._max_file_size:
+                    self._writer.write_many(pending)
+                    self._disk_utilization_monitor.record_written(pending_size)
+                    written_size += pending_size
+                    pending, pending_size = [], 0
+                if not pending:
+                    self._create_new_writer_if_file_size_exceeded(len(serialized_obj), version)
+
+                pending.append(serialized_obj)
+                pending_size += len(serialized_obj)
+
+            self._writer.write_many(pending)
+            self._last_put_file.write(version)
+            self._bytes_put += written_size + pending_size
+        self._disk_utilization_monitor.record_written(pending_size)
 
         return version
 
@@ -152,17 +264,20 @@ class DiskQueue(WithResources, Generic[T]):
             for log_file in self._log_files:
                 if log_file.min_version > self._read_file_version:
                     self._read_file_version = log_file.min_version
-                    self._reader = JsonFileSplitter(log_file.file_path)
+                    self._reader = open_log_reader(log_file.file_path)
                     break
 
             # It is safe. Max recursion level is 2.
             return self._get()
         try:
             obj, ver, at = self._deserialize(_json)
-            return QueueElement[T](obj, ver, size, at)
         except Exception as e:
             raise MalformedOperation from e
 
+        if ver > self._opened_at_version:
+            self._bytes_read += size + self._record_overhead
+        return QueueElement[T](obj, ver, size, at)
+
     def get_batch(self, size: int) -> List[QueueElement[T]]:
         if self._should_skip_to_ack:
             first = self._skip_and_get()
@@ -197,13 +312,17 @@ class DiskQueue(WithResources, Generic[T]):
                 self._empty_cond.notify_all()
 
     def _create_new_writer_if_file_size_exceeded(self, size: int, version: int) -> None:
-        if self._writer.file_size + size > self._max_file_size:
+        if self._needs_new_writer or self._writer.file_size + size > self._max_file_size:
+            self._needs_new_writer = False
             old_writer = self._writer
-            self._writer = LogFile(self._data_path, version, extension=self._extension)
+            self._writer = LogFile(self._data_path, version, extension=self._extension, log_format=self._log_format)
             old_writer.flush()
             old_writer.close()
             self._write_file_version = version
             self._log_files.append(self._writer)
+            self._disk_utilization_monitor.notify_file_rotated()
+            # records of the new file must not go unnoticed if the process dies before the next flush
+            self._write_manifest()
 
     def _clean_log_files_up_to(self, version: int) -> None:
         log_versions = [log.min_version for log in self._log_files]
@@ -215,6 +334,16 @@ class DiskQueue(WithResources, Generic[T]):
     def is_empty(self) -> bool:
         return self.size() == 0
 
+    @property
+    def pending_bytes(self) -> int:
+        """Size of the records put in this session and not read yet."""
+        return max(0, self._bytes_put - self._bytes_read)
+
+    def flush_writer(self) -> None:
+        """Makes the records put so far readable, without committing offsets nor the manifest."""
+        with self._write_lock:
+            self._writer.flush()
+
     def size(self) -> int:
         return self._last_put_file.read_local() - self._last_ack_file.read_local()
 
@@ -224,9 +353,37 @@ class DiskQueue(WithResources, Generic[T]):
     def _deserialize(self, data: dict) -> Tuple[T, int, Optional[Timestamp]]:
         return self._from_dict(data["obj"]), data["version"], data.get("at")
 
+    @property
+    def manifest(self) -> QueueManifest:
+        with self._write_lock:
+            # the consumer may drop acknowledged files in the meantime
+            log_files = tuple(self._log_files)
+            return QueueManifest(
+                first_version=log_files[0].min_version,
+                last_put_version=self._last_put_file.read_local(),
+                last_ack_version=self._last_ack_file.read_persisted(),
+                size_bytes=sum(log_file.file_size for log_file in log_files),
+                write_file=self._writer.file_name,
+                write_file_size=self._writer.file_size,
+            )
+
+    def _write_manifest(self) -> None:
+        with self._write_lock:
+            # Put versions are recovered from the data files, so these only need to reach the disk first
+            self._writer.flush()
+            self._manifest_file.write(self.manifest)
+
+    def flush(self) -> None:
+        super().flush()
+        self._write_manifest()
+
     def close(self) -> None:
         self._reader.close()
+        self.flush()
         super().close()
+        if self._holds_disk_utilization_monitor:
+            self._holds_disk_utilization_monitor = False
+            self._disk_utilization_monitor.release()
 
     def __enter__(self) -> "DiskQueue[T]":
         return self
@@ -243,11 +400,81 @@ class DiskQueue(WithResources, Generic[T]):
             self.cleanup()
 
 
-def get_all_log_files(data_path: Path, extension: str) -> Deque[LogFile]:
+def inspect_queue(data_path: Path, extension: str = "log") -> QueueManifest:
+    """Returns the state of the disk queue in `data_path` without opening it, so without modifying any file.
+
+    The manifest maintained by `DiskQueue` is used as long as no data was written to the queue since, with the offsets
+    updated from their own files. Otherwise, the data files are scanned as well.
+    """
+    manifest = read_manifest(data_path)
+    if manifest is not None and manifest.write_file is not None:
+        try:
+            current = (data_path / manifest.write_file).stat().st_size == manifest.write_file_size
+        except OSError:
+            current = False
+        if current:
+            last_put_version = _read_offset(data_path / "last_put_version", default=0)
+            last_ack_version = _read_offset(data_path / "last_ack_version", default=0)
+            return replace(
+                manifest,
+                last_put_version=max(manifest.last_put_version, last_put_version),
+                last_ack_version=max(manifest.last_ack_version, last_ack_version),
+            )
+
+    return _scan_queue(data_path, extension)
+
+
+def _scan_queue(data_path: Path, extension: str) -> QueueManifest:
+    last_put_version = _read_offset(data_path / "last_put_version", default=0)
+    last_ack_version = _read_offset(data_path / "last_ack_version", default=0)
+
+    data_files = sorted(
+        (Path(file_path) for file_path in glob(f"{data_path}/data-*.{extension}")),
+        key=lambda file_path: extract_version_from_file_name(file_path, extension),
+    )
+    sizes = [file_path.stat().st_size for file_path in data_files]
+    if data_files:
+        # In group-commit mode the persisted put version may lag behind the data files after a crash
+        if detect_log_format(data_files[-1]) == LogFormat.BINARY:
+            last_version = _read_last_binary_version(data_files[-1])
+        else:
+            last_version = _read_last_json_version(data_files[-1])
+        last_put_version = max(last_put_version, last_version or 0)
+
+    return QueueManifest(
+        first_version=extract_version_from_file_name(data_files[0], extension) if data_files else last_put_version + 1,
+        last_put_version=last_put_version,
+        last_ack_version=last_ack_version,
+        size_bytes=sum(sizes),
+        write_file=data_files[-1].name if data_files else None,
+        write_file_size=sizes[-1] if sizes else 0,
+        updated_at=max((file_path.stat().st_mtime for file_path in data_files), default=None),
+    )
+
+
+def _read_offset(path: Path, default: int) -> int:
+    try:
+        with open(path, "r") as file:
+            content = file.read()
+    except OSError:
+        return default
+    try:
+        return int(content) if content else default
+    except ValueError:
+        return default
+
+
+def open_log_reader(file_path: Path) -> LogReader:
+    if detect_log_format(file_path) == LogFormat.BINARY:
+        return BinaryFileReader(file_path)
+    return JsonFileSplitter(file_path)
+
+
+def get_all_log_files(data_path: Path, extension: str, log_format: LogFormat = LogFormat.JSON) -> Deque[LogFile]:
     local_data_files = glob(f"{data_path}/data-*.{extension}")
 
     if not local_data_files:
-        return deque([LogFile(data_path, 1, extension=extension)])
+        return deque([LogFile(data_path, 1, extension=extension, log_format=log_format)])
 
     sorted_local_data_files = sorted(
         local_data_files, key=lambda file_path: extract_version_from_file_name(Path(file_path), extension)
@@ -255,11 +482,75 @@ def get_all_log_files(data_path: Path, extension: str) -> Deque[LogFile]:
 
     return deque(
         [
-            LogFile(data_path, extract_version_from_file_name(Path(file_path), extension), extension=extension)
+            LogFile(
+                data_path,
+                extract_version_from_file_name(Path(file_path), extension),
+                extension=extension,
+                log_format=log_format,
+            )
             for file_path in sorted_local_data_files
         ]
     )
 
 
+def read_last_version(log_file: LogFile) -> int:
+    """Returns the version of the last complete record in the log file without decoding the whole file."""
+    log_file.flush()
+    if log_file.log_format == LogFormat.BINARY:
+        version = _read_last_binary_version(log_file.file_path)
+    else:
+        version = _read_last_json_version(log_file.file_path)
+
+    return log_file.min_version - 1 if version is None else version
+
+
+def _read_last_json_version(file_path: Path) -> Optional[int]:
+    file_size = file_path.stat().st_size if file_path.exists() else 0
+
+    with open(file_path, "rb") as file:
+        end = file_size
+        tail = b""
+        while end > 0:
+            start = max(0, end - TAIL_READ_SIZE)
+            file.seek(start)
+            tail = file.read(end - start) + tail
+            end = start
+            for line in reversed(tail.splitlines()[1 if start > 0 else 0 :]):
+                try:
+                    return int(json.loads(line)["version"])
+                except (ValueError, KeyError, TypeError):
+                    # partially written record
+                    continue
+
+    return None
+
+
+def _read_last_binary_version(file_path: Path) -> Optional[int]:
+    frames: Deque[Tuple[int, int, int]] = deque(maxlen=16)
+
+    with open(file_path, "rb") as file:
+        if file.read(len(FILE_HEADER)) != FILE_HEADER:
+            return None
+
+        # Frame headers are enough to find the record boundaries
+        file_size = os.fstat(file.fileno()).st_size
+        position = len(FILE_HEADER)
+        while position + FRAME_HEADER.size <= file_size:
+            length, checksum = FRAME_HEADER.unpack(file.read(FRAME_HEADER.size))
+            if position + FRAME_HEADER.size + length > file_size:
+                break
+            frames.append((position + FRAME_HEADER.size, length, checksum))
+            position += FRAME_HEADER.size + length
+            file.seek(position)
+
+        for payload_position, length, checksum in reversed(frames):
+            file.seek(payload_position)
+            payload = file.read(length)
+            if zlib.crc32(payload) == checksum:
+                return int(decode_payload(payload)["version"])
+
+    return None
+
+
 def extract_version_from_file_name(file_path: Path, extension: str) -> int:
     return int(file_path.name.split("-")[-1][: -len(extension) - 1])
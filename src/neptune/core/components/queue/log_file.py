@@ -14,24 +14,41 @@
 # limitations under the License.
 #
 from pathlib import Path
+from typing import List
 
 from neptune.core.components.abstract import Resource
+from neptune.core.components.queue.log_format import (
+    FILE_HEADER,
+    LogFormat,
+    detect_log_format,
+)
 from neptune.internal.utils.logger import get_logger
 
 logger = get_logger()
 
 
 class LogFile(Resource):
-    def __init__(self, data_path: Path, min_version: int, extension: str = "log") -> None:
+    def __init__(
+        self, data_path: Path, min_version: int, extension: str = "log", log_format: LogFormat = LogFormat.JSON
+    ) -> None:
         self._data_path: Path = data_path
         self._min_version: int = min_version
         self._extension: str = extension
 
+        # Existing files are always appended to in their own format
+        self._log_format: LogFormat = detect_log_format(self.file_path) or log_format
+
         self._file_size: int = 0
         if (data_path / f"data-{min_version}.{extension}").exists():
             self._file_size = self.file_path.stat().st_size
 
-        self._writer = open(self.file_path, "a")
+        self._writer = open(self.file_path, "ab")
+
+        if self._file_size == 0 and self._log_format == LogFormat.BINARY:
+            # Readers detect the format of a file by its header, so it has to be visible immediately
+            self._writer.write(FILE_HEADER)
+            self._writer.flush()
+            self._file_size = len(FILE_HEADER)
 
     @property
     def data_path(self) -> Path:
@@ -45,6 +62,14 @@ class LogFile(Resource):
     def file_size(self) -> int:
         return self._file_size
 
+    @property
+    def log_format(self) -> LogFormat:
+        return self._log_format
+
+    @property
+    def has_records(self) -> bool:
+        return self._file_size > (len(FILE_HEADER) if self._log_format == LogFormat.BINARY else 0)
+
     @property
     def file_name(self) -> str:
         return f"data-{self._min_version}.{self._extension}"
@@ -53,9 +78,14 @@ class LogFile(Resource):
     def file_path(self) -> Path:
         return self._data_path / self.file_name
 
-    def write(self, data: str) -> None:
-        self._writer.write(data + "\n")
-        self._file_size += len(data) + 1
+    def write(self, data: bytes) -> None:
+        self._writer.write(data)
+        self._file_size += len(data)
+
+    def write_many(self, data: List[bytes]) -> None:
+        payload = b"".join(data)
+        self._writer.write(payload)
+        self._file_size += len(payload)
 
     def cleanup(self) -> None:
         self.close()
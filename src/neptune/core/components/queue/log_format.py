@@ -0,0 +1,84 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "LogFormat",
+    "FILE_HEADER",
+    "FRAME_HEADER",
+    "detect_log_format",
+    "encode_record",
+    "decode_payload",
+]
+
+import json
+import struct
+import zlib
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    Optional,
+    cast,
+)
+
+from neptune.internal.utils.requirement_check import require_installed
+
+# Binary log files start with the magic bytes followed by the format version.
+# Every record is stored as a frame: payload length, CRC32 of the payload and the msgpack-encoded payload.
+MAGIC = b"NEPTQLOG"
+FORMAT_VERSION = 1
+FILE_HEADER = MAGIC + struct.pack("<H", FORMAT_VERSION)
+FRAME_HEADER = struct.Struct("<II")
+
+
+class LogFormat(str, Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+    def __repr__(self) -> str:
+        return f'"{self.value}"'
+
+
+def detect_log_format(file_path: Path) -> Optional[LogFormat]:
+    """Returns the format of the existing log file or `None` if the file is empty or does not exist."""
+    try:
+        with open(file_path, "rb") as file:
+            prefix = file.read(len(MAGIC))
+    except FileNotFoundError:
+        return None
+
+    if not prefix:
+        return None
+    return LogFormat.BINARY if prefix == MAGIC else LogFormat.JSON
+
+
+def encode_record(record: dict, log_format: LogFormat) -> bytes:
+    if log_format == LogFormat.BINARY:
+        payload = cast(bytes, _msgpack().packb(record, use_bin_type=True))
+        return FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+def decode_payload(payload: bytes) -> dict:
+    return cast(dict, _msgpack().unpackb(payload, raw=False, strict_map_key=False))
+
+
+def _msgpack() -> Any:
+    # msgpack is needed only by the binary format, which is opt-in
+    require_installed("msgpack")
+    import msgpack  # type: ignore[import-untyped]
+
+    return msgpack
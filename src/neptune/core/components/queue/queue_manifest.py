@@ -0,0 +1,114 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["QueueManifest", "QueueManifestFile", "MANIFEST_FILE", "read_manifest"]
+
+import json
+import os
+import tempfile
+from dataclasses import (
+    asdict,
+    dataclass,
+    replace,
+)
+from pathlib import Path
+from time import time
+from typing import Optional
+
+from neptune.core.components.abstract import Resource
+from neptune.internal.utils.logger import get_logger
+
+_logger = get_logger()
+
+MANIFEST_FILE: str = "queue_manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class QueueManifest:
+    """Summary of the state of a disk queue, readable without opening the queue.
+
+    `write_file` and `write_file_size` describe the data file appended to when the manifest was written,
+    so that readers can tell whether anything was put to the queue since.
+    """
+
+    first_version: int
+    last_put_version: int
+    last_ack_version: int
+    size_bytes: int
+    write_file: Optional[str] = None
+    write_file_size: int = 0
+    created_at: Optional[float] = None
+    updated_at: Optional[float] = None
+
+    @property
+    def pending(self) -> int:
+        return max(0, self.last_put_version - self.last_ack_version)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.pending == 0
+
+
+class QueueManifestFile(Resource):
+    """Stores the `QueueManifest` of a disk queue, replacing the file atomically on every write.
+
+    The creation time is carried over from the manifest already stored, and the update time is set on every write.
+    """
+
+    def __init__(self, data_path: Path) -> None:
+        self._data_path = data_path
+        self._path = data_path / MANIFEST_FILE
+        previous = self.read()
+        self._created_at: float = (previous.created_at if previous else None) or time()
+
+    @property
+    def data_path(self) -> Path:
+        return self._data_path
+
+    def read(self) -> Optional[QueueManifest]:
+        return read_manifest(self._data_path)
+
+    def write(self, manifest: QueueManifest) -> None:
+        manifest = replace(manifest, created_at=self._created_at, updated_at=time())
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self._data_path, prefix="queue_manifest", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as file:
+                    json.dump({"version": MANIFEST_FORMAT_VERSION, **asdict(manifest)}, file)
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            _logger.debug("Could not write queue manifest in %s: %s", self._data_path, e)
+
+    def cleanup(self) -> None:
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+
+def read_manifest(data_path: Path) -> Optional[QueueManifest]:
+    """Returns the manifest stored in `data_path`, or None if there is none or it cannot be read."""
+    try:
+        with open(data_path / MANIFEST_FILE, "r") as file:
+            data = json.load(file)
+        if data.pop("version", None) != MANIFEST_FORMAT_VERSION:
+            return None
+        return QueueManifest(**data)
+    except (OSError, ValueError, TypeError, AttributeError):
+        return None
@@ -16,30 +16,84 @@
 __all__ = ["SyncOffsetFile"]
 
 import os
+import threading
 from pathlib import Path
-from typing import IO
+from time import monotonic
+from typing import (
+    IO,
+    Optional,
+)
 
 from neptune.core.components.abstract import Resource
 
 
 class SyncOffsetFile(Resource):
-    def __init__(self, path: Path, default: int = 0):
+    """Stores a single offset (version) on disk.
+
+    By default, every `write` is persisted immediately. When `commit_period` (seconds) or `commit_count`
+    is given, the file works in group-commit mode: writes only update the in-memory value, which is persisted
+    once the period elapses or the given number of writes accumulates, and always on `flush` and `close`.
+
+    The period is best-effort, as it is only checked on `write`: the last writes to a file that goes idle stay
+    pending until the next `flush`. The asynchronous operation processor flushes its queue every `sleep_time`
+    seconds, which bounds how long they stay pending; after a crash, the put version is recovered from data files.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        default: int = 0,
+        commit_period: Optional[float] = None,
+        commit_count: Optional[int] = None,
+    ):
         self._path = path
         mode = "r+" if path.exists() else "w+"
         self._file: IO = open(self._path, mode)
         self._default: int = default
         self._last: int = self.read()
 
+        self._commit_period: Optional[float] = commit_period
+        self._commit_count: Optional[int] = commit_count
+        self._persisted: int = self._last
+        self._pending_writes: int = 0
+        self._last_commit: float = monotonic()
+        self._lock = threading.Lock()
+
     @property
     def data_path(self) -> Path:
         return self._path.parent
 
+    @property
+    def is_group_commit(self) -> bool:
+        return self._commit_period is not None or self._commit_count is not None
+
     def write(self, offset: int) -> None:
-        self._file.seek(0)
-        self._file.write(str(offset))
-        self._file.truncate()
-        self._file.flush()
         self._last = offset
+        if not self.is_group_commit:
+            self._persist()
+            return
+
+        self._pending_writes += 1
+        if self._should_commit():
+            self._persist()
+
+    def _should_commit(self) -> bool:
+        if self._commit_count is not None and self._pending_writes >= self._commit_count:
+            return True
+        return self._commit_period is not None and monotonic() - self._last_commit >= self._commit_period
+
+    def _persist(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            offset = self._last
+            self._file.seek(0)
+            self._file.write(str(offset))
+            self._file.truncate()
+            self._file.flush()
+            self._persisted = offset
+            self._pending_writes = 0
+            self._last_commit = monotonic()
 
     def read(self) -> int:
         self._file.seek(0)
@@ -51,11 +105,25 @@ class SyncOffsetFile(Resource):
     def read_local(self) -> int:
         return self._last
 
+    def read_persisted(self) -> int:
+        return self._persisted
+
+    def recover(self, offset: int) -> None:
+        """Moves the offset forward to a value found during recovery, e.g. by scanning the data files."""
+        if offset > self._last:
+            self._last = offset
+            self._persist()
+
     def flush(self) -> None:
-        self._file.flush()
+        if self._last != self._persisted:
+            self._persist()
+        elif not self._file.closed:
+            self._file.flush()
 
     def close(self) -> None:
-        self._file.close()
+        self.flush()
+        with self._lock:
+            self._file.close()
 
     def cleanup(self) -> None:
         try:
@@ -24,15 +24,19 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Optional,
     Tuple,
 )
 
+from neptune.api.ingestion_sink import IngestionSink
 from neptune.core.components.abstract import (
     Resource,
     WithResources,
 )
 from neptune.core.operation_processors.async_operation_processor.constants import (
+    DEFAULT_LINGER_MS,
+    DEFAULT_MAX_BATCH_BYTES,
     STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS,
 )
 from neptune.core.operation_processors.async_operation_processor.consumer_thread import ConsumerThread
@@ -65,6 +69,11 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         serializer: Callable[[Operation], Dict[str, Any]] = lambda op: op.to_dict(),
         should_print_logs: bool = True,
         sleep_time: float = 5.0,
+        sink: Optional[IngestionSink] = None,
+        linger: float = DEFAULT_LINGER_MS / 1000,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        adaptive_batching: bool = True,
+        project: Optional[str] = None,
     ) -> None:
         self._should_print_logs = should_print_logs
         self._accepts_operations: bool = True
@@ -78,6 +87,12 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
             signal_queue=signal_queue,
             data_path=data_path,
             serializer=serializer,
+            sink=sink,
+            # pending operations are sent at least once per flush period anyway
+            linger=min(linger, sleep_time),
+            max_batch_bytes=max_batch_bytes,
+            adaptive_batching=adaptive_batching,
+            project=project,
         )
 
         self._consumer = ConsumerThread(
@@ -112,8 +127,23 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
 
         step = try_get_step(op)
         self._last_version = self.processing_resources.disk_queue.put(op, category=step)
+        self._after_enqueue(wait=wait)
 
-        if _queue_has_enough_space(self.processing_resources.disk_queue.size(), self._processing_resources.batch_size):
+    @ensure_disk_not_overutilize
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        if not self._accepts_operations:
+            warn_once("Not accepting operations", exception=NeptuneWarning)
+            return
+
+        if not ops:
+            return
+
+        steps = [try_get_step(op) for op in ops]
+        self._last_version = self.processing_resources.disk_queue.put_many(ops, categories=steps)
+        self._after_enqueue(wait=wait)
+
+    def _after_enqueue(self, *, wait: bool) -> None:
+        if self._processing_resources.batch_scheduler.on_enqueued():
             self._consumer.wake_up()
         if wait:
             self.wait()
@@ -131,6 +161,7 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
     def wait(self) -> None:
         self.flush()
         waiting_for_version = self._last_version
+        self._processing_resources.batch_scheduler.request_drain()
         self._consumer.wake_up()
 
         # Probably reentering lock just for sure
@@ -151,6 +182,7 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         self.flush()
         if self._consumer.is_running():
             self._consumer.disable_sleep()
+            self._processing_resources.batch_scheduler.request_drain()
             self._consumer.wake_up()
             self._queue_observer.wait_for_queue_empty(
                 seconds=seconds,
@@ -173,7 +205,3 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
     def close(self) -> None:
         self._accepts_operations = False
         super().close()
-
-
-def _queue_has_enough_space(queue_size: int, batch_size: int) -> bool:
-    return queue_size > batch_size / 2
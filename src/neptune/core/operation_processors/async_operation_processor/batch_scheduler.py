@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+__all__ = ["BatchScheduler"]
+
+import threading
+from time import monotonic
+from typing import (
+    Optional,
+    Union,
+)
+
+from neptune.core.components.queue.aggregating_disk_queue import AggregatingDiskQueue
+from neptune.core.components.queue.disk_queue import DiskQueue
+
+# the batch never shrinks below this fraction of its maximum size, and grows back by the same amount
+MIN_BATCH_OPS_DIVISOR = 16
+# a send is considered stable when it takes at most this many times the average send latency
+LATENCY_TOLERANCE = 1.5
+LATENCY_SMOOTHING = 0.2
+
+
+class BatchScheduler:
+    """Decides when the consumer sends pending operations, trading latency for throughput.
+
+    The consumer is woken up as soon as `max_batch_ops` operations or `max_batch_bytes` bytes are pending,
+    and otherwise sends whatever is pending once the oldest operation has waited for `linger` seconds.
+    With `adaptive` set, the number of operations sent at once is halved whenever sending backs off,
+    and grows back towards `max_batch_ops` with every send whose latency is stable.
+    """
+
+    def __init__(
+        self,
+        queue: Union[DiskQueue, AggregatingDiskQueue],
+        linger: float,
+        max_batch_ops: int,
+        max_batch_bytes: int,
+        adaptive: bool = True,
+    ) -> None:
+        self._queue = queue
+        self._linger: float = max(0.0, linger)
+        self._max_batch_ops: int = max(1, max_batch_ops)
+        self._min_batch_ops: int = max(1, self._max_batch_ops // MIN_BATCH_OPS_DIVISOR)
+        self._max_batch_bytes: int = max_batch_bytes
+        self._adaptive: bool = adaptive
+
+        self._lock = threading.Lock()
+        self._batch_ops: int = self._max_batch_ops
+        self._first_pending_at: Optional[float] = None
+        self._drain_requested: bool = False
+        self._average_latency: Optional[float] = None
+
+    @property
+    def linger(self) -> float:
+        return self._linger
+
+    @property
+    def batch_ops(self) -> int:
+        """Number of operations currently sent at once."""
+        return self._batch_ops
+
+    @property
+    def max_batch_bytes(self) -> int:
+        return self._max_batch_bytes
+
+    def on_enqueued(self) -> bool:
+        """Notes that operations were put to the queue, returning whether the consumer should be woken up.
+
+        Besides full batches, the consumer is woken up when operations become pending, so that it sleeps
+        for no longer than `linger`.
+        """
+        with self._lock:
+            if self._first_pending_at is None:
+                self._first_pending_at = monotonic()
+                return True
+            return self._linger == 0 or self._is_full()
+
+    def request_drain(self) -> None:
+        """Makes pending operations due immediately, regardless of `linger`."""
+        with self._lock:
+            self._drain_requested = True
+
+    def is_due(self) -> bool:
+        with self._lock:
+            if self._queue.size() <= 0:
+                return False
+            # operations of unknown age were left by a previous drain or session
+            if self._drain_requested or self._first_pending_at is None:
+                return True
+            return monotonic() - self._first_pending_at >= self._linger or self._is_full()
+
+    def time_until_due(self) -> Optional[float]:
+        """Returns how long the consumer may sleep before pending operations are due, None if nothing is pending."""
+        with self._lock:
+            # the queue is checked under the lock, so operations enqueued in the meantime always wake the consumer
+            if self._queue.size() <= 0:
+                self._first_pending_at = None
+                return None
+            if self._drain_requested:
+                return 0.0
+            if self._first_pending_at is None:
+                return None
+            return max(0.0, self._first_pending_at + self._linger - monotonic())
+
+    def on_drain(self) -> None:
+        """Notes that the consumer started sending all pending operations."""
+        with self._lock:
+            self._first_pending_at = None
+            self._drain_requested = False
+
+    def on_sent(self, latency: float, backed_off: bool) -> bool:
+        """Adapts the batch to a completed send, returning whether the number of operations sent at once changed."""
+        if not self._adaptive:
+            return False
+
+        with self._lock:
+            previous = self._batch_ops
+            if backed_off:
+                self._batch_ops = max(self._min_batch_ops, self._batch_ops // 2)
+                # latency measured with retries says nothing about the server
+                self._average_latency = None
+                return self._batch_ops != previous
+
+            average = self._average_latency
+            if average is not None and latency <= average * LATENCY_TOLERANCE:
+                self._batch_ops = min(self._max_batch_ops, self._batch_ops + self._min_batch_ops)
+            self._average_latency = latency if average is None else average + LATENCY_SMOOTHING * (latency - average)
+            return self._batch_ops != previous
+
+    def _is_full(self) -> bool:
+        return self._queue.size() >= self._batch_ops or self._queue.pending_bytes >= self._max_batch_bytes
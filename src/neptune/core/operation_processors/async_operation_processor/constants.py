@@ -14,7 +14,12 @@
 # limitations under the License.
 #
 
-__all__ = ["STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS", "STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS"]
+__all__ = [
+    "STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS",
+    "STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS",
+    "DEFAULT_LINGER_MS",
+    "DEFAULT_MAX_BATCH_BYTES",
+]
 
 import os
 
@@ -23,3 +28,6 @@ from neptune.internal.parameters import DEFAULT_STOP_TIMEOUT
 
 STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS = 30.0
 STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS = float(os.getenv(NEPTUNE_SYNC_AFTER_STOP_TIMEOUT, DEFAULT_STOP_TIMEOUT))
+
+DEFAULT_LINGER_MS = 500
+DEFAULT_MAX_BATCH_BYTES = 1024**2
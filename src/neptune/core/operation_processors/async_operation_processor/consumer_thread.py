@@ -16,18 +16,28 @@
 
 __all__ = ["ConsumerThread"]
 
-from time import time
+from time import (
+    monotonic,
+    time,
+)
 from typing import (
     List,
     Optional,
 )
 
+from neptune.api.operation_to_api import coalesce_operations
+from neptune.api.operations import Serializable
 from neptune.core.operation_processors.async_operation_processor.processing_resources import ProcessingResources
 from neptune.core.operations.operation import Operation
 from neptune.internal.daemon import Daemon
+from neptune.internal.exceptions import (
+    NeptuneConnectionLostException,
+    NeptuneException,
+)
 from neptune.internal.signals_processing.utils import (
     signal_batch_lag,
     signal_batch_processed,
+    signal_batch_scheduling,
     signal_batch_started,
 )
 
@@ -43,6 +53,7 @@ class ConsumerThread(Daemon):
         self._last_flush: float = 0.0
 
     def run(self) -> None:
+        self._signal_batch_scheduling()
         try:
             super().run()
         except Exception as e:
@@ -56,32 +67,38 @@ class ConsumerThread(Daemon):
             self._last_flush = ts
             self._processing_resources.disk_queue.flush()
 
+        scheduler = self._processing_resources.batch_scheduler
+        if not scheduler.is_due():
+            return
+
+        scheduler.on_drain()
+        # records put since the last flush may still be buffered by the writer
+        self._processing_resources.disk_queue.flush_writer()
         while True:
             batch = self._processing_resources.disk_queue.get_batch(self._processing_resources.batch_size)
             if not batch:
                 return
 
             signal_batch_started(queue=self._processing_resources.signals_queue)
-            self.process_batch([element.obj for element in batch], batch[-1].ver, batch[-1].at)
+            self.process_batch([element.obj.obj for element in batch], batch[-1].ver, batch[-1].at)
 
-    @Daemon.ConnectionRetryWrapper(
-        kill_message=(
-            "Killing Neptune asynchronous thread. All data is safe on disk and can be later"
-            " synced manually using `neptune sync` command."
-        )
-    )
     def process_batch(self, batch: List[Operation], version: int, occurred_at: Optional[float] = None) -> None:
         if occurred_at is not None:
             signal_batch_lag(queue=self._processing_resources.signals_queue, lag=time() - occurred_at)
 
-        expected_count = len(batch)
-        version_to_ack = version - expected_count
+        coalesced = coalesce_operations(batch)
+        first_version = version - len(batch)
+        submitted = 0
         while True:
-            # TODO: Add proper batch processing logic here once backend is ready
+            if submitted < len(coalesced.operations):
+                accepted = self._send(coalesced.operations[submitted:])
+                if accepted is None:
+                    # interrupted while retrying, unacknowledged operations stay on disk
+                    return
+                submitted += accepted
 
             signal_batch_processed(queue=self._processing_resources.signals_queue)
-            processed_count = len(batch)
-            version_to_ack += processed_count
+            version_to_ack = first_version + coalesced.covered_count(submitted)
 
             with self._processing_resources.waiting_cond:
                 self._processing_resources.disk_queue.ack(version_to_ack)
@@ -91,3 +108,40 @@ class ConsumerThread(Daemon):
                 if version_to_ack == version:
                     self._processing_resources.waiting_cond.notify_all()
                     return
+
+    def _next_sleep_time(self) -> float:
+        if self._sleep_time <= 0:
+            return 0
+        until_due = self._processing_resources.batch_scheduler.time_until_due()
+        return self._sleep_time if until_due is None else min(self._sleep_time, until_due)
+
+    def _send(self, operations: List[Serializable]) -> Optional[int]:
+        backoff_count = self.backoff_count
+        started = monotonic()
+        accepted: Optional[int] = self._submit(operations)
+        if accepted is not None:
+            backed_off = self.backoff_count != backoff_count
+            if self._processing_resources.batch_scheduler.on_sent(monotonic() - started, backed_off=backed_off):
+                self._signal_batch_scheduling()
+        return accepted
+
+    def _signal_batch_scheduling(self) -> None:
+        scheduler = self._processing_resources.batch_scheduler
+        signal_batch_scheduling(
+            queue=self._processing_resources.signals_queue,
+            linger=scheduler.linger,
+            max_batch_ops=scheduler.batch_ops,
+            max_batch_bytes=scheduler.max_batch_bytes,
+        )
+
+    @Daemon.ConnectionRetryWrapper(
+        kill_message=(
+            "Killing Neptune asynchronous thread. All data is safe on disk and can be later"
+            " synced manually using `neptune sync` command."
+        )
+    )
+    def _submit(self, operations: List[Serializable]) -> int:
+        accepted = self._processing_resources.sink.submit(operations)
+        if accepted <= 0:
+            raise NeptuneConnectionLostException(NeptuneException("Ingestion sink did not accept any operation"))
+        return accepted
@@ -29,6 +29,10 @@ from typing import (
     Tuple,
 )
 
+from neptune.api.ingestion_sink import (
+    IngestionSink,
+    NullIngestionSink,
+)
 from neptune.constants import ASYNC_DIRECTORY
 from neptune.core.components.abstract import (
     Resource,
@@ -37,6 +41,11 @@ from neptune.core.components.abstract import (
 from neptune.core.components.metadata_file import MetadataFile
 from neptune.core.components.operation_storage import OperationStorage
 from neptune.core.components.queue.aggregating_disk_queue import AggregatingDiskQueue
+from neptune.core.operation_processors.async_operation_processor.batch_scheduler import BatchScheduler
+from neptune.core.operation_processors.async_operation_processor.constants import (
+    DEFAULT_LINGER_MS,
+    DEFAULT_MAX_BATCH_BYTES,
+)
 from neptune.core.operation_processors.utils import (
     common_metadata,
     get_container_full_path,
@@ -57,15 +66,20 @@ class ProcessingResources(WithResources):
         batch_size: int = 1,
         data_path: Optional[Path] = None,
         serializer: Callable[[Operation], Dict[str, Any]] = lambda op: op.to_dict(),
+        sink: Optional[IngestionSink] = None,
+        linger: float = DEFAULT_LINGER_MS / 1000,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        adaptive_batching: bool = True,
+        project: Optional[str] = None,
     ) -> None:
-        self.batch_size: int = batch_size
+        self.sink: IngestionSink = sink if sink is not None else NullIngestionSink()
         self._data_path = (
             data_path if data_path else get_container_full_path(ASYNC_DIRECTORY, custom_id, container_type)
         )
 
         self.metadata_file = MetadataFile(
             data_path=self._data_path,
-            metadata=common_metadata(mode="async", custom_id=custom_id, container_type=container_type),
+            metadata=common_metadata(mode="async", custom_id=custom_id, container_type=container_type, project=project),
         )
         self.operation_storage = OperationStorage(data_path=self._data_path)
         self.disk_queue = AggregatingDiskQueue[Operation, float](
@@ -75,12 +89,24 @@ class ProcessingResources(WithResources):
             lock=lock,
         )
 
+        self.batch_scheduler = BatchScheduler(
+            queue=self.disk_queue,
+            linger=linger,
+            max_batch_ops=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            adaptive=adaptive_batching,
+        )
+
         self.waiting_cond = threading.Condition()
 
         self.signals_queue = signal_queue
 
         self.consumed_version: int = 0
 
+    @property
+    def batch_size(self) -> int:
+        return self.batch_scheduler.batch_ops
+
     @property
     def resources(self) -> Tuple[Resource, ...]:
         return self.metadata_file, self.operation_storage, self.disk_queue
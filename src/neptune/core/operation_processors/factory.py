@@ -19,16 +19,28 @@ __all__ = ["get_operation_processor"]
 import os
 import threading
 from queue import Queue
-from typing import TYPE_CHECKING
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
 
 from neptune.core.operation_processors.async_operation_processor import AsyncOperationProcessor
+from neptune.core.operation_processors.async_operation_processor.constants import (
+    DEFAULT_LINGER_MS,
+    DEFAULT_MAX_BATCH_BYTES,
+)
 from neptune.core.operation_processors.offline_operation_processor import OfflineOperationProcessor
 from neptune.core.operation_processors.operation_processor import OperationProcessor
 from neptune.core.operation_processors.read_only_operation_processor import ReadOnlyOperationProcessor
 from neptune.core.operation_processors.sync_operation_processor import SyncOperationProcessor
 from neptune.core.typing.container_type import ContainerType
 from neptune.core.typing.id_formats import CustomId
-from neptune.envs import NEPTUNE_ASYNC_BATCH_SIZE
+from neptune.envs import (
+    NEPTUNE_ASYNC_ADAPTIVE_BATCHING,
+    NEPTUNE_ASYNC_BATCH_SIZE,
+    NEPTUNE_ASYNC_LINGER_MS,
+    NEPTUNE_ASYNC_MAX_BATCH_BYTES,
+)
 from neptune.objects.mode import Mode
 
 if TYPE_CHECKING:
@@ -42,6 +54,7 @@ def get_operation_processor(
     lock: threading.RLock,
     flush_period: float,
     queue: "Queue[Signal]",
+    project: Optional[str] = None,
 ) -> OperationProcessor:
     if mode == Mode.ASYNC:
         return AsyncOperationProcessor(
@@ -50,7 +63,11 @@ def get_operation_processor(
             lock=lock,
             sleep_time=flush_period,
             batch_size=int(os.environ.get(NEPTUNE_ASYNC_BATCH_SIZE) or "1000"),
+            linger=float(os.environ.get(NEPTUNE_ASYNC_LINGER_MS) or DEFAULT_LINGER_MS) / 1000,
+            max_batch_bytes=int(os.environ.get(NEPTUNE_ASYNC_MAX_BATCH_BYTES) or DEFAULT_MAX_BATCH_BYTES),
+            adaptive_batching=os.environ.get(NEPTUNE_ASYNC_ADAPTIVE_BATCHING, "True").lower() in ("true", "t", "1"),
             signal_queue=queue,
+            project=project,
         )
     elif mode in {Mode.SYNC, Mode.DEBUG}:
         return SyncOperationProcessor(custom_id=custom_id, container_type=container_type)
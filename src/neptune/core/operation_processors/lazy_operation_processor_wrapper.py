@@ -22,6 +22,7 @@ from pathlib import Path
 from typing import (
     Any,
     Callable,
+    List,
     Optional,
     TypeVar,
 )
@@ -83,6 +84,10 @@ class LazyOperationProcessorWrapper(OperationProcessor):
     def enqueue_operation(self, op: Operation, *, wait: bool) -> None:
         self._operation_processor.enqueue_operation(op, wait=wait)
 
+    @trigger_evaluation
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        self._operation_processor.enqueue_operations(ops, wait=wait)
+
     @property
     @trigger_evaluation
     def operation_storage(self) -> OperationStorage:
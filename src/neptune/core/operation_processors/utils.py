@@ -30,6 +30,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Optional,
 )
 
 from neptune.constants import NEPTUNE_DATA_DIRECTORY
@@ -62,11 +63,14 @@ def get_container_full_path(type_dir: str, custom_id: "CustomId", container_type
     return neptune_data_dir / type_dir / get_container_dir(custom_id=custom_id, container_type=container_type)
 
 
-def common_metadata(mode: str, custom_id: "CustomId", container_type: "ContainerType") -> Dict[str, Any]:
+def common_metadata(
+    mode: str, custom_id: "CustomId", container_type: "ContainerType", project: Optional[str] = None
+) -> Dict[str, Any]:
     return {
         "mode": mode,
         "customId": custom_id,
         "containerType": container_type,
+        "project": project,
         "structureVersion": StructureVersion.DIRECT_DIRECTORY.value,
         "os": platform.platform(),
         "pythonVersion": sys.version,
@@ -37,12 +37,14 @@ from typing import (
     Generic,
     List,
     Optional,
+    Sequence,
     Type,
     TypeVar,
     Union,
 )
 
 from neptune.core.components.operation_storage import OperationStorage
+from neptune.core.operations.series_columns import SeriesColumns
 from neptune.exceptions import MalformedOperation
 
 if TYPE_CHECKING:
@@ -204,17 +206,27 @@ class LogSeriesValue(Generic[T]):
 class LogFloats(LogOperation):
     ValueType = LogSeriesValue[float]
 
-    values: List[ValueType]
+    values: Sequence[ValueType]
 
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_log_floats(self)
 
     def to_dict(self) -> Dict[str, Any]:
+        if isinstance(self.values, SeriesColumns):
+            return {**super().to_dict(), "values": self.values.to_dict()}
         return {**super().to_dict(), "values": [value.to_dict() for value in self.values]}
 
     @classmethod
     def from_dict(cls, data: dict) -> "LogFloats":
+        if isinstance(data["values"], dict):
+            return cls(data["path"], SeriesColumns.from_dict(data["values"], cls.ValueType))
         return cls(
             data["path"],
             [cls.ValueType.from_dict(value) for value in data["values"]],  # type: ignore[misc]
         )
+
+    @classmethod
+    def from_columns(
+        cls, path: List[str], values: List[float], steps: List[Optional[float]], timestamps: List[float]
+    ) -> "LogFloats":
+        return cls(path, SeriesColumns(values, steps, timestamps, cls.ValueType))
@@ -0,0 +1,136 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SeriesColumns"]
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+ItemT = TypeVar("ItemT")
+
+
+class SeriesColumns(Sequence[ItemT], Generic[T, ItemT]):
+    """Points of a series operation stored as parallel `values`, `steps` and `timestamps` lists.
+
+    Behaves like a read-only list of `item_type(value, step, ts)` objects, which are created only when accessed,
+    so code written against row-based operations keeps working while producers and serializers
+    deal with plain lists.
+    """
+
+    __slots__ = ("values", "steps", "timestamps", "_item_type")
+
+    def __init__(
+        self,
+        values: List[T],
+        steps: List[Optional[float]],
+        timestamps: List[float],
+        item_type: Callable[[T, Optional[float], float], ItemT],
+    ) -> None:
+        if not len(values) == len(steps) == len(timestamps):
+            raise ValueError(
+                f"Series columns must have equal lengths (got {len(values)}, {len(steps)} and {len(timestamps)})"
+            )
+        self.values = values
+        self.steps = steps
+        self.timestamps = timestamps
+        self._item_type = item_type
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> ItemT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "SeriesColumns[T, ItemT]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ItemT, "SeriesColumns[T, ItemT]"]:
+        if isinstance(index, slice):
+            return SeriesColumns(self.values[index], self.steps[index], self.timestamps[index], self._item_type)
+        return self._item_type(self.values[index], self.steps[index], self.timestamps[index])
+
+    def __iter__(self) -> Iterator[ItemT]:
+        item_type = self._item_type
+        for value, step, ts in zip(self.values, self.steps, self.timestamps):
+            yield item_type(value, step, ts)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SeriesColumns):
+            return self.values == other.values and self.steps == other.steps and self.timestamps == other.timestamps
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __add__(self, other: Any) -> Union["SeriesColumns[T, ItemT]", List[ItemT]]:
+        if isinstance(other, SeriesColumns):
+            return SeriesColumns(
+                self.values + other.values,
+                self.steps + other.steps,
+                self.timestamps + other.timestamps,
+                self._item_type,
+            )
+        if isinstance(other, list):
+            return list(self) + other
+        return NotImplemented
+
+    def __radd__(self, other: Any) -> List[ItemT]:
+        if isinstance(other, list):
+            return other + list(self)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SeriesColumns(values={self.values!r}, steps={self.steps!r}, timestamps={self.timestamps!r})"
+
+    @staticmethod
+    def concat(chunks: Sequence["SeriesColumns[T, ItemT]"]) -> "SeriesColumns[T, ItemT]":
+        """Concatenates columns of all `chunks` in a single pass."""
+        values: List[T] = []
+        steps: List[Optional[float]] = []
+        timestamps: List[float] = []
+        for chunk in chunks:
+            values.extend(chunk.values)
+            steps.extend(chunk.steps)
+            timestamps.extend(chunk.timestamps)
+        return SeriesColumns(values, steps, timestamps, chunks[0]._item_type)
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        return {"value": self.values, "step": self.steps, "ts": self.timestamps}
+
+    @staticmethod
+    def from_dict(
+        data: Dict[str, List[Any]],
+        item_type: Callable[[Any, Optional[float], float], ItemT],
+    ) -> "SeriesColumns[Any, ItemT]":
+        values = data["value"]
+        steps = data.get("step")
+        return SeriesColumns(
+            list(values),
+            list(steps) if steps is not None else [None] * len(values),
+            list(data["ts"]),
+            item_type,
+        )
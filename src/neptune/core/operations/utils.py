@@ -14,17 +14,33 @@
 # limitations under the License.
 #
 
-from typing import Optional
+__all__ = ["MULTIPLE_STEPS", "try_get_step"]
+
+from typing import (
+    Optional,
+    Union,
+)
 
 from neptune.core.operations.operation import (
     LogFloats,
     Operation,
 )
+from neptune.core.operations.series_columns import SeriesColumns
+from neptune.internal import operation as legacy_operation
 
+# Category of operations carrying points from more than one step. Keeps them apart from single-step batches
+# in the aggregating queue while still letting consecutive multi-step operations share a batch.
+MULTIPLE_STEPS = float("inf")
 
-def try_get_step(operation: Operation) -> Optional[float]:
-    if isinstance(operation, LogFloats):
-        # assumtion: there is at most one value in the LogFloats values list
-        return operation.values[0].step if operation.values else None
-    else:
+
+def try_get_step(operation: Union[Operation, legacy_operation.Operation]) -> Optional[float]:
+    if not isinstance(operation, (LogFloats, legacy_operation.LogFloats)) or not operation.values:
         return None
+
+    if isinstance(operation.values, SeriesColumns):
+        steps = operation.values.steps
+    else:
+        steps = [value.step for value in operation.values]
+
+    first_step = steps[0]
+    return first_step if steps.count(first_step) == len(steps) else MULTIPLE_STEPS
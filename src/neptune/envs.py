@@ -24,16 +24,33 @@ __all__ = [
     "NEPTUNE_NOTEBOOK_PATH",
     "NEPTUNE_RETRIES_TIMEOUT_ENV",
     "NEPTUNE_SYNC_BATCH_TIMEOUT_ENV",
+    "NEPTUNE_SYNC_READ_AHEAD_BATCHES",
+    "NEPTUNE_CONTAINER_LOOKUP_CACHE_TTL",
     "NEPTUNE_SUBPROCESS_KILL_TIMEOUT",
     "NEPTUNE_FETCH_TABLE_STEP_SIZE",
+    "NEPTUNE_FETCH_TABLE_PREFETCH",
+    "NEPTUNE_FETCH_SERIES_STEP_SIZE",
+    "NEPTUNE_FETCH_SERIES_MAX_WORKERS",
+    "NEPTUNE_SERIES_CACHE",
+    "NEPTUNE_SERIES_CACHE_MAX_SIZE",
     "NEPTUNE_SYNC_AFTER_STOP_TIMEOUT",
     "NEPTUNE_REQUEST_TIMEOUT",
     "NEPTUNE_MAX_DISK_USAGE",
     "NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED",
+    "NEPTUNE_DISK_USAGE_HYSTERESIS",
+    "NEPTUNE_DISK_USAGE_SAMPLING_PERIOD",
     "NEPTUNE_ENABLE_DEFAULT_ASYNC_LAG_CALLBACK",
     "NEPTUNE_ENABLE_DEFAULT_ASYNC_NO_PROGRESS_CALLBACK",
     "NEPTUNE_USE_PROTOCOL_BUFFERS",
     "NEPTUNE_ASYNC_BATCH_SIZE",
+    "NEPTUNE_ASYNC_LINGER_MS",
+    "NEPTUNE_ASYNC_MAX_BATCH_BYTES",
+    "NEPTUNE_ASYNC_ADAPTIVE_BATCHING",
+    "NEPTUNE_TOKEN_CACHE",
+    "NEPTUNE_QUEUE_OFFSET_COMMIT_PERIOD",
+    "NEPTUNE_QUEUE_OFFSET_COMMIT_COUNT",
+    "NEPTUNE_QUEUE_LOG_FORMAT",
+    "NEPTUNE_SWAGGER_CACHE_MAX_AGE",
 ]
 
 from neptune.internal.envs import (
@@ -57,10 +74,24 @@ NEPTUNE_NOTEBOOK_PATH = "NEPTUNE_NOTEBOOK_PATH"
 
 NEPTUNE_SYNC_BATCH_TIMEOUT_ENV = "NEPTUNE_SYNC_BATCH_TIMEOUT"
 
+NEPTUNE_SYNC_READ_AHEAD_BATCHES = "NEPTUNE_SYNC_READ_AHEAD_BATCHES"
+
+NEPTUNE_CONTAINER_LOOKUP_CACHE_TTL = "NEPTUNE_CONTAINER_LOOKUP_CACHE_TTL"
+
 NEPTUNE_SUBPROCESS_KILL_TIMEOUT = "NEPTUNE_SUBPROCESS_KILL_TIMEOUT"
 
 NEPTUNE_FETCH_TABLE_STEP_SIZE = "NEPTUNE_FETCH_TABLE_STEP_SIZE"
 
+NEPTUNE_FETCH_TABLE_PREFETCH = "NEPTUNE_FETCH_TABLE_PREFETCH"
+
+NEPTUNE_FETCH_SERIES_STEP_SIZE = "NEPTUNE_FETCH_SERIES_STEP_SIZE"
+
+NEPTUNE_FETCH_SERIES_MAX_WORKERS = "NEPTUNE_FETCH_SERIES_MAX_WORKERS"
+
+NEPTUNE_SERIES_CACHE = "NEPTUNE_SERIES_CACHE"
+
+NEPTUNE_SERIES_CACHE_MAX_SIZE = "NEPTUNE_SERIES_CACHE_MAX_SIZE"
+
 NEPTUNE_SYNC_AFTER_STOP_TIMEOUT = "NEPTUNE_SYNC_AFTER_STOP_TIMEOUT"
 
 NEPTUNE_REQUEST_TIMEOUT = "NEPTUNE_REQUEST_TIMEOUT"
@@ -73,6 +104,26 @@ NEPTUNE_MAX_DISK_USAGE = "NEPTUNE_MAX_DISK_USAGE"
 
 NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED = "NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED"
 
+NEPTUNE_DISK_USAGE_HYSTERESIS = "NEPTUNE_DISK_USAGE_HYSTERESIS"
+
+NEPTUNE_DISK_USAGE_SAMPLING_PERIOD = "NEPTUNE_DISK_USAGE_SAMPLING_PERIOD"
+
 NEPTUNE_ASYNC_BATCH_SIZE = "NEPTUNE_ASYNC_BATCH_SIZE"
 
+NEPTUNE_ASYNC_LINGER_MS = "NEPTUNE_ASYNC_LINGER_MS"
+
+NEPTUNE_ASYNC_MAX_BATCH_BYTES = "NEPTUNE_ASYNC_MAX_BATCH_BYTES"
+
+NEPTUNE_ASYNC_ADAPTIVE_BATCHING = "NEPTUNE_ASYNC_ADAPTIVE_BATCHING"
+
+NEPTUNE_TOKEN_CACHE = "NEPTUNE_TOKEN_CACHE"
+
+NEPTUNE_QUEUE_OFFSET_COMMIT_PERIOD = "NEPTUNE_QUEUE_OFFSET_COMMIT_PERIOD"
+
+NEPTUNE_QUEUE_OFFSET_COMMIT_COUNT = "NEPTUNE_QUEUE_OFFSET_COMMIT_COUNT"
+
+NEPTUNE_QUEUE_LOG_FORMAT = "NEPTUNE_QUEUE_LOG_FORMAT"
+
+NEPTUNE_SWAGGER_CACHE_MAX_AGE = "NEPTUNE_SWAGGER_CACHE_MAX_AGE"
+
 NEPTUNE_USE_PROTOCOL_BUFFERS = "NEPTUNE_USE_PROTOCOL_BUFFERS"
@@ -13,8 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["Handler"]
+__all__ = ["Handler", "SeriesLogger"]
 
+import threading
 from functools import wraps
 from typing import (
     TYPE_CHECKING,
@@ -24,6 +25,7 @@ from typing import (
     Dict,
     Iterable,
     Iterator,
+    List,
     Optional,
     Union,
 )
@@ -34,8 +36,10 @@ from neptune.attributes.series.float_series import FloatSeries
 from neptune.attributes.series.string_series import StringSeries
 from neptune.attributes.sets.string_set import StringSet
 from neptune.exceptions import (
+    FetchAttributeNotFoundException,
     MissingFieldException,
     NeptuneCannotChangeStageManually,
+    NeptuneException,
     NeptuneUnsupportedFunctionalityException,
     NeptuneUserApiInputException,
 )
@@ -45,10 +49,12 @@ from neptune.internal.utils import (
     is_dict_like,
     is_float,
     is_float_like,
+    is_numeric_array,
     is_string,
     is_stringify_value,
     verify_type,
 )
+from neptune.internal.utils.logger import get_logger
 from neptune.internal.utils.paths import (
     join_paths,
     parse_path,
@@ -64,6 +70,8 @@ from neptune.utils import stringify_unsupported
 if TYPE_CHECKING:
     from neptune.objects import NeptuneObject
 
+logger = get_logger()
+
 
 def feature_temporarily_unavailable(_: Callable[..., Any]) -> Callable[..., Any]:
     def wrapper(*_, **__):
@@ -321,6 +329,27 @@ class Handler(SupportsNamespaces):
                 self._container.set_attribute(self._path, attr)
             attr.log(value, step=step, timestamp=timestamp, wait=wait, **kwargs)
 
+    @check_protected_paths
+    def series_logger(self) -> "SeriesLogger":
+        """Returns a logger of the series field at this path, with less overhead per `append` call.
+
+        The field is looked up once rather than on every call, and plain `float` and `int` values are enqueued
+        without building intermediate value objects. Loggers are cached, so every call for the same path returns
+        the same logger.
+
+        Examples:
+            >>> import neptune
+            >>> run = neptune.init_run()
+            >>> loss = run["train/loss"].series_logger()
+            >>> for step in range(n_steps):
+            ...     loss.append(train_step(), step=step)
+        """
+        series_loggers = self._container._series_loggers
+        series_logger = series_loggers.get(self._path)
+        if series_logger is None:
+            series_logger = series_loggers.setdefault(self._path, SeriesLogger(self))
+        return series_logger
+
     @check_protected_paths
     def append(
         self,
@@ -360,6 +389,21 @@ class Handler(SupportsNamespaces):
         """
         if step is None:
             raise NeptuneUserApiInputException("Step must be provided")
+        if not kwargs and (type(value) is float or type(value) is int):
+            self.series_logger().append(value, step=step, timestamp=timestamp, wait=wait)
+            return
+
+        self._append(value, step=step, timestamp=timestamp, wait=wait, **kwargs)
+
+    def _append(
+        self,
+        value: Union[dict, Any],
+        *,
+        step: float,
+        timestamp: Optional[float] = None,
+        wait: bool = False,
+        **kwargs,
+    ) -> None:
         verify_type("step", step, (int, float))
         verify_type("timestamp", timestamp, (int, float, type(None)))
         if step is not None:
@@ -724,6 +768,89 @@ class Handler(SupportsNamespaces):
                 self._container._pop_impl(parse_path(path), wait=wait)
 
 
+class SeriesLogger:
+    """Appends values to the series field at a single path of an object, obtained with `Handler.series_logger`.
+
+    The field is looked up again only after the structure of the object changes. Plain `float` and `int` values
+    appended to a float series are enqueued as ready operations, other values go through `Handler.append`.
+    Writers that do not track steps themselves, such as log handlers, take them from `reserve_steps`.
+    """
+
+    __slots__ = ("_handler", "_structure", "_attribute", "_structure_version", "_steps_lock", "_next_step")
+
+    def __init__(self, handler: Handler) -> None:
+        self._handler = handler
+        self._structure = handler.container._structure
+        self._attribute: Optional[Any] = None
+        self._structure_version = -1
+        self._steps_lock = threading.Lock()
+        self._next_step: Optional[int] = None
+
+    def append(self, value: Any, *, step: float, timestamp: Optional[float] = None, wait: bool = False) -> None:
+        """Appends `value` to the series like `Handler.append`."""
+        if type(value) is float or type(value) is int:
+            attribute = self._get_attribute()
+            if isinstance(attribute, FloatSeries):
+                if step is None:
+                    raise NeptuneUserApiInputException("Step must be provided")
+                verify_type("step", step, (int, float))
+                verify_type("timestamp", timestamp, (int, float, type(None)))
+                attribute.append_float(value, step=step, timestamp=timestamp, wait=wait)
+                return
+
+        self._handler._append(value, step=step, timestamp=timestamp, wait=wait)
+
+    def extend(
+        self,
+        values: ExtendDictT,
+        *,
+        steps: Collection[float],
+        timestamps: Optional[Collection[float]] = None,
+        wait: bool = False,
+    ) -> None:
+        """Appends `values` to the series like `Handler.extend`."""
+        self._handler.extend(values, steps=steps, timestamps=timestamps, wait=wait)
+
+    def reserve_steps(self, count: int) -> List[int]:
+        """Returns `count` consecutive steps following the ones reserved before, by any writer of the path.
+
+        The steps follow the last step the series already has, fetched once on the first call.
+        """
+        with self._steps_lock:
+            if self._next_step is None:
+                self._next_step = self._first_free_step()
+            first_step = self._next_step
+            self._next_step += count
+        return list(range(first_step, first_step + count))
+
+    def _first_free_step(self) -> int:
+        # any object may already hold steps of the series, e.g. when resumed with `with_id` or `custom_run_id`
+        container = self._handler.container
+        if isinstance(self._get_attribute(), FloatSeries):
+            get_series_attribute = container._backend.get_float_series_attribute
+        else:
+            # the structure of a resumed object is not fetched, so the series is assumed to be of strings
+            get_series_attribute = container._backend.get_string_series_attribute
+        try:
+            last_step = get_series_attribute(
+                container._custom_id, container.container_type, parse_path(self._handler._path)
+            ).last_step
+        except FetchAttributeNotFoundException:
+            return 0
+        except NeptuneException as e:
+            logger.debug("Could not fetch the last step of %s: %s", self._handler._path, e)
+            return 0
+        return int(last_step) + 1 if last_step is not None else 0
+
+    def _get_attribute(self) -> Optional[Any]:
+        # the version is read first, so a change made during the lookup invalidates the cached attribute
+        version = self._structure.version
+        if version != self._structure_version:
+            self._attribute = self._handler.container.get_attribute(self._handler._path)
+            self._structure_version = version
+        return self._attribute
+
+
 class ExtendUtils:
     @staticmethod
     def transform_to_extend_format(value):
@@ -766,7 +893,7 @@ class ExtendUtils:
         if isinstance(values, Namespace) or is_dict_like(values):
             for val in values.values():
                 yield from ExtendUtils.generate_leaf_collection_lengths(val)
-        elif is_collection(values):
+        elif is_collection(values) or is_numeric_array(values):
             yield len(values)
         else:
             raise NeptuneUserApiInputException("Values must be a collection or namespace leafs must be collections")
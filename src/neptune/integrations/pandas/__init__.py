@@ -17,15 +17,18 @@ from __future__ import annotations
 
 __all__ = ["to_pandas"]
 
+from array import array
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Dict,
+    List,
     Optional,
     Tuple,
     Union,
 )
 
+import numpy as np
 import pandas as pd
 
 from neptune.api.models import (
@@ -102,12 +105,94 @@ def sort_key(field: str) -> Tuple[int, str]:
     return 1, field
 
 
-def to_pandas(table: Table) -> pd.DataFrame:
-
-    to_value_visitor = FieldToPandasValueVisitor()
-    rows = dict((n, make_row(entry, to_value_visitor)) for (n, entry) in enumerate(table._entries))
+class _Column:
+    """Values of one attribute, stored along with the indices of the rows that have them.
+
+    Floats, ints and bools are kept in typed `array` buffers. A column of other or mixed types falls back to
+    a list of Python objects, which pandas infers the dtype of.
+    """
+
+    __slots__ = ("typecode", "rows", "values")
+
+    def __init__(self, value: PANDAS_AVAILABLE_TYPES) -> None:
+        self.typecode = _typecode(value)
+        self.rows = array("q")
+        self.values: Union[array, List[PANDAS_AVAILABLE_TYPES]] = array(self.typecode) if self.typecode else []
+
+    def append(self, row: int, value: PANDAS_AVAILABLE_TYPES) -> None:
+        typecode = _common_typecode(self.typecode, _typecode(value))
+        if typecode != self.typecode:
+            self._convert(typecode)
+        try:
+            self.values.append(value)
+        except OverflowError:
+            # Ints that do not fit in 64 bits
+            self._convert(None)
+            self.values.append(value)
+        self.rows.append(row)
+
+    def _convert(self, typecode: Optional[str]) -> None:
+        if typecode is None:
+            self.values = [bool(value) for value in self.values] if self.typecode == "b" else list(self.values)
+        else:
+            self.values = array(typecode, self.values)
+        self.typecode = typecode
+
+    def to_series(self, row_count: int) -> pd.Series:
+        rows = np.array(self.rows, dtype=np.int64)
+        complete = len(rows) == row_count
+
+        if self.typecode == "d" or (self.typecode == "q" and not complete):
+            data = np.full(row_count, np.nan)
+            data[rows] = np.array(self.values, dtype=np.float64)
+            return pd.Series(data, copy=False)
+        if self.typecode == "q":
+            return pd.Series(np.array(self.values, dtype=np.int64), copy=False)
+        if self.typecode == "b" and complete:
+            return pd.Series(np.array(self.values, dtype=np.bool_), copy=False)
+
+        data = np.full(row_count, np.nan, dtype=object)
+        data[rows] = [bool(value) for value in self.values] if self.typecode == "b" else self.values
+        return pd.Series(data, copy=False).infer_objects()
+
+
+def _typecode(value: PANDAS_AVAILABLE_TYPES) -> Optional[str]:
+    value_type = type(value)
+    if value_type is float:
+        return "d"
+    if value_type is int:
+        return "q"
+    if value_type is bool:
+        return "b"
+    return None
+
+
+def _common_typecode(current: Optional[str], new: Optional[str]) -> Optional[str]:
+    if current == new:
+        return current
+    if {current, new} == {"d", "q"}:
+        return "d"
+    return None
 
-    df = pd.DataFrame.from_dict(data=rows, orient="index")
-    df = df.reindex(sorted(df.columns, key=sort_key), axis="columns")
 
-    return df
+def to_pandas(table: Table) -> pd.DataFrame:
+    """Builds the data frame column by column while streaming entries, without materializing a dict per row."""
+    to_value_visitor = FieldToPandasValueVisitor()
+    columns: Dict[str, _Column] = dict()
+    row_count = 0
+
+    for row, entry in enumerate(table._entries):
+        for field in entry.fields:
+            value = to_value_visitor.visit(field)
+            if value is None:
+                continue
+            column = columns.get(field.path)
+            if column is None:
+                column = columns[field.path] = _Column(value)
+            column.append(row, value)
+        row_count = row + 1
+
+    return pd.DataFrame(
+        {path: columns[path].to_series(row_count) for path in sorted(columns, key=sort_key)},
+        index=pd.RangeIndex(row_count),
+    )
@@ -13,20 +13,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["NeptuneHandler"]
+__all__ = ["NeptuneHandler", "AsyncNeptuneHandler", "OverflowPolicy"]
 
 import logging
 import threading
+from collections import deque
+from enum import Enum
+from typing import (
+    Deque,
+    List,
+    Union,
+)
 
 from neptune import (
     Run,
     __version__,
 )
+from neptune.internal.daemon import Daemon
 from neptune.internal.state import ContainerState
 from neptune.internal.utils import verify_type
+from neptune.internal.warnings import (
+    NeptuneWarning,
+    warn_once,
+)
 
 INTEGRATION_VERSION_KEY = "source_code/integrations/neptune-python-logger"
 
+DEFAULT_FLUSH_PERIOD = 0.5
+DEFAULT_FLUSH_SIZE = 1000
+DEFAULT_MAX_BUFFERED_RECORDS = 100_000
+DEFAULT_SAMPLE_EVERY = 10
+
 
 class NeptuneHandler(logging.Handler):
     """Handler that sends the log records created by the logger to Neptune
@@ -65,6 +82,8 @@ class NeptuneHandler(logging.Handler):
         self._path = path if path else f"{run.monitoring_namespace}/python_logger"
         self._run = run
         self._thread_local = threading.local()
+        # steps are shared with other writers of the path
+        self._series = run[self._path].series_logger()
 
         self._run[INTEGRATION_VERSION_KEY] = __version__
 
@@ -76,6 +95,222 @@ class NeptuneHandler(logging.Handler):
             try:
                 self._thread_local.inside_write = True
                 message = self.format(record)
-                self._run[self._path].append(message)
+                [step] = self._series.reserve_steps(1)
+                self._series.append(message, step=step, timestamp=record.created)
             finally:
                 self._thread_local.inside_write = False
+
+
+class OverflowPolicy(str, Enum):
+    """What `AsyncNeptuneHandler` does with a record emitted while its buffer is full."""
+
+    BLOCK = "block"
+    """Waits until the background thread makes room for the record."""
+    DROP_OLDEST = "drop_oldest"
+    """Drops the oldest buffered record."""
+    SAMPLE = "sample"
+    """Keeps every `sample_every`-th record in place of the oldest buffered one and drops the others."""
+
+
+class AsyncNeptuneHandler(NeptuneHandler):
+    """Handler that sends the log records created by the logger to Neptune from a background thread
+
+    Unlike `NeptuneHandler`, emitting a record only appends it to a buffer, without taking any lock unless
+    the buffer is full. A background thread formats the buffered records and logs them with a single `extend`
+    call once `flush_period` seconds pass or `flush_size` records are buffered.
+
+    Args:
+        run (Run): An existing run reference (as returned by `neptune.init_run`)
+            Logger will send messages as a `StringSeries` field on this run.
+        level (int, optional): Log level of the handler. Defaults to `logging.NOTSET`,
+            which logs everything that matches logger's level.
+        path (str, optional): Path to the `StringSeries` field used for logging. Default to `None`.
+            If `None`, `'monitoring/python_logger'` is used.
+        flush_period (float, optional): Maximum time in seconds a record waits in the buffer. Defaults to 0.5.
+        flush_size (int, optional): Number of buffered records that triggers logging them. Defaults to 1000.
+        max_buffered_records (int, optional): Capacity of the buffer. Defaults to 100000.
+        overflow_policy (OverflowPolicy or str, optional): What happens to records emitted while the buffer is full:
+            `"block"`, `"drop_oldest"` or `"sample"`. Defaults to `"drop_oldest"`.
+        sample_every (int, optional): With the `"sample"` policy, every how many records emitted while the buffer
+            is full one is kept. Defaults to 10.
+
+    Examples:
+        >>> import logging
+        >>> import neptune
+        >>> from neptune.integrations.python_logger import AsyncNeptuneHandler
+
+        >>> logger = logging.getLogger("root_experiment")
+        >>> logger.setLevel(logging.DEBUG)
+
+        >>> run = neptune.init_run(project="neptune/sandbox")
+        >>> npt_handler = AsyncNeptuneHandler(run=run, overflow_policy="sample")
+        >>> logger.addHandler(npt_handler)
+
+        >>> logger.debug("Starting data preparation")
+        ...
+        >>> npt_handler.dropped_records
+        0
+    """
+
+    def __init__(
+        self,
+        *,
+        run: Run,
+        level=logging.NOTSET,
+        path: str = None,
+        flush_period: float = DEFAULT_FLUSH_PERIOD,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        max_buffered_records: int = DEFAULT_MAX_BUFFERED_RECORDS,
+        overflow_policy: Union[OverflowPolicy, str] = OverflowPolicy.DROP_OLDEST,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+    ):
+        verify_type("flush_period", flush_period, (int, float))
+        verify_type("flush_size", flush_size, int)
+        verify_type("max_buffered_records", max_buffered_records, int)
+        verify_type("overflow_policy", overflow_policy, (OverflowPolicy, str))
+        verify_type("sample_every", sample_every, int)
+
+        super().__init__(run=run, level=level, path=path)
+        self._flush_period = flush_period
+        self._flush_size = max(1, min(flush_size, max_buffered_records))
+        self._max_buffered_records = max(1, max_buffered_records)
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+        self._sample_every = max(1, sample_every)
+
+        # Appending to and popping from a deque are atomic, so emitting records needs no lock
+        self._records: Deque[logging.LogRecord] = deque()
+        self._data_available = threading.Event()
+        self._space_cond = threading.Condition(threading.Lock())
+        self._overflow_lock = threading.Lock()
+        self._overflowed_records = 0
+        self._dropped_records = 0
+        self._reported_dropped_records = 0
+        self._drain_lock = threading.Lock()
+        self._closed = False
+
+        self._draining_thread = self.DrainingThread(self, name="NeptuneThread_python_logger")
+        self._draining_thread.start()
+
+    @property
+    def dropped_records(self) -> int:
+        """Number of records dropped because the buffer was full."""
+        return self._dropped_records
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Same as `logging.Handler.handle`, without the handler lock, since `emit` is thread-safe
+        filtered = self.filter(record)
+        if isinstance(filtered, logging.LogRecord):
+            record = filtered
+        if filtered:
+            self.emit(record)
+        return bool(filtered)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # records emitted while logging to Neptune would feed back into the buffer
+        if self._closed or threading.get_ident() == self._draining_thread.ident:
+            return
+        if self._run.get_state() != ContainerState.STARTED.value:
+            return
+
+        if len(self._records) >= self._max_buffered_records and not self._make_room():
+            return
+
+        self._records.append(record)
+        if len(self._records) >= self._flush_size:
+            self._data_available.set()
+
+    def flush(self) -> None:
+        """Logs all buffered records on the calling thread."""
+        self._drain()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._draining_thread.interrupt()
+            self._data_available.set()
+            self._draining_thread.join()
+            with self._space_cond:
+                self._space_cond.notify_all()
+            self._drain()
+        super().close()
+
+    def _make_room(self) -> bool:
+        """Applies the overflow policy to a full buffer, returning whether the record is to be buffered."""
+        if self._overflow_policy == OverflowPolicy.BLOCK:
+            self._data_available.set()
+            with self._space_cond:
+                self._space_cond.wait_for(
+                    lambda: len(self._records) < self._max_buffered_records
+                    or self._closed
+                    or not self._draining_thread.is_alive()
+                )
+            if len(self._records) < self._max_buffered_records:
+                return True
+            self._count_dropped()
+            return False
+
+        with self._overflow_lock:
+            self._overflowed_records += 1
+            keep = (
+                self._overflow_policy == OverflowPolicy.DROP_OLDEST
+                or self._overflowed_records % self._sample_every == 0
+            )
+            self._dropped_records += 1
+        if keep:
+            try:
+                self._records.popleft()
+            except IndexError:
+                pass
+        return keep
+
+    def _count_dropped(self) -> None:
+        with self._overflow_lock:
+            self._dropped_records += 1
+
+    def _wait_for_records(self) -> None:
+        self._data_available.wait(timeout=self._flush_period)
+        self._data_available.clear()
+
+    def _drain(self) -> None:
+        with self._drain_lock:
+            records: List[logging.LogRecord] = []
+            # emitting threads may drop the oldest records concurrently
+            for _ in range(len(self._records)):
+                try:
+                    records.append(self._records.popleft())
+                except IndexError:
+                    break
+
+            if self._overflow_policy == OverflowPolicy.BLOCK:
+                with self._space_cond:
+                    self._space_cond.notify_all()
+
+            if self._dropped_records > self._reported_dropped_records:
+                self._reported_dropped_records = self._dropped_records
+                warn_once(
+                    f"Log records sent to '{self._path}' were emitted faster than they could be logged."
+                    " Some of them were not saved.",
+                    exception=NeptuneWarning,
+                )
+
+            messages = []
+            timestamps = []
+            for record in records:
+                try:
+                    messages.append(self.format(record))
+                    timestamps.append(record.created)
+                except Exception:
+                    self.handleError(record)
+
+            if messages and self._run.get_state() == ContainerState.STARTED.value:
+                self._series.extend(messages, steps=self._series.reserve_steps(len(messages)), timestamps=timestamps)
+
+    class DrainingThread(Daemon):
+        def __init__(self, handler: "AsyncNeptuneHandler", name: str):
+            super().__init__(sleep_time=0, name=name)
+            self._handler = handler
+
+        @Daemon.ConnectionRetryWrapper(kill_message="Killing Neptune python logger thread.")
+        def work(self) -> None:
+            self._handler._wait_for_records()
+            self._handler._drain()
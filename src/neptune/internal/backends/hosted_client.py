@@ -36,7 +36,10 @@ from packaging.version import parse
 from neptune.envs import NEPTUNE_REQUEST_TIMEOUT
 from neptune.exceptions import NeptuneClientUpgradeRequiredError
 from neptune.internal.backends.api_model import ClientConfig
-from neptune.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
+from neptune.internal.backends.swagger_client_wrapper import (
+    LazySwaggerClientWrapper,
+    SwaggerClientWrapper,
+)
 from neptune.internal.backends.utils import (
     NeptuneResponseAdapter,
     build_operation_url,
@@ -177,19 +180,13 @@ def create_http_client_with_auth(
 
 @cache
 def create_backend_client(client_config: ClientConfig, http_client: HttpClient) -> SwaggerClientWrapper:
-    return SwaggerClientWrapper(
-        create_swagger_client(
-            build_operation_url(client_config.api_url, BACKEND_SWAGGER_PATH),
-            http_client,
-        )
+    return LazySwaggerClientWrapper(
+        lambda: create_swagger_client(build_operation_url(client_config.api_url, BACKEND_SWAGGER_PATH), http_client)
     )
 
 
 @cache
 def create_leaderboard_client(client_config: ClientConfig, http_client: HttpClient) -> SwaggerClientWrapper:
-    return SwaggerClientWrapper(
-        create_swagger_client(
-            build_operation_url(client_config.api_url, LEADERBOARD_SWAGGER_PATH),
-            http_client,
-        )
+    return LazySwaggerClientWrapper(
+        lambda: create_swagger_client(build_operation_url(client_config.api_url, LEADERBOARD_SWAGGER_PATH), http_client)
     )
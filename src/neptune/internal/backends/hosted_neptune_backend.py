@@ -63,6 +63,7 @@ from neptune.api.proto.neptune_pb.api.model.series_values_pb2 import ProtoFloatS
 from neptune.api.searching_entries import iter_over_pages
 from neptune.core.components.operation_storage import OperationStorage
 from neptune.envs import (
+    NEPTUNE_FETCH_TABLE_PREFETCH,
     NEPTUNE_FETCH_TABLE_STEP_SIZE,
     NEPTUNE_USE_PROTOCOL_BUFFERS,
 )
@@ -155,6 +156,10 @@ class HostedNeptuneBackend(NeptuneBackend):
         self.backend_client = create_backend_client(self._client_config, self._http_client)
         self.leaderboard_client = create_leaderboard_client(self._client_config, self._http_client)
 
+    def close(self) -> None:
+        # the authenticator is shared with other backends, whose next request restarts the refresh
+        self._http_client.authenticator.auth.stop_background_refresh()
+
     def verify_feature_available(self, feature_name: str):
         if not self._client_config.has_feature(feature_name):
             raise NeptuneFeatureNotAvailableException(feature_name)
@@ -729,7 +734,10 @@ class HostedNeptuneBackend(NeptuneBackend):
         use_proto: Optional[bool] = None,
     ) -> Generator[LeaderboardEntry, None, None]:
         use_proto = use_proto if use_proto is not None else self.use_proto
+        # the page size adapts to the responses unless set explicitly
+        adaptive_step_size = not step_size and not os.getenv(NEPTUNE_FETCH_TABLE_STEP_SIZE)
         default_step_size = step_size or int(os.getenv(NEPTUNE_FETCH_TABLE_STEP_SIZE, "100"))
+        prefetch = int(os.getenv(NEPTUNE_FETCH_TABLE_PREFETCH, "4"))
 
         step_size = min(default_step_size, limit) if limit else default_step_size
 
@@ -757,6 +765,8 @@ class HostedNeptuneBackend(NeptuneBackend):
                 ascending=ascending,
                 sort_by_column_type=sort_by_column_type,
                 progress_bar=progress_bar,
+                prefetch=prefetch,
+                adaptive_step_size=adaptive_step_size,
                 use_proto=use_proto,
             )
         except HTTPNotFound:
@@ -324,13 +324,21 @@ class NeptuneBackendMock(NeptuneBackend):
         self, container_id: str, container_type: ContainerType, path: List[str]
     ) -> FloatSeriesField:
         val = self._get_attribute(container_id, container_type, path, FloatSeries)
-        return FloatSeriesField(path=path_to_str(path), last=val.values[-1] if val.values else None)
+        return FloatSeriesField(
+            path=path_to_str(path),
+            last=val.values[-1] if val.values else None,
+            last_step=len(val.values) - 1 if val.values else None,
+        )
 
     def get_string_series_attribute(
         self, container_id: str, container_type: ContainerType, path: List[str]
     ) -> StringSeriesField:
         val = self._get_attribute(container_id, container_type, path, StringSeries)
-        return StringSeriesField(path=path_to_str(path), last=val.values[-1] if val.values else None)
+        return StringSeriesField(
+            path=path_to_str(path),
+            last=val.values[-1] if val.values else None,
+            last_step=len(val.values) - 1 if val.values else None,
+        )
 
     def get_string_set_attribute(
         self, container_id: str, container_type: ContainerType, path: List[str]
@@ -16,6 +16,7 @@
 __all__ = ["OperationsPreprocessor"]
 
 import dataclasses
+import itertools
 import typing
 from enum import Enum
 from typing import (
@@ -24,6 +25,7 @@ from typing import (
     TypeVar,
 )
 
+from neptune.core.operations.series_columns import SeriesColumns
 from neptune.exceptions import MetadataInconsistency
 from neptune.internal.exceptions import InternalClientError
 from neptune.internal.operation import (
@@ -103,6 +105,31 @@ class _DataType(Enum):
     STRING_SET = "String Set"
 
 
+class _LogOperationBuilder:
+    """Collects consecutive log operations of one attribute and merges them into a single operation on demand.
+
+    Appending is O(1), so merging n operations copies every point once instead of once per merge.
+    """
+
+    def __init__(self, op: Operation, combine: Callable[[List[Operation]], Operation]):
+        self._chunks = [op]
+        self._combine = combine
+
+    def append(self, op: Operation) -> None:
+        self._chunks.append(op)
+
+    def build(self) -> Operation:
+        if len(self._chunks) > 1:
+            self._chunks = [self._combine(self._chunks)]
+        return self._chunks[0]
+
+
+def _combine_values(chunks: List[Operation]) -> typing.Sequence:
+    if all(isinstance(chunk.values, SeriesColumns) for chunk in chunks):
+        return SeriesColumns.concat([chunk.values for chunk in chunks])
+    return list(itertools.chain.from_iterable(chunk.values for chunk in chunks))
+
+
 class _OperationsAccumulator(OperationVisitor[None]):
     def __init__(self, path: List[str]):
         self._path = path
@@ -113,7 +140,11 @@ class _OperationsAccumulator(OperationVisitor[None]):
         self._errors = []
 
     def get_operations(self) -> List[Operation]:
-        return self._delete_ops + self._modify_ops + self._config_ops
+        return self._delete_ops + [self._build(op) for op in self._modify_ops] + self._config_ops
+
+    @staticmethod
+    def _build(op: typing.Union[Operation, _LogOperationBuilder]) -> Operation:
+        return op.build() if isinstance(op, _LogOperationBuilder) else op
 
     def get_errors(self) -> List[MetadataInconsistency]:
         return self._errors
@@ -183,7 +214,7 @@ class _OperationsAccumulator(OperationVisitor[None]):
             self._log_modifier(
                 LogFloats,
                 ClearFloatLog,
-                lambda op1, op2: LogFloats(op1.path, op1.values + op2.values),
+                lambda ops: LogFloats(ops[0].path, _combine_values(ops)),
             ),
         )
 
@@ -194,7 +225,7 @@ class _OperationsAccumulator(OperationVisitor[None]):
             self._log_modifier(
                 LogStrings,
                 ClearStringLog,
-                lambda op1, op2: LogStrings(op1.path, op1.values + op2.values),
+                lambda ops: LogStrings(ops[0].path, _combine_values(ops)),
             ),
         )
 
@@ -227,7 +258,7 @@ class _OperationsAccumulator(OperationVisitor[None]):
                 # This case is tricky. There was no delete operation, but some modifications was performed.
                 # We do not know if this attribute exists on server side and we do not want a delete op to fail.
                 # So we need to send a single modification before delete to be sure a delete op is valid.
-                self._delete_ops = [self._modify_ops[0], op]
+                self._delete_ops = [self._build(self._modify_ops[0]), op]
                 self._modify_ops = []
                 self._config_ops = []
                 self._type = None
@@ -253,16 +284,18 @@ class _OperationsAccumulator(OperationVisitor[None]):
         return lambda ops, new_op: [new_op]
 
     @staticmethod
-    def _log_modifier(log_op_class: type, clear_op_class: type, log_combine: Callable[[T, T], T]):
+    def _log_modifier(log_op_class: type, clear_op_class: type, log_combine: Callable[[List[T]], T]):
         def modifier(ops, new_op):
             if len(ops) == 0:
-                return [new_op]
-            elif len(ops) == 1 and isinstance(ops[0], log_op_class):
-                return [log_combine(ops[0], new_op)]
+                return [_LogOperationBuilder(new_op, log_combine)]
+            elif len(ops) == 1 and isinstance(ops[0], _LogOperationBuilder):
+                ops[0].append(new_op)
+                return ops
             elif len(ops) == 1 and isinstance(ops[0], clear_op_class):
-                return [ops[0], new_op]
+                return [ops[0], _LogOperationBuilder(new_op, log_combine)]
             elif len(ops) == 2:
-                return [ops[0], log_combine(ops[1], new_op)]
+                ops[1].append(new_op)
+                return ops
             else:
                 raise InternalClientError("Preprocessing operations failed: len(ops) == {}".format(len(ops)))
 
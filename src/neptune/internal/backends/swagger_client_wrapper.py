@@ -13,10 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["ApiMethodWrapper", "SwaggerClientWrapper"]
+__all__ = ["ApiMethodWrapper", "SwaggerClientWrapper", "LazySwaggerClientWrapper"]
 
+import threading
 from collections.abc import Callable
 from typing import (
+    Any,
     Dict,
     Optional,
 )
@@ -131,3 +133,31 @@ class SwaggerClientWrapper:
         if isinstance(other, SwaggerClientWrapper):
             return self._swagger_client == other._swagger_client
         return False
+
+
+class LazySwaggerClientWrapper(SwaggerClientWrapper):
+    """Builds the Swagger client, and with it the whole operation table of its spec, on first use."""
+
+    def __init__(self, factory: "Callable[[], SwaggerClient]"):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._wrapped: Optional[SwaggerClientWrapper] = None
+
+    def _get_wrapped(self) -> SwaggerClientWrapper:
+        if self._wrapped is None:
+            with self._lock:
+                if self._wrapped is None:
+                    self._wrapped = SwaggerClientWrapper(self._factory())
+        return self._wrapped
+
+    @property
+    def _swagger_client(self) -> SwaggerClient:
+        return self._get_wrapped()._swagger_client
+
+    @property
+    def api(self) -> Any:
+        return self._get_wrapped().api
+
+    @property
+    def swagger_spec(self) -> Any:
+        return self._get_wrapped().swagger_spec
@@ -0,0 +1,147 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SwaggerSpecCache", "load_swagger_spec"]
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+import requests
+from bravado.http_client import HttpClient
+from bravado.requests_client import RequestsClient
+
+from neptune.constants import (
+    NEPTUNE_DATA_DIRECTORY,
+    SWAGGER_SPEC_CACHE_DIRECTORY,
+)
+from neptune.envs import NEPTUNE_SWAGGER_CACHE_MAX_AGE
+from neptune.internal.utils.logger import get_logger
+from neptune.version import __version__
+
+logger = get_logger()
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_AGE_SECONDS = 300
+SPEC_REQUEST_TIMEOUT = 30
+
+
+class SwaggerSpecCache:
+    """Swagger specs stored on disk, keyed by spec URL and client version.
+
+    A cached spec younger than `max_age` seconds is used as is. An older one is revalidated with
+    `If-None-Match`/`If-Modified-Since`, so an unchanged spec costs a single `304 Not Modified` round trip.
+    The modification time of a cache file is the time it was last confirmed up to date.
+    """
+
+    def __init__(self, directory: Path, max_age: float = DEFAULT_MAX_AGE_SECONDS) -> None:
+        self._directory = directory
+        self._max_age = max_age
+
+    def path_for(self, url: str) -> Path:
+        key = hashlib.sha256(f"{CACHE_FORMAT_VERSION}|{__version__}|{url}".encode("utf-8")).hexdigest()
+        return self._directory / f"{key}.json"
+
+    def load(self, url: str, session: requests.Session) -> Dict[str, Any]:
+        path = self.path_for(url)
+        entry = self._read(path)
+        cached_spec: Optional[Dict[str, Any]] = entry["spec"] if entry is not None else None
+
+        if cached_spec is not None and time.time() - path.stat().st_mtime < self._max_age:
+            return cached_spec
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = session.get(url, headers=headers, timeout=SPEC_REQUEST_TIMEOUT)
+        except requests.RequestException:
+            if cached_spec is None:
+                raise
+            logger.debug("Could not revalidate cached Swagger spec of %s, using the cached one", url)
+            return cached_spec
+
+        if response.status_code == 304 and cached_spec is not None:
+            self._touch(path)
+            return cached_spec
+
+        response.raise_for_status()
+        spec = response.json()
+        if not isinstance(spec, dict):
+            raise ValueError(f"Swagger spec of {url} is not a JSON object")
+        self._write(
+            path,
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "spec": spec,
+            },
+        )
+        return spec
+
+    @staticmethod
+    def _read(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and isinstance(entry.get("spec"), dict) else None
+
+    def _write(self, path: Path, entry: Dict[str, Any]) -> None:
+        # written to a temporary file first, so concurrent processes never read a partial spec
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=path.stem, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(entry, file)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Could not cache Swagger spec in %s: %s", self._directory, e)
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+def load_swagger_spec(url: str, http_client: HttpClient) -> Optional[Dict[str, Any]]:
+    """Returns the spec from the on-disk cache, or None if `http_client` cannot be used for fetching it."""
+    if not isinstance(http_client, RequestsClient):
+        return None
+
+    max_age = float(os.getenv(NEPTUNE_SWAGGER_CACHE_MAX_AGE) or DEFAULT_MAX_AGE_SECONDS)
+    cache = SwaggerSpecCache(Path(NEPTUNE_DATA_DIRECTORY) / SWAGGER_SPEC_CACHE_DIRECTORY, max_age=max_age)
+    return cache.load(url, http_client.session)
@@ -94,6 +94,7 @@ from neptune.exceptions import (
 )
 from neptune.internal.backends.api_model import ClientConfig
 from neptune.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
+from neptune.internal.backends.swagger_spec_cache import load_swagger_spec
 from neptune.internal.envs import NEPTUNE_RETRIES_TIMEOUT_ENV
 from neptune.internal.exceptions import (
     ClientHttpError,
@@ -104,6 +105,7 @@ from neptune.internal.exceptions import (
     NeptuneSSLVerificationError,
     Unauthorized,
 )
+from neptune.internal.initialization import ensure_initialized
 from neptune.internal.operation import (
     CopyAttribute,
     Operation,
@@ -263,16 +265,17 @@ uuid_format = SwaggerFormat(
 
 @with_api_exceptions_handler
 def create_swagger_client(url: str, http_client: HttpClient) -> SwaggerClient:
-    return SwaggerClient.from_url(
-        url,
-        config=dict(
-            validate_swagger_spec=False,
-            validate_requests=False,
-            validate_responses=False,
-            formats=[uuid_format],
-        ),
-        http_client=http_client,
+    config = dict(
+        validate_swagger_spec=False,
+        validate_requests=False,
+        validate_responses=False,
+        formats=[uuid_format],
     )
+    ensure_initialized()
+    spec = load_swagger_spec(url, http_client)
+    if spec is None:
+        return SwaggerClient.from_url(url, config=config, http_client=http_client)
+    return SwaggerClient.from_spec(spec, origin_url=url, http_client=http_client, config=config)
 
 
 def verify_client_version(client_config: ClientConfig, version: Version):
@@ -44,6 +44,8 @@ class ContainerStructure(Generic[T, Node]):
         self._structure = node_factory(path=[])
         self._node_factory = node_factory
         self._node_type = type(self._structure)
+        # incremented on every change, so lookups can be cached until the structure changes
+        self.version = 0
 
     def get_structure(self) -> Node:
         return self._structure
@@ -100,9 +102,11 @@ class ContainerStructure(Generic[T, Node]):
             raise MetadataInconsistency("Cannot set attribute '{}'. It's a namespace".format(path_to_str(path)))
 
         ref[attribute_name] = attr
+        self.version += 1
 
     def pop(self, path: List[str]) -> None:
         self._pop_impl(self._structure, path, path)
+        self.version += 1
 
     def _pop_impl(self, ref, sub_path: List[str], attr_path: List[str]):
         if not sub_path:
@@ -125,3 +129,4 @@ class ContainerStructure(Generic[T, Node]):
 
     def clear(self):
         self._structure.clear()
+        self.version += 1
@@ -41,6 +41,7 @@ class Daemon(threading.Thread):
         self._state: Daemon.DaemonState = Daemon.DaemonState.INIT
         self._wait_condition = threading.Condition()
         self.last_backoff_time = 0  # used only with ConnectionRetryWrapper decorator
+        self.backoff_count = 0  # used only with ConnectionRetryWrapper decorator
 
     def interrupt(self):
         with self._wait_condition:
@@ -95,13 +96,18 @@ class Daemon(threading.Thread):
                 if self._state == Daemon.DaemonState.WORKING:
                     self.work()
                     with self._wait_condition:
-                        if self._sleep_time > 0 and self._state == Daemon.DaemonState.WORKING:
-                            self._wait_condition.wait(timeout=self._sleep_time)
+                        sleep_time = self._next_sleep_time()
+                        if sleep_time > 0 and self._state == Daemon.DaemonState.WORKING:
+                            self._wait_condition.wait(timeout=sleep_time)
         finally:
             with self._wait_condition:
                 self._state = Daemon.DaemonState.STOPPED
                 self._wait_condition.notify_all()
 
+    def _next_sleep_time(self) -> float:
+        """Time to sleep after `work`, computed while holding the condition `wake_up` notifies."""
+        return self._sleep_time
+
     @abc.abstractmethod
     def work(self):
         pass
@@ -124,6 +130,7 @@ class Daemon(threading.Thread):
                             logger.info("Communication with Neptune restored!")
                         return result
                     except NeptuneConnectionLostException as e:
+                        self_.backoff_count += 1
                         if self_.last_backoff_time == 0:
                             logger.warning(
                                 "Experiencing connection interruptions."
@@ -0,0 +1,45 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["ensure_initialized"]
+
+import threading
+
+_lock = threading.Lock()
+_initialized = False
+
+
+def ensure_initialized() -> None:
+    """Applies patches of external libraries and loads extensions, once per process.
+
+    Called before the first use of objects or API clients, so that a plain `import neptune` stays cheap.
+    """
+    global _initialized
+
+    if _initialized:
+        return
+
+    with _lock:
+        if _initialized:
+            return
+
+        from neptune.internal.extensions import load_extensions
+        from neptune.internal.patches import apply_patches
+
+        apply_patches()
+        # set before loading extensions, which may create Neptune objects themselves
+        _initialized = True
+        load_extensions()
@@ -15,6 +15,11 @@
 #
 import threading
 import time
+from typing import (
+    Callable,
+    Optional,
+    Tuple,
+)
 
 import jwt
 from bravado.exception import HTTPUnauthorized
@@ -27,9 +32,18 @@ from requests.auth import AuthBase
 from requests_oauthlib import OAuth2Session
 
 from neptune.internal.backends.utils import with_api_exceptions_handler
+from neptune.internal.daemon import Daemon
 from neptune.internal.exceptions import NeptuneInvalidApiTokenException
+from neptune.internal.token_cache import (
+    CachedTokens,
+    TokenCache,
+    get_token_cache,
+)
+from neptune.internal.utils.logger import get_logger
 from neptune.internal.utils.utils import update_session_proxies
 
+logger = get_logger()
+
 _decoding_options = {
     "verify_signature": False,
     "verify_exp": False,
@@ -39,14 +53,26 @@ _decoding_options = {
     "verify_iss": False,
 }
 
+# requests refresh the token themselves only when it has fewer seconds left
+REFRESH_MARGIN_SECONDS = 30
+# the background refresher renews the token this many seconds ahead of its expiry, or halfway through its lifetime
+REFRESH_AHEAD_SECONDS = 120
+REFRESH_RETRY_SECONDS = 10
 
-class NeptuneAuth(AuthBase):
-    __LOCK = threading.RLock()
 
-    def __init__(self, session_factory):
+class NeptuneAuth(AuthBase):
+    def __init__(self, session_factory, token_cache: Optional[TokenCache] = None, refresh_in_background: bool = True):
         self.session_factory = session_factory
+        self.token_cache = token_cache
+        self._lock = threading.RLock()
         self.session = session_factory()
         self.token_expires_at = 0
+        self.token_refresh_at = 0
+        self._update_token_times()
+
+        # the refresher is started by requests, and stopped when the backends using it close
+        self._refresh_in_background = refresh_in_background
+        self._refresher: Optional[TokenRefresher] = None
 
     def __call__(self, r):
         try:
@@ -63,16 +89,46 @@ class NeptuneAuth(AuthBase):
 
     @with_api_exceptions_handler
     def refresh_token_if_needed(self, force=False):
-        if (self.token_expires_at - time.time()) < 30 or force:
-            self._refresh_token()
+        self._ensure_background_refresh()
+        expires_at = self.token_expires_at
+        if (expires_at - time.time()) < REFRESH_MARGIN_SECONDS or force:
+            self._refresh_token(stale_expires_at=expires_at)
+
+    def refresh_token_ahead_of_expiry(self) -> None:
+        expires_at = self.token_expires_at
+        if time.time() >= self.token_refresh_at:
+            self._refresh_token(stale_expires_at=expires_at)
+
+    def _ensure_background_refresh(self) -> None:
+        # threads do not survive forking, so the refresher is restarted in child processes
+        if self._refresh_in_background and (self._refresher is None or not self._refresher.is_alive()):
+            with self._lock:
+                if self._refresher is None or not self._refresher.is_alive():
+                    self._refresher = TokenRefresher(self)
+                    self._refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        with self._lock:
+            refresher, self._refresher = self._refresher, None
+        # joined without the lock, which the refresher takes while refreshing
+        if refresher is not None and refresher.is_alive():
+            refresher.interrupt()
+            refresher.join()
+
+    def _refresh_token(self, stale_expires_at: Optional[float] = None):
+        with self._lock:
+            # another thread may have refreshed the token while this one was waiting for the lock
+            if stale_expires_at is not None and self.token_expires_at > stale_expires_at:
+                return
 
-    def _refresh_token(self):
-        with self.__LOCK:
             try:
                 self._refresh_session_token()
             except OAuth2Error:
                 # for some reason oauth session is no longer valid. Retry by creating new fresh session
                 # we can safely ignore this error, as it will be thrown again if it's persistent
+                if self.token_cache is not None and self.session.token:
+                    with self.token_cache.lock():
+                        self.token_cache.discard(self.session.token.get("refresh_token"))
                 try:
                     self.session.close()
                 except Exception:
@@ -81,36 +137,91 @@ class NeptuneAuth(AuthBase):
                 self._refresh_session_token()
 
     def _refresh_session_token(self):
+        if self.token_cache is None:
+            self._refresh_oauth_token()
+            return
+
+        with self.token_cache.lock():
+            cached = self.token_cache.read()
+            if (
+                cached is not None
+                and cached.expires_at > self.token_expires_at
+                and cached.expires_at - time.time() > REFRESH_MARGIN_SECONDS
+            ):
+                # another process on this host has refreshed the token already
+                self.session.token = _session_token(cached.access_token, cached.refresh_token)
+                self._update_token_times()
+                return
+
+            self._refresh_oauth_token()
+            token = self.session.token
+            if token is not None and token.get("access_token") and token.get("refresh_token"):
+                self.token_cache.write(
+                    CachedTokens(
+                        access_token=token["access_token"],
+                        refresh_token=token["refresh_token"],
+                        expires_at=self.token_expires_at,
+                    )
+                )
+
+    def _refresh_oauth_token(self):
         self.session.refresh_token(self.session.auto_refresh_url, verify=self.session.verify)
+        self._update_token_times()
+
+    def _update_token_times(self):
         if self.session.token is not None and self.session.token.get("access_token") is not None:
-            decoded_json_token = jwt.decode(self.session.token.get("access_token"), options=_decoding_options)
-            self.token_expires_at = decoded_json_token.get("exp")
+            expires_at, issued_at = _token_times(self.session.token.get("access_token"))
+            self.token_expires_at = expires_at
+            self.token_refresh_at = expires_at - min(REFRESH_AHEAD_SECONDS, (expires_at - issued_at) / 2)
+
+
+class TokenRefresher(Daemon):
+    """Refreshes the token of `auth` ahead of its expiry, so that requests never wait for it."""
+
+    def __init__(self, auth: NeptuneAuth):
+        super().__init__(sleep_time=REFRESH_RETRY_SECONDS, name="NeptuneTokenRefresher")
+        self._auth = auth
+        self._failed = False
+
+    def work(self):
+        try:
+            self._auth.refresh_token_ahead_of_expiry()
+        except Exception as e:
+            logger.debug("Could not refresh access token in background: %s", e)
+            self._failed = True
+        else:
+            self._failed = self._auth.token_refresh_at <= time.time()
+
+    def _next_sleep_time(self) -> float:
+        if self._failed:
+            return self._sleep_time
+        return max(1.0, self._auth.token_refresh_at - time.time())
 
 
 class NeptuneAuthenticator(Authenticator):
     def __init__(self, api_token, backend_client, ssl_verify, proxies):
         super(NeptuneAuthenticator, self).__init__(host="")
 
-        # We need to pass a lambda to be able to re-create fresh session at any time when needed
-        def session_factory():
+        token_cache = get_token_cache(api_token)
+
+        def exchange_api_token() -> Tuple[str, str]:
             try:
                 auth_tokens = backend_client.api.exchangeApiToken(X_Neptune_Api_Token=api_token).response().result
             except HTTPUnauthorized:
                 raise NeptuneInvalidApiTokenException()
+            return auth_tokens.accessToken, auth_tokens.refreshToken
+
+        # We need to pass a lambda to be able to re-create fresh session at any time when needed
+        def session_factory():
+            access_token, refresh_token = _obtain_tokens(token_cache, exchange_api_token)
 
-            decoded_json_token = jwt.decode(auth_tokens.accessToken, options=_decoding_options)
-            expires_at = decoded_json_token.get("exp")
+            decoded_json_token = jwt.decode(access_token, options=_decoding_options)
             client_name = decoded_json_token.get("azp")
             refresh_url = "{realm_url}/protocol/openid-connect/token".format(realm_url=decoded_json_token.get("iss"))
-            token = {
-                "access_token": auth_tokens.accessToken,
-                "refresh_token": auth_tokens.refreshToken,
-                "expires_in": expires_at - time.time(),
-            }
 
             session = OAuth2Session(
                 client_id=client_name,
-                token=token,
+                token=_session_token(access_token, refresh_token),
                 auto_refresh_url=refresh_url,
                 auto_refresh_kwargs={"client_id": client_name},
                 token_updater=_no_token_updater,
@@ -120,7 +231,7 @@ class NeptuneAuthenticator(Authenticator):
             update_session_proxies(session, proxies)
             return session
 
-        self.auth = NeptuneAuth(session_factory)
+        self.auth = NeptuneAuth(session_factory, token_cache=token_cache)
 
     def matches(self, url):
         return True
@@ -131,6 +242,40 @@ class NeptuneAuthenticator(Authenticator):
         return request
 
 
+def _obtain_tokens(
+    token_cache: Optional[TokenCache], exchange_api_token: Callable[[], Tuple[str, str]]
+) -> Tuple[str, str]:
+    if token_cache is None:
+        return exchange_api_token()
+
+    # processes started together wait for the first one to exchange the API token, and reuse its tokens
+    with token_cache.lock():
+        cached = token_cache.read()
+        if cached is not None and cached.expires_at - time.time() > REFRESH_MARGIN_SECONDS:
+            return cached.access_token, cached.refresh_token
+
+        access_token, refresh_token = exchange_api_token()
+        expires_at, _ = _token_times(access_token)
+        token_cache.write(CachedTokens(access_token=access_token, refresh_token=refresh_token, expires_at=expires_at))
+        return access_token, refresh_token
+
+
+def _session_token(access_token: str, refresh_token: str) -> dict:
+    expires_at, _ = _token_times(access_token)
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "expires_in": expires_at - time.time(),
+    }
+
+
+def _token_times(access_token: str) -> Tuple[float, float]:
+    """Returns the expiration and issue times of `access_token`."""
+    decoded_json_token = jwt.decode(access_token, options=_decoding_options)
+    expires_at = decoded_json_token.get("exp")
+    return expires_at, decoded_json_token.get("iat") or time.time()
+
+
 def _no_token_updater():
     # For unit tests.
     return None
@@ -18,15 +18,21 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
     Generic,
     List,
     Optional,
+    Sequence,
     Set,
     Type,
     TypeVar,
 )
 
 from neptune.core.components.operation_storage import OperationStorage
+from neptune.core.operations.series_columns import SeriesColumns
 from neptune.exceptions import MalformedOperation
 from neptune.internal.container_type import ContainerType
 
@@ -48,6 +54,14 @@ class Operation(abc.ABC):
 
     path: List[str]
 
+    # Decoders of concrete operation types, registered when each class is created
+    _decoders: ClassVar[Dict[str, Callable[[dict], "Operation"]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "from_dict" in cls.__dict__:
+            Operation._decoders[cls.__name__] = cls.from_dict
+
     @abc.abstractmethod
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         pass
@@ -62,10 +76,10 @@ class Operation(abc.ABC):
     def from_dict(data: dict) -> "Operation":
         if "type" not in data:
             raise ValueError("Malformed operation {} - type is missing".format(data))
-        sub_classes = {cls.__name__: cls for cls in all_subclasses(Operation)}
-        if not data["type"] in sub_classes:
+        decoder = Operation._decoders.get(data["type"])
+        if decoder is None:
             raise ValueError("Malformed operation {} - unknown type {}".format(data, data["type"]))
-        return sub_classes[data["type"]].from_dict(data)
+        return decoder(data)
 
 
 @dataclass
@@ -177,27 +191,40 @@ class LogSeriesValue(Generic[T]):
         return LogSeriesValue[T](value_deserializer(data["value"]), data.get("step", None), data["ts"])
 
 
+def _series_values_from_dicts(values: List[dict]) -> List[LogSeriesValue]:
+    # Skips the generic alias and per-value deserializer calls of `LogSeriesValue.from_dict`
+    return [LogSeriesValue(value["value"], value.get("step"), value["ts"]) for value in values]
+
+
 @dataclass
 class LogFloats(LogOperation):
 
     ValueType = LogSeriesValue[float]
 
-    values: List[ValueType]
+    values: Sequence[ValueType]
 
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_log_floats(self)
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
-        ret["values"] = [value.to_dict() for value in self.values]
+        if isinstance(self.values, SeriesColumns):
+            ret["values"] = self.values.to_dict()
+        else:
+            ret["values"] = [value.to_dict() for value in self.values]
         return ret
 
     @staticmethod
     def from_dict(data: dict) -> "LogFloats":
-        return LogFloats(
-            data["path"],
-            [LogFloats.ValueType.from_dict(value) for value in data["values"]],
-        )
+        if isinstance(data["values"], dict):
+            return LogFloats(data["path"], SeriesColumns.from_dict(data["values"], LogFloats.ValueType))
+        return LogFloats(data["path"], _series_values_from_dicts(data["values"]))
+
+    @staticmethod
+    def from_columns(
+        path: List[str], values: List[float], steps: List[Optional[float]], timestamps: List[float]
+    ) -> "LogFloats":
+        return LogFloats(path, SeriesColumns(values, steps, timestamps, LogFloats.ValueType))
 
 
 @dataclass
@@ -217,10 +244,7 @@ class LogStrings(LogOperation):
 
     @staticmethod
     def from_dict(data: dict) -> "LogStrings":
-        return LogStrings(
-            data["path"],
-            [LogStrings.ValueType.from_dict(value) for value in data["values"]],
-        )
+        return LogStrings(data["path"], _series_values_from_dicts(data["values"]))
 
 
 @dataclass
@@ -341,11 +365,7 @@ class CopyAttribute(Operation):
 
     @staticmethod
     def from_dict(data: dict) -> "CopyAttribute":
-        from neptune.attributes.attribute import Attribute
-
-        source_attr_cls = {cls.__name__: cls for cls in all_subclasses(Attribute) if cls.supports_copy}.get(
-            data["source_attr_name"]
-        )
+        source_attr_cls = _get_copiable_attribute_class(data["source_attr_name"])
 
         if source_attr_cls is None:
             raise MalformedOperation("Copy of non-copiable type found in queue!")
@@ -364,3 +384,17 @@ class CopyAttribute(Operation):
         create_assignment_operation = self.source_attr_cls.create_assignment_operation
         value = getter(backend, self.container_id, self.container_type, self.source_path)
         return create_assignment_operation(self.path, value)
+
+
+_copiable_attribute_classes: Dict[str, Type["Attribute"]] = {}
+
+
+def _get_copiable_attribute_class(name: str) -> Optional[Type["Attribute"]]:
+    if name not in _copiable_attribute_classes:
+        from neptune.attributes.attribute import Attribute
+
+        # Attribute classes may be imported after the first lookup, so refresh the cache on a miss
+        _copiable_attribute_classes.update(
+            {cls.__name__: cls for cls in all_subclasses(Attribute) if cls.supports_copy}
+        )
+    return _copiable_attribute_classes.get(name)
@@ -19,6 +19,7 @@ __all__ = [
     "BatchStartedSignal",
     "BatchProcessedSignal",
     "BatchLagSignal",
+    "BatchSchedulingSignal",
 ]
 
 from abc import abstractmethod
@@ -53,6 +54,16 @@ class BatchLagSignal(Signal):
         visitor.visit_batch_lag(signal=self)
 
 
+@dataclass
+class BatchSchedulingSignal(Signal):
+    linger: float
+    max_batch_ops: int
+    max_batch_bytes: int
+
+    def accept(self, visitor: "SignalsVisitor") -> None:
+        visitor.visit_batch_scheduling(signal=self)
+
+
 class SignalsVisitor:
     @abstractmethod
     def visit_batch_started(self, signal: Signal) -> None: ...
@@ -62,3 +73,6 @@ class SignalsVisitor:
 
     @abstractmethod
     def visit_batch_lag(self, signal: Signal) -> None: ...
+
+    @abstractmethod
+    def visit_batch_scheduling(self, signal: Signal) -> None: ...
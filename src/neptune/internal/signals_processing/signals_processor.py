@@ -31,13 +31,17 @@ from neptune.internal.daemon import Daemon
 from neptune.internal.parameters import IN_BETWEEN_CALLBACKS_MINIMUM_INTERVAL
 from neptune.internal.signals_processing.signals import (
     BatchLagSignal,
+    BatchSchedulingSignal,
     SignalsVisitor,
 )
+from neptune.internal.utils.logger import get_logger
 
 if TYPE_CHECKING:
     from neptune.internal.signals_processing.signals import Signal
     from neptune.objects import NeptuneObject
 
+logger = get_logger()
+
 
 class SignalsProcessor(Daemon, SignalsVisitor):
     def __init__(
@@ -67,6 +71,12 @@ class SignalsProcessor(Daemon, SignalsVisitor):
         self._last_batch_started_at: Optional[float] = None
         self._last_no_progress_callback_at: Optional[float] = None
         self._last_lag_callback_at: Optional[float] = None
+        self._batch_scheduling: Optional[BatchSchedulingSignal] = None
+
+    @property
+    def batch_scheduling(self) -> Optional[BatchSchedulingSignal]:
+        """Effective batching of the asynchronous operation processor, as last reported by it."""
+        return self._batch_scheduling
 
     def visit_batch_started(self, signal: "Signal") -> None:
         if self._last_batch_started_at is None:
@@ -90,6 +100,18 @@ class SignalsProcessor(Daemon, SignalsVisitor):
                 execute_callback(callback=self._async_lag_callback, container=self._container, in_async=self._in_async)
                 self._last_lag_callback_at = current_time
 
+    def visit_batch_scheduling(self, signal: "Signal") -> None:
+        if not isinstance(signal, BatchSchedulingSignal):
+            return
+
+        self._batch_scheduling = signal
+        logger.debug(
+            "Sending operations after %.3f seconds or once %d operations or %d bytes are pending",
+            signal.linger,
+            signal.max_batch_ops,
+            signal.max_batch_bytes,
+        )
+
     def _check_callbacks(self) -> None:
         self._check_no_progress(at_timestamp=monotonic())
 
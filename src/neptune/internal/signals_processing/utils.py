@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["signal_batch_processed", "signal_batch_started", "signal_batch_lag"]
+__all__ = ["signal_batch_processed", "signal_batch_started", "signal_batch_lag", "signal_batch_scheduling"]
 
 from queue import (
     Full,
@@ -25,6 +25,7 @@ from typing import Optional
 from neptune.internal.signals_processing.signals import (
     BatchLagSignal,
     BatchProcessedSignal,
+    BatchSchedulingSignal,
     BatchStartedSignal,
     Signal,
 )
@@ -51,3 +52,22 @@ def signal_batch_processed(*, queue: "Queue[Signal]", occured_at: Optional[float
 
 def signal_batch_lag(*, queue: "Queue[Signal]", lag: float, occured_at: Optional[float] = None) -> None:
     signal(queue=queue, obj=BatchLagSignal(occured_at=occured_at or monotonic(), lag=lag))
+
+
+def signal_batch_scheduling(
+    *,
+    queue: "Queue[Signal]",
+    linger: float,
+    max_batch_ops: int,
+    max_batch_bytes: int,
+    occured_at: Optional[float] = None,
+) -> None:
+    signal(
+        queue=queue,
+        obj=BatchSchedulingSignal(
+            occured_at=occured_at or monotonic(),
+            linger=linger,
+            max_batch_ops=max_batch_ops,
+            max_batch_bytes=max_batch_bytes,
+        ),
+    )
@@ -17,29 +17,74 @@ __all__ = ["StdoutCaptureLogger", "StderrCaptureLogger"]
 
 import sys
 import threading
-from queue import Queue
-from typing import TextIO
+import time
+from collections import deque
+from typing import (
+    Deque,
+    List,
+    Optional,
+    TextIO,
+)
 
 from neptune.internal.daemon import Daemon
+from neptune.internal.warnings import (
+    NeptuneWarning,
+    warn_once,
+)
 from neptune.objects import NeptuneObject
 
+DEFAULT_FLUSH_PERIOD = 0.5
+DEFAULT_FLUSH_SIZE = 64 * 1024
+DEFAULT_MAX_BUFFERED_SIZE = 16 * 1024**2
+
 
 class StdStreamCaptureLogger:
-    def __init__(self, container: NeptuneObject, attribute_name: str, stream: TextIO):
+    """Copies writes to `stream` into a string series, one value per line.
+
+    Writes are only buffered on the calling thread. The reporting thread joins them into complete lines
+    and appends them with a single `extend` call once `flush_period` seconds pass or `flush_size` characters
+    are buffered. An incomplete line is held back for at most one `flush_period`. When more than
+    `max_buffered_size` characters wait for the reporting thread, the oldest writes are dropped.
+    """
+
+    def __init__(
+        self,
+        container: NeptuneObject,
+        attribute_name: str,
+        stream: TextIO,
+        flush_period: float = DEFAULT_FLUSH_PERIOD,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        max_buffered_size: int = DEFAULT_MAX_BUFFERED_SIZE,
+    ):
         self._container = container
         self._attribute_name = attribute_name
         self.stream = stream
-        self._thread_local = threading.local()
         self.enabled = True
-        self._log_data_queue = Queue()
+
+        self._flush_period = flush_period
+        self._flush_size = flush_size
+        self._max_buffered_size = max_buffered_size
+
+        self._buffer_cond = threading.Condition(threading.Lock())
+        self._chunks: Deque[str] = deque()
+        self._buffered_size = 0
+        self._dropped_size = 0
+        self._woken_up = False
+
+        # Owned by the reporting thread, and by `close` once the thread is stopped
+        self._partial_line = ""
+        self._partial_line_since: Optional[float] = None
+
         self._logging_thread = self.ReportingThread(self, "NeptuneThread_" + attribute_name)
         self._logging_thread.start()
 
-    def log_data(self, data):
-        self._container[self._attribute_name].append(data)
+    def log_data(self, lines: List[str]):
+        # steps follow the ones of a resumed run and of other writers of the attribute
+        series = self._container[self._attribute_name].series_logger()
+        series.extend(lines, steps=series.reserve_steps(len(lines)))
 
     def pause(self):
-        self._log_data_queue.put_nowait(None)
+        self._wake_up()
         self._logging_thread.pause()
 
     def resume(self):
@@ -47,7 +92,20 @@ class StdStreamCaptureLogger:
 
     def write(self, data: str):
         self.stream.write(data)
-        self._log_data_queue.put_nowait(data)
+        if not self.enabled or not data:
+            return
+
+        with self._buffer_cond:
+            self._chunks.append(data)
+            self._buffered_size += len(data)
+
+            while self._buffered_size > self._max_buffered_size and len(self._chunks) > 1:
+                dropped = self._chunks.popleft()
+                self._buffered_size -= len(dropped)
+                self._dropped_size += len(dropped)
+
+            if self._buffered_size >= self._flush_size:
+                self._buffer_cond.notify()
 
     def __getattr__(self, attr):
         return getattr(self.stream, attr)
@@ -56,8 +114,57 @@ class StdStreamCaptureLogger:
         if self.enabled:
             self._logging_thread.interrupt()
         self.enabled = False
-        self._log_data_queue.put_nowait(None)
+        self._wake_up()
         self._logging_thread.join()
+        self._flush(final=True)
+
+    def _wake_up(self) -> None:
+        with self._buffer_cond:
+            self._woken_up = True
+            self._buffer_cond.notify()
+
+    def _wait_for_data(self) -> None:
+        with self._buffer_cond:
+            self._buffer_cond.wait_for(
+                lambda: self._woken_up or self._buffered_size >= self._flush_size,
+                timeout=self._flush_period,
+            )
+            self._woken_up = False
+
+    def _flush(self, final: bool = False) -> None:
+        with self._buffer_cond:
+            data = "".join(self._chunks)
+            self._chunks.clear()
+            self._buffered_size = 0
+            dropped_size, self._dropped_size = self._dropped_size, 0
+
+        if dropped_size:
+            warn_once(
+                f"Output captured to '{self._attribute_name}' was produced faster than it could be logged."
+                " Some of it was not saved.",
+                exception=NeptuneWarning,
+            )
+
+        *lines, partial_line = (self._partial_line + data).split("\n")
+        lines = [line + "\n" for line in lines]
+
+        now = time.monotonic()
+        if partial_line and not final:
+            if lines or self._partial_line_since is None:
+                self._partial_line_since = now
+            if now - self._partial_line_since >= self._flush_period:
+                lines.append(partial_line)
+                partial_line = ""
+        if final and partial_line:
+            lines.append(partial_line)
+            partial_line = ""
+
+        self._partial_line = partial_line
+        if not partial_line:
+            self._partial_line_since = None
+
+        if lines:
+            self.log_data(lines)
 
     class ReportingThread(Daemon):
         def __init__(self, logger: "StdStreamCaptureLogger", name: str):
@@ -66,11 +173,8 @@ class StdStreamCaptureLogger:
 
         @Daemon.ConnectionRetryWrapper(kill_message="Killing Neptune STD capturing thread.")
         def work(self) -> None:
-            while True:
-                data = self._logger._log_data_queue.get()
-                if data is None:
-                    break
-                self._logger.log_data(data)
+            self._logger._wait_for_data()
+            self._logger._flush()
 
 
 class StdoutCaptureLogger(StdStreamCaptureLogger):
@@ -0,0 +1,160 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["CachedTokens", "TokenCache", "get_token_cache"]
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from pathlib import Path
+from typing import (
+    Iterator,
+    Optional,
+)
+
+from neptune.constants import (
+    NEPTUNE_DATA_DIRECTORY,
+    TOKEN_CACHE_DIRECTORY,
+)
+from neptune.envs import NEPTUNE_TOKEN_CACHE
+from neptune.internal.utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None  # type: ignore[assignment]
+
+logger = get_logger()
+
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CachedTokens:
+    access_token: str
+    refresh_token: str
+    expires_at: float
+
+
+class TokenCache:
+    """Access and refresh tokens obtained for an API token, shared by the processes of a user through a file.
+
+    Every API token has its own file, named after its hash and readable only by its owner. Callers hold `lock()`
+    while obtaining new tokens, so that processes started together exchange the API token only once.
+    """
+
+    def __init__(self, directory: Path, api_token: str) -> None:
+        key = hashlib.sha256(f"{CACHE_FORMAT_VERSION}|{api_token}".encode("utf-8")).hexdigest()
+        self._directory = directory
+        self._path = directory / f"{key}.json"
+        self._lock_path = directory / f"{key}.lock"
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Holds an exclusive lock of the cache file, shared with other processes and threads.
+
+        If the lock cannot be taken, the cache is used without it.
+        """
+        fd = self._open_lock_file()
+        try:
+            if fd is not None:
+                _lock_file(fd)
+            yield
+        finally:
+            if fd is not None:
+                # closing the file releases the lock
+                os.close(fd)
+
+    def read(self) -> Optional[CachedTokens]:
+        try:
+            with open(self._path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.pop("version", None) != CACHE_FORMAT_VERSION:
+                return None
+            return CachedTokens(**data)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+
+    def write(self, tokens: CachedTokens) -> None:
+        # written to a temporary file first, created readable only by its owner
+        try:
+            self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=self._path.stem, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump({"version": CACHE_FORMAT_VERSION, **asdict(tokens)}, file)
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Could not cache access tokens in %s: %s", self._directory, e)
+
+    def discard(self, refresh_token: str) -> None:
+        """Removes the cached tokens if they include `refresh_token`, which the server no longer accepts."""
+        cached = self.read()
+        if cached is not None and cached.refresh_token == refresh_token:
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+
+    def _open_lock_file(self) -> Optional[int]:
+        try:
+            self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            return os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            logger.debug("Could not lock access tokens cache in %s: %s", self._directory, e)
+            return None
+
+
+def _lock_file(fd: int) -> None:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+    except OSError as e:
+        logger.debug("Could not lock access tokens cache: %s", e)
+
+
+def get_token_cache(api_token: str) -> Optional[TokenCache]:
+    """Returns the cache of tokens obtained for `api_token` if enabled with `NEPTUNE_TOKEN_CACHE`.
+
+    The cache is kept in the home directory, so that it is shared by all processes of the user on the host.
+    """
+    if os.getenv(NEPTUNE_TOKEN_CACHE, "False").lower() not in ("true", "t", "1"):
+        return None
+    try:
+        home = Path.home()
+    except RuntimeError as e:
+        logger.debug("Could not locate access tokens cache: %s", e)
+        return None
+    return TokenCache(home / NEPTUNE_DATA_DIRECTORY / TOKEN_CACHE_DIRECTORY, api_token)
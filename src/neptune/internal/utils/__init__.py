@@ -29,6 +29,7 @@ __all__ = [
     "verify_collection_type",
     "verify_optional_callable",
     "is_collection",
+    "is_numeric_array",
     "base64_encode",
     "base64_decode",
     "get_absolute_paths",
@@ -66,16 +67,17 @@ def replace_patch_version(version: str):
 
 
 def verify_type(var_name: str, var, expected_type: Union[type, tuple]):
-    try:
-        if isinstance(expected_type, tuple):
-            type_name = " or ".join(get_type_name(t) for t in expected_type)
-        else:
-            type_name = get_type_name(expected_type)
-    except Exception as e:
-        # Just to be sure that nothing weird will be raised here
-        raise TypeError("Incorrect type of {}".format(var_name)) from e
-
     if not isinstance(var, expected_type):
+        # the message is only built on failure, as this is called on every logging call
+        try:
+            if isinstance(expected_type, tuple):
+                type_name = " or ".join(get_type_name(t) for t in expected_type)
+            else:
+                type_name = get_type_name(expected_type)
+        except Exception as e:
+            # Just to be sure that nothing weird will be raised here
+            raise TypeError("Incorrect type of {}".format(var_name)) from e
+
         raise TypeError("{} must be a {} (was {})".format(var_name, type_name, type(var)))
 
     if isinstance(var, IOBase) and not hasattr(var, "read"):
@@ -150,6 +152,11 @@ def is_collection(var) -> bool:
     return isinstance(var, (list, set, tuple))
 
 
+def is_numeric_array(var) -> bool:
+    """Checks for one-dimensional numpy arrays or pandas Series of numbers without importing either library."""
+    return getattr(var, "ndim", None) == 1 and getattr(getattr(var, "dtype", None), "kind", None) in ("i", "u", "f")
+
+
 def base64_encode(data: bytes) -> str:
     return base64.b64encode(data).decode("utf-8")
 
@@ -13,10 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["ensure_disk_not_overutilize"]
+__all__ = ["ensure_disk_not_overutilize", "DiskUtilizationMonitor", "get_disk_utilization_monitor"]
 
 
 import os
+import threading
 from abc import (
     ABC,
     abstractmethod,
@@ -25,7 +26,9 @@ from functools import wraps
 from typing import (
     Any,
     Callable,
+    Dict,
     Optional,
+    Tuple,
 )
 
 import psutil
@@ -33,10 +36,13 @@ from psutil import Error
 
 from neptune.constants import NEPTUNE_DATA_DIRECTORY
 from neptune.envs import (
+    NEPTUNE_DISK_USAGE_HYSTERESIS,
+    NEPTUNE_DISK_USAGE_SAMPLING_PERIOD,
     NEPTUNE_MAX_DISK_USAGE,
     NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED,
 )
 from neptune.exceptions import NeptuneMaxDiskUtilizationExceeded
+from neptune.internal.daemon import Daemon
 from neptune.internal.warnings import (
     NeptuneWarning,
     warn_once,
@@ -53,7 +59,7 @@ def get_disk_utilization_percent(path: Optional[str] = None) -> Optional[float]:
             path = get_neptune_data_directory()
 
         return float(psutil.disk_usage(path).percent)
-    except (ValueError, TypeError, Error):
+    except (ValueError, TypeError, OSError, Error):
         return None
 
 
@@ -78,58 +84,215 @@ def get_max_disk_utilization_from_env() -> Optional[float]:
         return None
 
 
+def get_disk_utilization_hysteresis_from_env() -> float:
+    env_hysteresis = os.getenv(NEPTUNE_DISK_USAGE_HYSTERESIS)
+
+    if env_hysteresis is None:
+        return 0.0
+
+    try:
+        hysteresis = float(env_hysteresis)
+        if hysteresis < 0 or hysteresis > 100:
+            raise ValueError
+
+        return hysteresis
+    except (ValueError, TypeError):
+        warn_once(
+            f"Provided invalid value of '{NEPTUNE_DISK_USAGE_HYSTERESIS}': '{env_hysteresis}'. "
+            "Hysteresis of disk utilization check will not be applied.",
+            exception=NeptuneWarning,
+        )
+        return 0.0
+
+
+class DiskUtilizationMonitor:
+    """Keeps a recently sampled disk utilization, so checking it does not require a syscall.
+
+    The utilization is sampled by a background thread every `sampling_period` seconds and whenever a queue
+    rotates its data file. Bytes written between samples are added to the last sample to project utilization.
+    Reading `utilization` takes no locks.
+
+    Queues writing to the disk hold the monitor with `acquire()` until they are closed. The thread samples only
+    while the monitor is held, and is stopped when the last queue releases it.
+    """
+
+    DEFAULT_SAMPLING_PERIOD = 1.0
+
+    class _SamplingThread(Daemon):
+        def __init__(self, monitor: "DiskUtilizationMonitor", sleep_time: float):
+            super().__init__(sleep_time=sleep_time, name="NeptuneDiskUtilizationMonitor")
+            self._monitor = monitor
+
+        def work(self) -> None:
+            self._monitor.refresh()
+
+    def __init__(self, path: Optional[str] = None, sampling_period: Optional[float] = None):
+        self._path = path
+        self._sampling_period = sampling_period or float(
+            os.getenv(NEPTUNE_DISK_USAGE_SAMPLING_PERIOD) or self.DEFAULT_SAMPLING_PERIOD
+        )
+        # (utilization percent, total bytes) of the last sample, replaced as a whole
+        self._sample: Optional[Tuple[float, int]] = None
+        self._written_bytes: int = 0
+        self._thread: Optional[DiskUtilizationMonitor._SamplingThread] = None
+        self._users: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def utilization(self) -> Optional[float]:
+        sample = self._sample
+        if sample is None:
+            return None
+
+        percent, total = sample
+        if total <= 0:
+            return percent
+        return min(100.0, percent + 100.0 * self._written_bytes / total)
+
+    def refresh(self) -> None:
+        try:
+            usage = psutil.disk_usage(self._path or get_neptune_data_directory())
+            sample: Optional[Tuple[float, int]] = (float(usage.percent), int(usage.total))
+        except (ValueError, TypeError, OSError, Error):
+            sample = None
+
+        self._written_bytes = 0
+        self._sample = sample
+
+    def record_written(self, size: int) -> None:
+        if self._thread is not None:
+            self._written_bytes += size
+
+    def notify_file_rotated(self) -> None:
+        if self._thread is not None:
+            self.refresh()
+
+    def acquire(self) -> None:
+        with self._lock:
+            self._users += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users == 0:
+                self._stop_thread()
+
+    def start(self) -> bool:
+        """Starts sampling if the monitor is held, returning whether `utilization` is kept up to date."""
+        if self._thread is not None:
+            return True
+
+        with self._lock:
+            if self._users <= 0:
+                return False
+            if self._thread is None:
+                self.refresh()
+                self._thread = DiskUtilizationMonitor._SamplingThread(self, sleep_time=self._sampling_period)
+                self._thread.start()
+            return True
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stop_thread()
+
+    def _stop_thread(self) -> None:
+        if self._thread is not None:
+            self._thread.interrupt()
+            self._thread.join()
+            self._thread = None
+
+
+_monitors: Dict[str, DiskUtilizationMonitor] = {}
+_monitors_lock = threading.Lock()
+
+
+def get_disk_utilization_monitor(path: Optional[str] = None) -> DiskUtilizationMonitor:
+    """Returns the monitor shared by all queues and processors writing to the disk of `path`."""
+    path = path or get_neptune_data_directory()
+    with _monitors_lock:
+        if path not in _monitors:
+            _monitors[path] = DiskUtilizationMonitor(path)
+        return _monitors[path]
+
+
 class DiskUtilizationErrorHandlerTemplate(ABC):
-    def __init__(self, max_disk_utilization: Optional[float], func: Callable[..., None], *args: Any, **kwargs: Any):
+    def __init__(
+        self,
+        max_disk_utilization: Optional[float],
+        func: Callable[..., None],
+        get_monitor: Optional[Callable[[], DiskUtilizationMonitor]] = None,
+        hysteresis: float = 0.0,
+    ):
         self.max_disk_utilization = max_disk_utilization
         self.func = func
-        self.args = args
-        self.kwargs = kwargs
+        self.get_monitor = get_monitor
+        self.monitor: Optional[DiskUtilizationMonitor] = None
+        self.hysteresis = hysteresis
+        self._limit_exceeded = False
 
     @abstractmethod
-    def handle_limit_not_set(self) -> None: ...  # pragma: no cover
+    def handle_limit_not_set(self, *args: Any, **kwargs: Any) -> None: ...  # pragma: no cover
 
     @abstractmethod
-    def handle_utilization_calculation_error(self) -> None: ...  # pragma: no cover
+    def handle_utilization_calculation_error(self, *args: Any, **kwargs: Any) -> None: ...  # pragma: no cover
 
     @abstractmethod
-    def handle_limit_not_exceeded(self) -> None: ...  # pragma: no cover
+    def handle_limit_not_exceeded(self, *args: Any, **kwargs: Any) -> None: ...  # pragma: no cover
 
     @abstractmethod
     def handle_limit_exceeded(self, current_utilization: float) -> None: ...  # pragma: no cover
 
-    def run(self) -> None:
+    def run(self, *args: Any, **kwargs: Any) -> None:
         if not self.max_disk_utilization:
-            return self.handle_limit_not_set()
+            return self.handle_limit_not_set(*args, **kwargs)
 
-        current_utilization = get_disk_utilization_percent()
+        current_utilization = self._get_current_utilization()
 
         if current_utilization is None:
-            return self.handle_utilization_calculation_error()
+            return self.handle_utilization_calculation_error(*args, **kwargs)
+
+        # Once exceeded, the limit is lowered by the hysteresis until utilization drops below it
+        limit = self.max_disk_utilization - self.hysteresis if self._limit_exceeded else self.max_disk_utilization
+        self._limit_exceeded = current_utilization >= limit
 
-        if current_utilization < self.max_disk_utilization:
-            return self.handle_limit_not_exceeded()
+        if not self._limit_exceeded:
+            return self.handle_limit_not_exceeded(*args, **kwargs)
 
         self.handle_limit_exceeded(current_utilization)
 
+    def _get_current_utilization(self) -> Optional[float]:
+        if self.get_monitor is None:
+            return get_disk_utilization_percent()
+
+        # the monitor is looked up on first use, as handlers are created when modules are imported
+        if self.monitor is None:
+            self.monitor = self.get_monitor()
+
+        # without an open queue nothing keeps the monitor sampling
+        if not self.monitor.start():
+            return get_disk_utilization_percent()
+
+        return self.monitor.utilization
+
 
 class NonRaisingErrorHandler(DiskUtilizationErrorHandlerTemplate):
     DISK_ISSUE_MSG = "Encountered disk issue. Neptune will not save your data."
 
-    def handle_limit_not_set(self) -> None:
+    def handle_limit_not_set(self, *args: Any, **kwargs: Any) -> None:
         try:
-            return self.func(*self.args, **self.kwargs)
+            return self.func(*args, **kwargs)
         except (OSError, Error):
             warn_once(self.DISK_ISSUE_MSG, exception=NeptuneWarning)
 
-    def handle_utilization_calculation_error(self) -> None:
+    def handle_utilization_calculation_error(self, *args: Any, **kwargs: Any) -> None:
         try:
-            return self.func(*self.args, **self.kwargs)
+            return self.func(*args, **kwargs)
         except (OSError, Error):
             warn_once(self.DISK_ISSUE_MSG, exception=NeptuneWarning)
 
-    def handle_limit_not_exceeded(self) -> None:
+    def handle_limit_not_exceeded(self, *args: Any, **kwargs: Any) -> None:
         try:
-            return self.func(*self.args, **self.kwargs)
+            return self.func(*args, **kwargs)
         except (OSError, Error):
             warn_once(self.DISK_ISSUE_MSG, exception=NeptuneWarning)
 
@@ -142,14 +305,14 @@ class NonRaisingErrorHandler(DiskUtilizationErrorHandlerTemplate):
 
 
 class RaisingErrorHandler(DiskUtilizationErrorHandlerTemplate):
-    def handle_limit_not_set(self) -> None:
-        return self.func(*self.args, **self.kwargs)
+    def handle_limit_not_set(self, *args: Any, **kwargs: Any) -> None:
+        return self.func(*args, **kwargs)
 
-    def handle_utilization_calculation_error(self) -> None:
-        return self.func(*self.args, **self.kwargs)
+    def handle_utilization_calculation_error(self, *args: Any, **kwargs: Any) -> None:
+        return self.func(*args, **kwargs)
 
-    def handle_limit_not_exceeded(self) -> None:
-        return self.func(*self.args, **self.kwargs)
+    def handle_limit_not_exceeded(self, *args: Any, **kwargs: Any) -> None:
+        return self.func(*args, **kwargs)
 
     def handle_limit_exceeded(self, current_utilization: float) -> None:
         if isinstance(self.max_disk_utilization, float):
@@ -164,10 +327,16 @@ def ensure_disk_not_overutilize(func: Callable[..., None]) -> Callable[..., None
     raising_on_disk_issue = os.getenv(NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED, "True").lower() in ("true", "t", "1")
     max_disk_utilization = get_max_disk_utilization_from_env()
 
-    error_handler = RaisingErrorHandler if raising_on_disk_issue else NonRaisingErrorHandler
+    error_handler_class = RaisingErrorHandler if raising_on_disk_issue else NonRaisingErrorHandler
+    error_handler = error_handler_class(
+        max_disk_utilization,
+        func,
+        get_monitor=get_disk_utilization_monitor if max_disk_utilization else None,
+        hysteresis=get_disk_utilization_hysteresis_from_env(),
+    )
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> None:
-        error_handler(max_disk_utilization, func, *args, **kwargs).run()
+        error_handler.run(*args, **kwargs)
 
     return wrapper
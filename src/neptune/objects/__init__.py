@@ -21,8 +21,37 @@ __all__ = [
     "Run",
 ]
 
-from neptune.objects.model import Model
-from neptune.objects.model_version import ModelVersion
-from neptune.objects.neptune_object import NeptuneObject
-from neptune.objects.project import Project
-from neptune.objects.run import Run
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+)
+
+if TYPE_CHECKING:
+    from neptune.objects.model import Model
+    from neptune.objects.model_version import ModelVersion
+    from neptune.objects.neptune_object import NeptuneObject
+    from neptune.objects.project import Project
+    from neptune.objects.run import Run
+
+_MODULES = {
+    "NeptuneObject": "neptune.objects.neptune_object",
+    "Model": "neptune.objects.model",
+    "ModelVersion": "neptune.objects.model_version",
+    "Project": "neptune.objects.project",
+    "Run": "neptune.objects.run",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -26,6 +26,7 @@ import time
 import traceback
 import uuid
 from abc import ABC
+from contextlib import contextmanager
 from functools import partial
 from queue import Queue
 from typing import (
@@ -33,6 +34,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Union,
@@ -57,11 +59,15 @@ from neptune.exceptions import (
     NeptuneException,
     NeptuneUnsupportedFunctionalityException,
 )
-from neptune.handler import Handler
+from neptune.handler import (
+    Handler,
+    SeriesLogger,
+)
 from neptune.internal.backgroud_job_list import BackgroundJobList
 from neptune.internal.background_job import BackgroundJob
 from neptune.internal.container_structure import ContainerStructure
 from neptune.internal.exceptions import UNIX_STYLES
+from neptune.internal.initialization import ensure_initialized
 from neptune.internal.operation import DeleteAttribute
 from neptune.internal.parameters import (
     ASYNC_LAG_THRESHOLD,
@@ -97,6 +103,7 @@ from neptune.types.type_casting import cast_value
 from neptune.utils import stop_synchronization_callback
 
 if TYPE_CHECKING:
+    from neptune.internal.operation import Operation
     from neptune.internal.signals_processing.signals import Signal
 
 
@@ -119,6 +126,8 @@ class NeptuneObject(WithBackend, ABC):
         async_no_progress_callback: Optional[NeptuneObjectCallback] = None,
         async_no_progress_threshold: float = ASYNC_NO_PROGRESS_THRESHOLD,
     ):
+        ensure_initialized()
+
         verify_type("custom_id", custom_id, (str, type(None)))
         verify_type("flush_period", flush_period, (int, float))
         verify_type("async_lag_threshold", async_lag_threshold, (int, float))
@@ -139,6 +148,7 @@ class NeptuneObject(WithBackend, ABC):
         self._forking_cond: threading.Condition = threading.Condition()
         self._forking_state: bool = False
         self._state = ContainerState.CREATED
+        self._operations_batch: Optional[List["Operation"]] = None
         self._signals_queue: "Queue[Signal]" = Queue()
         self._logger: logging.Logger = get_logger()
 
@@ -162,12 +172,14 @@ class NeptuneObject(WithBackend, ABC):
             lock=self._lock,
             flush_period=flush_period,
             queue=self._signals_queue,
+            project=f"{self._workspace}/{self._project_name}",
         )
 
         self._async_create_run()
 
         self._bg_job: BackgroundJobList = self._prepare_background_jobs_if_non_read_only()
         self._structure: ContainerStructure[Attribute, NamespaceAttr] = ContainerStructure(NamespaceBuilder(self))
+        self._series_loggers: Dict[str, SeriesLogger] = {}
 
         if self._mode != Mode.READ_ONLY:
             self._write_initial_attributes()
@@ -555,6 +567,35 @@ class NeptuneObject(WithBackend, ABC):
         self._structure.pop(parsed_path)
         self._op_processor.enqueue_operation(DeleteAttribute(parsed_path), wait=wait)
 
+    def _enqueue_operation(self, operation: "Operation", *, wait: bool) -> None:
+        if self._operations_batch is not None:
+            self._operations_batch.append(operation)
+        else:
+            self._op_processor.enqueue_operation(operation, wait=wait)
+
+    def _enqueue_operations(self, operations: List["Operation"], *, wait: bool) -> None:
+        if self._operations_batch is not None:
+            self._operations_batch.extend(operations)
+        else:
+            self._op_processor.enqueue_operations(operations, wait=wait)
+
+    @contextmanager
+    def _batch_operations(self, *, wait: bool = False) -> Iterator[None]:
+        """Collects operations enqueued by attributes within the block and enqueues them in a single call."""
+        with self._lock:
+            if self._operations_batch is not None:
+                # already collecting in an outer block
+                yield
+                return
+
+            self._operations_batch = []
+            try:
+                yield
+            finally:
+                operations, self._operations_batch = self._operations_batch, None
+                if operations:
+                    self._op_processor.enqueue_operations(operations, wait=wait)
+
     def lock(self) -> threading.RLock:
         return self._lock
 
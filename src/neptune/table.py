@@ -18,6 +18,7 @@ __all__ = ["Table"]
 from typing import (
     TYPE_CHECKING,
     Any,
+    Dict,
     Generator,
     List,
     Optional,
@@ -55,23 +56,29 @@ class TableEntry:
         self._container_type = container_type
         self._id = _id
         self._fields = attributes
+        self._fields_by_path: Optional[Dict[str, Field]] = None
         self._field_to_value_visitor = FieldToValueVisitor()
 
     def __getitem__(self, path: str) -> "LeaderboardHandler":
         return LeaderboardHandler(table_entry=self, path=path)
 
     def get_attribute_type(self, path: str) -> FieldType:
-        for field in self._fields:
-            if field.path == path:
-                return field.type
-
-        raise ValueError(f"Could not find {path} field")
+        field = self._find_field(path)
+        if field is None:
+            raise ValueError(f"Could not find {path} field")
+        return field.type
 
     def get_attribute_value(self, path: str) -> Any:
-        for field in self._fields:
-            if field.path == path:
-                return self._field_to_value_visitor.visit(field)
-        raise ValueError("Could not find {} attribute".format(path))
+        field = self._find_field(path)
+        if field is None:
+            raise ValueError("Could not find {} attribute".format(path))
+        return self._field_to_value_visitor.visit(field)
+
+    def _find_field(self, path: str) -> Optional[Field]:
+        if self._fields_by_path is None:
+            # built on first lookup, keeping the first of duplicated paths like a scan would
+            self._fields_by_path = {field.path: field for field in reversed(self._fields)}
+        return self._fields_by_path.get(path)
 
 
 class LeaderboardHandler:
@@ -27,7 +27,10 @@ from typing import (
 
 from neptune.internal.types.stringify_value import extract_if_stringify_value
 from neptune.internal.types.utils import is_unsupported_float
-from neptune.internal.utils import is_collection
+from neptune.internal.utils import (
+    is_collection,
+    is_numeric_array,
+)
 from neptune.internal.warnings import (
     NeptuneUnsupportedValue,
     warn_once,
@@ -52,14 +55,17 @@ class FloatSeries(Series):
     ):
         values = extract_if_stringify_value(values)
 
-        if not is_collection(values):
-            raise TypeError("`values` is not a collection")
-
-        self._values = [float(value) for value in values]
         self._min = min
         self._max = max
         self._unit = unit
 
+        if is_numeric_array(values):
+            self._values, self._steps, self._timestamps = self._columns_from_array(values, steps, timestamps)
+            return
+
+        if not is_collection(values):
+            raise TypeError("`values` is not a collection")
+
         if steps is None:
             filled_steps = cycle([None])
         else:
@@ -110,7 +116,8 @@ class FloatSeries(Series):
     def __str__(self):
         return "FloatSeries({})".format(str(self.values))
 
-    def is_unsupported_float_with_warn(self, value):
+    @staticmethod
+    def is_unsupported_float_with_warn(value):
         if is_unsupported_float(value):
             warn_once(
                 message=f"WARNING: A value you're trying to log (`{str(value)}`) will be skipped because "
@@ -129,3 +136,24 @@ class FloatSeries(Series):
             [step for _, step, _ in filtered],
             [timestamp for _, _, timestamp in filtered],
         )
+
+    def _columns_from_array(self, values, steps, timestamps):
+        # numpy is only needed for array input, which implies it is installed
+        import numpy as np
+
+        array = np.asarray(values, dtype=np.float64)
+        steps = [None] * len(array) if steps is None else _as_list(steps)
+        timestamps = [time.time()] * len(array) if timestamps is None else _as_list(timestamps)
+        assert len(array) == len(steps) == len(timestamps)
+
+        supported = np.isfinite(array)
+        if supported.all():
+            return array.tolist(), steps, timestamps
+
+        self.is_unsupported_float_with_warn(float(array[~supported][0]))
+        kept = np.flatnonzero(supported).tolist()
+        return array[supported].tolist(), [steps[i] for i in kept], [timestamps[i] for i in kept]
+
+
+def _as_list(values) -> list:
+    return values.tolist() if is_numeric_array(values) else list(values)
@@ -0,0 +1,75 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-call cost of `append`, `extend` and `assign` on a run, before any operation reaches the queue.
+
+Runs in debug mode with the operation processor replaced by a no-op, so only the client-side work of building
+and enqueueing operations is measured. `append (regular path)` is the path every value took before series loggers.
+
+    python -m tests.benchmarks.bench_handler_calls [--calls 100000]
+"""
+
+import argparse
+import os
+import time
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+from unittest.mock import patch
+
+from neptune import init_run
+from neptune.objects import Run
+
+
+def make_cases(run: Run) -> List[Tuple[str, Callable[[int], None]]]:
+    run["warmup/loss"].append(0.0, step=0)
+    logger = run["train/loss"].series_logger()
+    batch = [0.5] * 100
+
+    return [
+        ("append (regular path)", lambda i: run["warmup/loss"]._append(0.5, step=i + 1)),
+        ("append", lambda i: run["train/loss"].append(0.5, step=i)),
+        ("series_logger().append", lambda i: logger.append(0.5, step=i)),
+        ("extend (100 values)", lambda i: run["train/batch"].extend(batch, steps=list(range(i * 100, i * 100 + 100)))),
+        ("assign", lambda i: run["train/lr"].assign(0.5)),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("NEPTUNE_PROJECT", "organization/project")
+    with init_run(mode="debug") as run:
+        processor = run._op_processor
+        with patch.object(processor, "enqueue_operation", lambda op, wait: None), patch.object(
+            processor, "enqueue_operations", lambda ops, wait: None
+        ):
+            print(f"{'call':>24} {'calls':>8} {'per call [us]':>14}")
+            for name, call in make_cases(run):
+                calls = args.calls // 100 if name.startswith("extend") else args.calls
+                start = time.perf_counter()
+                for i in range(calls):
+                    call(i)
+                elapsed = time.perf_counter() - start
+                print(f"{name:>24} {calls:>8} {elapsed / calls * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Import time of `import neptune`, as reported by `python -X importtime`.
+
+Fails when the median cumulative import time exceeds the budget, or when modules that should be loaded lazily
+are imported eagerly.
+
+    python -m tests.benchmarks.bench_import_time [--budget-ms 150] [--runs 5] [--top 15]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from tests.unit.neptune.new.test_imports import HEAVY_MODULES
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def measure() -> Dict[str, Tuple[int, int]]:
+    """Returns `{module: (self_us, cumulative_us)}` for a fresh interpreter importing neptune."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import neptune"],
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.decode().splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    measure()  # warm up bytecode caches
+    runs = [measure() for _ in range(args.runs)]
+    total_ms = statistics.median(run["neptune"][1] for run in runs) / 1000
+
+    print(f"{'self [ms]':>10} {'cumulative [ms]':>16}  module")
+    for module, (self_us, cumulative_us) in sorted(runs[-1].items(), key=lambda item: -item[1][0])[: args.top]:
+        print(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>16.1f}  {module}")
+    print(f"\n`import neptune`: {total_ms:.1f} ms (median of {args.runs}, budget {args.budget_ms:.0f} ms)")
+
+    eager = sorted(module for module in HEAVY_MODULES if module in runs[-1])
+    if eager:
+        print(f"FAILED: imported eagerly: {', '.join(eager)}")
+        return 1
+    if total_ms > args.budget_ms:
+        print("FAILED: import time over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
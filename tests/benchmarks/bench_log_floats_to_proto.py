@@ -0,0 +1,76 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Encode throughput of `api.operations.LogFloats`, in points per second.
+
+Compares `to_protos` with building every `RunOperation` from keyword arguments.
+
+    python -m tests.benchmarks.bench_log_floats_to_proto
+"""
+
+import timeit
+
+import neptune_api.proto.neptune_pb.ingest.v1.common_pb2 as common_pb2
+import neptune_api.proto.neptune_pb.ingest.v1.pub.ingest_pb2 as ingest_pb2
+from google.protobuf import timestamp_pb2
+
+from neptune.api.operations import (
+    FloatValue,
+    LogFloats,
+    RunOperation,
+)
+
+SIZES = (1, 100, 100_000)
+MIN_POINTS_PER_SIZE = 300_000
+
+
+def encode_with_kwargs(op: LogFloats, run_op: RunOperation):
+    return [
+        ingest_pb2.RunOperation(
+            project=run_op.project,
+            run_id=run_op.run_id,
+            update=common_pb2.UpdateRunSnapshot(
+                step=common_pb2.Step(whole=int(item.step), micro=int((item.step - int(item.step)) * 1e6)),
+                append={op.path: common_pb2.Value(float64=item.value)},
+                timestamp=timestamp_pb2.Timestamp(seconds=int(item.timestamp)),
+            ),
+        )
+        for item in op.items
+    ]
+
+
+def encode_with_templates(op: LogFloats, run_op: RunOperation):
+    return op.to_protos(run_op)
+
+
+def points_per_second(encode, size: int) -> float:
+    op = LogFloats("metrics/loss", [FloatValue(1.7e9 + i / 1000, float(i), float(i)) for i in range(size)])
+    run_op = RunOperation("workspace/project", "run-id", op)
+    repeats = max(1, MIN_POINTS_PER_SIZE // size)
+    best = min(timeit.repeat(lambda: encode(op, run_op), number=repeats, repeat=3))
+    return size * repeats / best
+
+
+def main() -> None:
+    print(f"{'points/op':>10} {'kwargs':>14} {'templates':>14} {'speedup':>8}")
+    for size in SIZES:
+        baseline = points_per_second(encode_with_kwargs, size)
+        current = points_per_second(encode_with_templates, size)
+        print(f"{size:>10} {baseline:>14,.0f} {current:>14,.0f} {current / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Decode throughput of `Operation.from_dict` over the records of an operation log, in operations per second.
+
+Compares the registry dispatch with looking up the operation type among all `Operation` subclasses on every call.
+Without `--log`, a `data-1.log` with a mix of series, assignment and string set operations is recorded first.
+
+    python -m tests.benchmarks.bench_operation_decoding [--log .neptune/async/run__.../exec-.../data-1.log]
+"""
+
+import argparse
+import tempfile
+import threading
+import timeit
+from pathlib import Path
+from typing import (
+    List,
+    Optional,
+)
+
+from neptune.core.components.queue.disk_queue import (
+    DiskQueue,
+    open_log_reader,
+)
+from neptune.internal.operation import (
+    AddStrings,
+    AssignFloat,
+    AssignString,
+    LogFloats,
+    LogStrings,
+    Operation,
+    all_subclasses,
+)
+
+RECORDED_OPERATIONS = 100_000
+
+
+def decode_with_subclass_lookup(data: dict) -> Operation:
+    sub_classes = {cls.__name__: cls for cls in all_subclasses(Operation)}
+    operation_cls = sub_classes[data["type"]]
+    # Series values used to be decoded one by one with `LogSeriesValue.from_dict`
+    if operation_cls in (LogFloats, LogStrings):
+        return operation_cls(
+            data["path"],
+            [operation_cls.ValueType.from_dict(value) for value in data["values"]],
+        )
+    return operation_cls.from_dict(data)
+
+
+def record_log(data_path: Path) -> Path:
+    operations: List[Operation] = []
+    for step in range(RECORDED_OPERATIONS // 10):
+        for metric in range(7):
+            operations.append(LogFloats(["metrics", f"metric_{metric}"], [LogFloats.ValueType(0.5, step, 1.7e9)]))
+        operations.append(LogStrings(["logs", "stdout"], [LogStrings.ValueType(f"step {step}", None, 1.7e9)]))
+        operations.append(AssignFloat(["progress"], float(step)))
+        operations.append(AddStrings(["sys", "tags"], {"benchmark"}) if step % 2 else AssignString(["status"], "ok"))
+
+    with DiskQueue(data_path, lambda op: op.to_dict(), Operation.from_dict, threading.RLock()) as queue:
+        queue.put_many(operations)
+        queue.flush()
+        # Nothing is acknowledged, so the log is kept on exit
+        return next(data_path.glob("data-*.log"))
+
+
+def read_records(log_path: Path) -> List[dict]:
+    reader = open_log_reader(log_path)
+    records = []
+    try:
+        while True:
+            record: Optional[dict] = reader.get()
+            if record is None:
+                return records
+            records.append(record["obj"])
+    finally:
+        reader.close()
+
+
+def ops_per_second(decode, records: List[dict]) -> float:
+    best = min(timeit.repeat(lambda: [decode(record) for record in records], number=1, repeat=3))
+    return len(records) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--log", type=Path, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = args.log or record_log(Path(tmp_dir))
+        records = read_records(log_path)
+
+    baseline = ops_per_second(decode_with_subclass_lookup, records)
+    current = ops_per_second(Operation.from_dict, records)
+    print(f"{'records':>8} {'subclass lookup':>16} {'registry':>14} {'speedup':>8}")
+    print(f"{len(records):>8} {baseline:>16,.0f} {current:>14,.0f} {current / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
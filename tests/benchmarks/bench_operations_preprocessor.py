@@ -0,0 +1,89 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Throughput of `OperationsPreprocessor.process`, in operations per second.
+
+Batches interleave single-point and multi-point `LogFloats` over many metric paths, as produced by training
+loops logging several metrics per step. Exits with a non-zero status when the per-operation cost at the largest
+batch exceeds `--max-slowdown` times the cost at the smallest one, which catches quadratic merging.
+
+    python -m tests.benchmarks.bench_operations_preprocessor
+"""
+
+import argparse
+import sys
+import timeit
+from typing import List
+
+from neptune.internal.backends.operations_preprocessor import OperationsPreprocessor
+from neptune.internal.operation import (
+    LogFloats,
+    Operation,
+)
+
+PATHS = 20
+OPS_PER_PATH = (50, 500, 5000)
+POINTS_PER_OP = (1, 10)
+
+
+def make_batch(ops_per_path: int, points_per_op: int) -> List[Operation]:
+    batch: List[Operation] = []
+    for step in range(ops_per_path):
+        for path in range(PATHS):
+            points = [
+                LogFloats.ValueType(float(step), float(step * points_per_op + i), 1.7e9 + step)
+                for i in range(points_per_op)
+            ]
+            batch.append(LogFloats(["metrics", f"metric_{path}"], points))
+    return batch
+
+
+def process(batch: List[Operation]) -> None:
+    processor = OperationsPreprocessor()
+    processor.process(batch)
+    processor.get_operations()
+
+
+def ops_per_second(batch: List[Operation]) -> float:
+    repeats = max(1, 200_000 // len(batch))
+    best = min(timeit.repeat(lambda: process(batch), number=repeats, repeat=3))
+    return len(batch) * repeats / best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-slowdown", type=float, default=3.0)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'ops/path':>9} {'points/op':>10} {'batch':>8} {'ops/s':>14}")
+    for points_per_op in POINTS_PER_OP:
+        results = []
+        for ops_per_path in OPS_PER_PATH:
+            batch = make_batch(ops_per_path, points_per_op)
+            results.append(ops_per_second(batch))
+            print(f"{ops_per_path:>9} {points_per_op:>10} {len(batch):>8} {results[-1]:>14,.0f}")
+
+        slowdown = results[0] / results[-1]
+        if slowdown > args.max_slowdown:
+            print(f"Per-operation cost grew {slowdown:.1f}x with batch size (limit {args.max_slowdown}x)")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Wall time and peak RSS of building data frames of a runs table and of a fetched float series.
+
+Compares column-wise construction with the former `pd.DataFrame.from_dict(orient="index")` over a dict per row.
+Every measurement runs in a fresh process, so peak RSS is not inherited from the previous one.
+
+    python -m tests.benchmarks.bench_to_pandas [--runs 50000] [--points 2000000]
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from types import SimpleNamespace
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+
+import pandas as pd
+
+from neptune.api.fetching_series_values import (
+    fetch_series_values,
+    fetch_series_values_as_arrays,
+)
+from neptune.api.models import (
+    BoolField,
+    DateTimeField,
+    FloatField,
+    FloatPointValue,
+    FloatSeriesValues,
+    IntField,
+    LeaderboardEntry,
+    StringField,
+    StringSetField,
+)
+from neptune.attributes.series.fetchable_series import _arrays_to_data_frame
+from neptune.integrations.pandas import (
+    FieldToPandasValueVisitor,
+    make_row,
+    sort_key,
+    to_pandas,
+)
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+STEP_SIZE = 10_000
+
+
+def make_table(runs: int) -> SimpleNamespace:
+    def entries():
+        for index in range(runs):
+            fields = [
+                StringField(path="sys/id", value=f"RUN-{index}"),
+                DateTimeField(path="sys/creation_time", value=NOW + timedelta(seconds=index)),
+                StringSetField(path="sys/tags", values={"benchmark", f"group-{index % 10}"}),
+                BoolField(path="sys/failed", value=index % 7 == 0),
+                IntField(path="parameters/batch_size", value=32 * (index % 4 + 1)),
+            ]
+            fields.extend(
+                FloatField(path=f"metrics/metric_{metric}", value=index / (metric + 1)) for metric in range(20)
+            )
+            if index % 2:
+                fields.append(FloatField(path="metrics/sparse", value=float(index)))
+            yield LeaderboardEntry(object_id=str(index), fields=fields)
+
+    return SimpleNamespace(_entries=entries())
+
+
+def make_getter(points: int) -> Callable:
+    values = [FloatPointValue(step=float(step), value=step / points, timestamp=NOW) for step in range(points)]
+
+    def getter(from_step, limit):
+        start = 0 if from_step is None else int(from_step) + 1
+        return FloatSeriesValues(total=len(values), values=values[start : start + limit])
+
+    return getter
+
+
+def table_from_rows(runs: int) -> pd.DataFrame:
+    visitor = FieldToPandasValueVisitor()
+    rows = dict((n, make_row(entry, visitor)) for (n, entry) in enumerate(make_table(runs)._entries))
+    df = pd.DataFrame.from_dict(data=rows, orient="index")
+    return df.reindex(sorted(df.columns, key=sort_key), axis="columns")
+
+
+def table_from_columns(runs: int) -> pd.DataFrame:
+    return to_pandas(make_table(runs))
+
+
+def series_from_rows(points: int) -> pd.DataFrame:
+    data = fetch_series_values(make_getter(points), "metrics/loss", step_size=STEP_SIZE, progress_bar=False)
+    rows = dict((n, {"step": p.step, "value": p.value, "timestamp": p.timestamp}) for (n, p) in enumerate(data))
+    return pd.DataFrame.from_dict(data=rows, orient="index")
+
+
+def series_from_columns(points: int) -> pd.DataFrame:
+    arrays = fetch_series_values_as_arrays(make_getter(points), "metrics/loss", step_size=STEP_SIZE, progress_bar=False)
+    return _arrays_to_data_frame(arrays, include_timestamp=True)
+
+
+def measure(build: Callable[[int], pd.DataFrame], size: int) -> Tuple[float, float]:
+    """Returns wall time in seconds and peak RSS in MiB of building the data frame in the current process."""
+    start = time.perf_counter()
+    build(size)
+    elapsed = time.perf_counter() - start
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure_in_subprocess(build: Callable[[int], pd.DataFrame], size: int) -> Tuple[float, float]:
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(measure, (build, size))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=50_000)
+    parser.add_argument("--points", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    cases: List[Tuple[str, int, Callable, Callable]] = [
+        ("table", args.runs, table_from_rows, table_from_columns),
+        ("series", args.points, series_from_rows, series_from_columns),
+    ]
+
+    print(f"{'case':>8} {'size':>10} {'rows [s]':>9} {'columns [s]':>12} {'rows [MiB]':>11} {'columns [MiB]':>14}")
+    for name, size, from_rows, from_columns in cases:
+        rows_time, rows_rss = measure_in_subprocess(from_rows, size)
+        columns_time, columns_rss = measure_in_subprocess(from_columns, size)
+        print(f"{name:>8} {size:>10} {rows_time:>9.2f} {columns_time:>12.2f} {rows_rss:>11.0f} {columns_rss:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,20 +13,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime
+from datetime import (
+    datetime,
+    timezone,
+)
 
+import numpy as np
+import pytest
 from mock import (
     Mock,
     call,
 )
 
-from neptune.api.fetching_series_values import fetch_series_values
+from neptune.api.fetching_series_values import (
+    fetch_series_values,
+    fetch_series_values_as_arrays,
+    points_to_arrays,
+)
 from neptune.api.models import (
     FloatPointValue,
     FloatSeriesValues,
+    StringPointValue,
 )
 
 
+def series_getter(steps):
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    points = [FloatPointValue(step=step, value=float(index), timestamp=now) for index, step in enumerate(steps)]
+
+    def getter(from_step, limit):
+        start = 0 if from_step is None else next((i for i, p in enumerate(points) if p.step > from_step), len(points))
+        return FloatSeriesValues(total=len(points), values=points[start : start + limit])
+
+    return getter, points
+
+
 def test__empty():
     # given
     getter_mock = Mock()
@@ -158,3 +179,88 @@ def test__multiple_pages():
         call(from_step=0.0, limit=2),
         call(from_step=2.0, limit=2),
     ]
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        list(range(1, 1001)),
+        [step * 0.5 for step in range(1000)],
+        # steps getting denser, so shard boundaries estimated from the first page are off
+        list(range(0, 200, 10)) + list(range(200, 1180)),
+    ],
+)
+def test__concurrent_matches_sequential(steps):
+    # given
+    getter, points = series_getter(steps)
+
+    # when
+    results = fetch_series_values(getter=getter, path="some/path", step_size=7, max_workers=4)
+
+    # then
+    assert list(results) == points
+
+
+@pytest.mark.parametrize(
+    "steps, step_size",
+    [
+        # a single point on the first page
+        (list(range(20)), 1),
+        # no span of steps on the first page
+        ([0, 0, 0] + list(range(1, 20)), 3),
+    ],
+)
+def test__concurrent_falls_back_to_sequential_without_step_density(steps, step_size):
+    # given
+    getter, points = series_getter(steps)
+
+    # when
+    results = fetch_series_values(getter=getter, path="some/path", step_size=step_size, max_workers=4)
+
+    # then
+    assert list(results) == points
+
+
+def test__concurrent_short_series_is_fetched_sequentially():
+    # given
+    getter, points = series_getter(range(10))
+    getter_mock = Mock(side_effect=getter)
+
+    # when
+    results = fetch_series_values(getter=getter_mock, path="some/path", step_size=5, max_workers=4)
+
+    # then
+    assert list(results) == points
+    assert getter_mock.call_args_list == [
+        call(from_step=None, limit=1),
+        call(from_step=-1, limit=5),
+        call(from_step=4, limit=5),
+    ]
+
+
+def test__as_arrays():
+    # given
+    getter, points = series_getter([1, 2, 5])
+
+    # when
+    arrays = fetch_series_values_as_arrays(getter=getter, path="some/path")
+
+    # then
+    np.testing.assert_array_equal(arrays.steps, np.array([1.0, 2.0, 5.0]))
+    np.testing.assert_array_equal(arrays.values, np.array([0.0, 1.0, 2.0]))
+    np.testing.assert_array_equal(arrays.timestamps, np.array(["2024-01-01"] * 3, dtype="datetime64[ms]"))
+
+
+def test__points_to_arrays_from_iterator():
+    # given
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    points = (StringPointValue(step=step, value=f"line {step}", timestamp=now) for step in range(3))
+
+    # when
+    arrays = points_to_arrays(points)
+
+    # then
+    np.testing.assert_array_equal(arrays.steps, np.array([0.0, 1.0, 2.0]))
+    assert arrays.values.dtype == object
+    assert list(arrays.values) == ["line 0", "line 1", "line 2"]
+    assert len(points_to_arrays(iter([])).steps) == 0
@@ -0,0 +1,107 @@
+from http import HTTPStatus
+
+import httpx
+import pytest
+from mock import (
+    Mock,
+    patch,
+)
+from neptune_api.proto.neptune_pb.ingest.v1.common_pb2 import (
+    UpdateRunSnapshot,
+    Value,
+)
+from neptune_api.proto.neptune_pb.ingest.v1.pub import ingest_pb2
+
+from neptune.api.ingestion_sink import (
+    ApiIngestionSink,
+    LocalIngestionSink,
+)
+from neptune.api.operations import (
+    AssignFloat,
+    FloatValue,
+    LogFloats,
+)
+from neptune.internal.exceptions import NeptuneConnectionLostException
+
+
+def test_local_sink_records_operations():
+    sink = LocalIngestionSink(project="project", run_id="run_id")
+
+    accepted = sink.submit([AssignFloat("a", 1.0), AssignFloat("b", 2.0)])
+
+    assert accepted == 2
+    assert sink.received == [
+        ingest_pb2.RunOperation(
+            project="project", run_id="run_id", update=UpdateRunSnapshot(assign={"a": Value(float64=1.0)})
+        ),
+        ingest_pb2.RunOperation(
+            project="project", run_id="run_id", update=UpdateRunSnapshot(assign={"b": Value(float64=2.0)})
+        ),
+    ]
+
+
+def test_local_sink_accepts_partial_batches():
+    sink = LocalIngestionSink(max_batch_size=2)
+
+    assert sink.submit([AssignFloat(str(i), float(i)) for i in range(3)]) == 2
+    assert len(sink.received) == 2
+
+
+@patch("neptune.api.ingestion_sink.submit_operation")
+def test_api_sink_returns_accepted_prefix_on_connection_error(submit_operation):
+    submit_operation.sync_detailed.side_effect = [Mock(status_code=HTTPStatus.OK), httpx.ConnectError("down")]
+    sink = ApiIngestionSink(client=Mock(), project="project", run_id="run_id")
+
+    assert sink.submit([AssignFloat("a", 1.0), AssignFloat("b", 2.0)]) == 1
+
+
+@patch("neptune.api.ingestion_sink.submit_operation")
+def test_api_sink_raises_connection_lost_when_nothing_accepted(submit_operation):
+    submit_operation.sync_detailed.return_value = Mock(status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+    sink = ApiIngestionSink(client=Mock(), project="project", run_id="run_id")
+
+    with pytest.raises(NeptuneConnectionLostException):
+        sink.submit([AssignFloat("a", 1.0)])
+
+
+@patch("neptune.api.ingestion_sink.submit_operation")
+def test_api_sink_retries_throttled_requests(submit_operation):
+    submit_operation.sync_detailed.return_value = Mock(status_code=HTTPStatus.TOO_MANY_REQUESTS)
+    sink = ApiIngestionSink(client=Mock(), project="project", run_id="run_id")
+
+    with pytest.raises(NeptuneConnectionLostException):
+        sink.submit([AssignFloat("a", 1.0)])
+
+
+@patch("neptune.api.ingestion_sink.logger")
+@patch("neptune.api.ingestion_sink.submit_operation")
+def test_api_sink_skips_rejected_operation(submit_operation, logger):
+    submit_operation.sync_detailed.side_effect = [
+        Mock(status_code=HTTPStatus.BAD_REQUEST, content=b"bad"),
+        Mock(status_code=HTTPStatus.OK),
+    ]
+    sink = ApiIngestionSink(client=Mock(), project="project", run_id="run_id")
+
+    assert sink.submit([AssignFloat("a", 1.0), AssignFloat("b", 2.0)]) == 2
+    logger.error.assert_called_once()
+
+
+@patch("neptune.api.ingestion_sink.submit_operation")
+def test_api_sink_does_not_resend_accepted_requests_of_an_operation(submit_operation):
+    submit_operation.sync_detailed.side_effect = [
+        Mock(status_code=HTTPStatus.OK),
+        Mock(status_code=HTTPStatus.OK),
+        httpx.ConnectError("down"),
+        Mock(status_code=HTTPStatus.OK),
+    ]
+    sink = ApiIngestionSink(client=Mock(), project="project", run_id="run_id")
+    operations = [
+        AssignFloat("a", 1.0),
+        LogFloats("b", [FloatValue(timestamp=1.0, value=float(step), step=step) for step in range(2)]),
+    ]
+
+    assert sink.submit(operations) == 1
+    assert sink.submit(operations[1:]) == 1
+
+    bodies = [call.kwargs["body"] for call in submit_operation.sync_detailed.call_args_list]
+    assert [body.update.step.whole for body in bodies[1:]] == [0, 1, 1]
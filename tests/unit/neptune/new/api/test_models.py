@@ -2092,3 +2092,28 @@ def test__query_fields_result__from_proto():
     # then
     with pytest.raises(NotImplementedError):
         QueryFieldsResult.from_proto(proto)
+
+
+def test__leaderboard_entry__shares_paths_between_entries():
+    # given
+    data = {
+        "experimentId": "foo",
+        "attributes": [
+            {"type": "float", "floatProperties": {"attributeName": "".join(["metrics/", "loss"]), "value": 1}}
+        ],
+    }
+    other_data = {
+        "experimentId": "bar",
+        "attributes": [
+            {"type": "float", "floatProperties": {"attributeName": "".join(["metrics/", "loss"]), "value": 2}}
+        ],
+    }
+
+    # when
+    entry = LeaderboardEntry.from_dict(data)
+    other_entry = LeaderboardEntry.from_dict(other_data)
+
+    # then
+    assert entry.fields[0].path is other_entry.fields[0].path
+    assert not hasattr(entry, "__dict__")
+    assert not hasattr(entry.fields[0], "__dict__")
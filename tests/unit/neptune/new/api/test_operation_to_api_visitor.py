@@ -11,7 +11,11 @@ from neptune_api.proto.neptune_pb.ingest.v1.common_pb2 import (
 from neptune_api.proto.neptune_pb.ingest.v1.pub.ingest_pb2 import RunOperation as ProtoRunOperation
 
 import neptune.core.operations.operation as core_operations
-from neptune.api.operation_to_api import OperationToApiVisitor
+from neptune.api import operations as api_operations
+from neptune.api.operation_to_api import (
+    OperationToApiVisitor,
+    coalesce_operations,
+)
 from neptune.api.operations import RunOperation
 
 
@@ -115,3 +119,62 @@ def test_api_to_operation_visitor(
     res = run_op.to_proto()
 
     assert res == expected_proto_run_operation
+
+
+def test_coalesce_operations_merges_points_of_the_same_step_and_assignments_apart():
+    operations = [
+        core_operations.LogFloats(["a"], [core_operations.LogFloats.ValueType(1.0, 3, 10.0)]),
+        core_operations.AssignInt(["b"], 7),
+        core_operations.LogFloats(["c"], [core_operations.LogFloats.ValueType(2.0, 3, 11.0)]),
+        core_operations.AssignInt(["b"], 8),
+        core_operations.AssignString(["d"], "x"),
+    ]
+
+    coalesced = coalesce_operations(operations)
+
+    assert coalesced.operations == [
+        api_operations.UpdateRunSnapshot(
+            step=3,
+            timestamp=10.0,
+            append={"a": Value(float64=1.0), "c": Value(float64=2.0)},
+        ),
+        api_operations.UpdateRunSnapshot(assign={"b": Value(int64=8), "d": Value(string="x")}),
+    ]
+    assert coalesced.last_indices == [0, 1, 0, 1, 1]
+
+
+def test_coalesce_operations_splits_steps_and_repeated_paths():
+    operations = [
+        core_operations.LogFloats.from_columns(["a"], [1.0, 2.0], [1, 2], [10.0, 11.0]),
+        core_operations.LogFloats.from_columns(["b"], [3.0, 4.0], [1, 2], [10.0, 11.0]),
+        core_operations.LogFloats.from_columns(["a"], [5.0], [1], [12.0]),
+    ]
+
+    coalesced = coalesce_operations(operations)
+
+    assert coalesced.operations == [
+        api_operations.UpdateRunSnapshot(
+            step=1, timestamp=10.0, append={"a": Value(float64=1.0), "b": Value(float64=3.0)}
+        ),
+        api_operations.UpdateRunSnapshot(
+            step=2, timestamp=11.0, append={"a": Value(float64=2.0), "b": Value(float64=4.0)}
+        ),
+        api_operations.UpdateRunSnapshot(step=1, timestamp=12.0, append={"a": Value(float64=5.0)}),
+    ]
+    assert coalesced.last_indices == [1, 1, 2]
+    assert [coalesced.covered_count(submitted) for submitted in range(4)] == [0, 0, 2, 3]
+
+
+def test_coalesce_operations_keeps_run_creation_first():
+    operations = [
+        core_operations.RunCreation(datetime(2021, 1, 1), "custom_id"),
+        core_operations.AssignString(["a"], "x"),
+    ]
+
+    coalesced = coalesce_operations(operations)
+
+    assert coalesced.operations == [
+        api_operations.Run(datetime(2021, 1, 1), "custom_id"),
+        api_operations.UpdateRunSnapshot(assign={"a": Value(string="x")}),
+    ]
+    assert coalesced.last_indices == [0, 1]
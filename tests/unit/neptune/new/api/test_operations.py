@@ -20,6 +20,7 @@ from neptune.api.operations import (
     Run,
     RunOperation,
 )
+from neptune.api.operations import UpdateRunSnapshot as ApiUpdateRunSnapshot
 
 
 def test_assign_float():
@@ -114,6 +115,41 @@ def test_log_floats():
     )
 
 
+def test_log_floats_multiple_points():
+    op = LogFloats("path", [FloatValue(1.5, 1.0, 0.3), FloatValue(2, 2.0, None)])
+    run_op = RunOperation("project", "run_id", op)
+
+    serialized = op.to_protos(run_op)
+
+    assert serialized == [
+        ingest_pb2.RunOperation(
+            project="project",
+            run_id="run_id",
+            update=UpdateRunSnapshot(
+                step=Step(whole=0, micro=300000),
+                timestamp=timestamp_pb2.Timestamp(seconds=1, nanos=500000000),
+                append={"path": Value(float64=1.0)},
+            ),
+        ),
+        ingest_pb2.RunOperation(
+            project="project",
+            run_id="run_id",
+            update=UpdateRunSnapshot(
+                timestamp=timestamp_pb2.Timestamp(seconds=2),
+                append={"path": Value(float64=2.0)},
+            ),
+        ),
+    ]
+
+
+def test_log_floats_single_proto_holds_first_point():
+    op = LogFloats("path", [FloatValue(1, 1.0, 1), FloatValue(2, 2.0, 2)])
+    run_op = RunOperation("project", "run_id", op)
+
+    assert op.to_proto(run_op) == op.to_protos(run_op)[0]
+    assert run_op.to_proto() == op.to_protos(run_op)[0]
+
+
 def test_run_creation():
     op = Run(datetime(2021, 1, 1), "run_id")
 
@@ -131,3 +167,26 @@ def test_run_creation():
             experiment_id="run_id",
         ),
     )
+
+
+def test_update_run_snapshot():
+    op = ApiUpdateRunSnapshot(
+        step=2.5,
+        timestamp=1.25,
+        assign={"a": Value(int64=1)},
+        append={"b": Value(float64=2.0), "c": Value(float64=3.0)},
+    )
+    run_op = RunOperation("project", "run_id", op)
+
+    serialized = op.to_proto(run_op)
+
+    assert serialized == ingest_pb2.RunOperation(
+        project="project",
+        run_id="run_id",
+        update=UpdateRunSnapshot(
+            step=Step(whole=2, micro=500000),
+            timestamp=timestamp_pb2.Timestamp(seconds=1, nanos=250000000),
+            assign={"a": Value(int64=1)},
+            append={"b": Value(float64=2.0), "c": Value(float64=3.0)},
+        ),
+    )
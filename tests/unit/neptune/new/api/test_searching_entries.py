@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import time
 from typing import Sequence
 
 import pytest
@@ -30,6 +31,7 @@ from neptune.api.models import (
     StringField,
 )
 from neptune.api.searching_entries import (
+    _StepSizeTuner,
     get_single_page,
     iter_over_pages,
 )
@@ -79,7 +81,6 @@ def test__to_leaderboard_entry():
 def test__iter_over_pages__single_pagination(get_single_page_mock):
     # given
     get_single_page_mock.side_effect = [
-        LeaderboardEntriesSearchResult(matching_item_count=9, entries=[]),
         generate_leaderboard_entries(values=["a", "b", "c"]),
         generate_leaderboard_entries(values=["d", "e", "f"]),
         generate_leaderboard_entries(values=["g", "h", "j"]),
@@ -101,8 +102,6 @@ def test__iter_over_pages__single_pagination(get_single_page_mock):
     # then
     assert result == generate_leaderboard_entries(values=["a", "b", "c", "d", "e", "f", "g", "h", "j"]).entries
     assert get_single_page_mock.mock_calls == [
-        # total checking
-        call(limit=0, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(limit=3, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(limit=3, offset=3, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(limit=3, offset=6, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
@@ -114,7 +113,6 @@ def test__iter_over_pages__single_pagination(get_single_page_mock):
 def test__iter_over_pages__multiple_search_after(get_single_page_mock):
     # given
     get_single_page_mock.side_effect = [
-        LeaderboardEntriesSearchResult(matching_item_count=9, entries=[]),
         generate_leaderboard_entries(values=["a", "b", "c"]),
         generate_leaderboard_entries(values=["d", "e", "f"]),
         generate_leaderboard_entries(values=["g", "h", "j"]),
@@ -137,8 +135,6 @@ def test__iter_over_pages__multiple_search_after(get_single_page_mock):
     # then
     assert result == generate_leaderboard_entries(values=["a", "b", "c", "d", "e", "f", "g", "h", "j"]).entries
     assert get_single_page_mock.mock_calls == [
-        # total checking
-        call(limit=0, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(limit=3, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(limit=3, offset=3, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(limit=3, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after="f"),
@@ -150,7 +146,6 @@ def test__iter_over_pages__multiple_search_after(get_single_page_mock):
 def test__iter_over_pages__empty(get_single_page_mock):
     # given
     get_single_page_mock.side_effect = [
-        LeaderboardEntriesSearchResult(matching_item_count=0, entries=[]),
         generate_leaderboard_entries(values=[]),
     ]
 
@@ -169,8 +164,6 @@ def test__iter_over_pages__empty(get_single_page_mock):
     # then
     assert result == []
     assert get_single_page_mock.mock_calls == [
-        # total checking
-        call(limit=0, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(limit=3, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
     ]
 
@@ -179,7 +172,6 @@ def test__iter_over_pages__empty(get_single_page_mock):
 def test__iter_over_pages__max_server_offset(get_single_page_mock):
     # given
     get_single_page_mock.side_effect = [
-        LeaderboardEntriesSearchResult(matching_item_count=5, entries=[]),
         generate_leaderboard_entries(values=["a", "b", "c"]),
         generate_leaderboard_entries(values=["d", "e"]),
         generate_leaderboard_entries(values=[]),
@@ -201,8 +193,6 @@ def test__iter_over_pages__max_server_offset(get_single_page_mock):
     # then
     assert result == generate_leaderboard_entries(values=["a", "b", "c", "d", "e"]).entries
     assert get_single_page_mock.mock_calls == [
-        # total checking
-        call(limit=0, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(offset=0, limit=3, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(offset=3, limit=2, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(offset=0, limit=3, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after="e"),
@@ -216,7 +206,6 @@ def test__iter_over_pages__limit(get_single_page_mock):
 
     # given
     get_single_page_mock.side_effect = [
-        LeaderboardEntriesSearchResult(matching_item_count=5, entries=[]),
         generate_leaderboard_entries(values=["a", "b"]),
         generate_leaderboard_entries(values=["c", "d"]),
         generate_leaderboard_entries(values=["e"]),
@@ -237,13 +226,106 @@ def test__iter_over_pages__limit(get_single_page_mock):
 
     # then
     assert get_single_page_mock.mock_calls == [
-        # total checking
-        call(limit=0, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(offset=0, limit=2, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
         call(offset=2, limit=2, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None),
     ]
 
 
+def paged_leaderboard(values: Sequence, delays: Sequence = ()):
+    """Serves `values` sorted descending by sys/id, taking `delays[i]` seconds to serve the i-th page offset."""
+
+    def get_page(limit, offset, searching_after, **kwargs):
+        matching = [value for value in values if searching_after is None or value < searching_after]
+        if offset // max(limit, 1) < len(delays):
+            time.sleep(delays[offset // max(limit, 1)])
+        result = generate_leaderboard_entries(values=matching[offset : offset + limit])
+        return LeaderboardEntriesSearchResult(matching_item_count=len(matching), entries=result.entries)
+
+    return get_page
+
+
+@patch("neptune.api.searching_entries.get_single_page")
+def test__iter_over_pages__prefetch_preserves_order(get_single_page_mock):
+    # given
+    values = sorted((f"{index:03d}" for index in range(50)), reverse=True)
+    get_single_page_mock.side_effect = paged_leaderboard(values, delays=[0.0, 0.05, 0.0, 0.03])
+
+    # when
+    result = list(
+        iter_over_pages(
+            step_size=4,
+            limit=None,
+            sort_by="sys/id",
+            sort_by_column_type="string",
+            ascending=False,
+            progress_bar=None,
+            max_offset=20,
+            prefetch=3,
+        )
+    )
+
+    # then
+    assert result == generate_leaderboard_entries(values=values).entries
+    requested = {(c.kwargs["searching_after"], c.kwargs["offset"]) for c in get_single_page_mock.mock_calls}
+    assert requested == {
+        *((None, offset) for offset in (0, 4, 8, 12, 16)),
+        *(("030", offset) for offset in (0, 4, 8, 12, 16)),
+        *(("010", offset) for offset in (0, 4, 8, 12)),
+    }
+
+
+@patch("neptune.api.searching_entries.get_single_page")
+def test__iter_over_pages__prefetch_stops_at_limit(get_single_page_mock):
+    # given
+    get_single_page_mock.side_effect = paged_leaderboard([f"{index:03d}" for index in range(100, 0, -1)])
+
+    # when
+    result = list(
+        iter_over_pages(
+            step_size=10,
+            limit=25,
+            sort_by="sys/id",
+            sort_by_column_type="string",
+            ascending=False,
+            progress_bar=None,
+            prefetch=4,
+        )
+    )
+
+    # then
+    assert len(result) == 25
+    assert [(c.kwargs["offset"], c.kwargs["limit"]) for c in get_single_page_mock.mock_calls] == [
+        (0, 10),
+        (10, 10),
+        (20, 5),
+    ]
+
+
+def test__step_size_tuner():
+    # given
+    tuner = _StepSizeTuner(step_size=100, adaptive=True)
+    page = generate_leaderboard_entries(values=[str(index) for index in range(100)])
+
+    # when fast responses
+    tuner.update(page, latency=0.01)
+
+    # then the step size grows by at most a factor of 2
+    assert tuner.step_size == 200
+
+    # when slow responses
+    tuner.update(page, latency=20.0)
+
+    # then the step size shrinks by at most a factor of 2
+    assert tuner.step_size == 100
+
+    # when not adaptive
+    fixed = _StepSizeTuner(step_size=100, adaptive=False)
+    fixed.update(page, latency=0.01)
+
+    # then
+    assert fixed.step_size == 100
+
+
 def generate_leaderboard_entries(values: Sequence, experiment_id: str = "foo") -> LeaderboardEntriesSearchResult:
     return LeaderboardEntriesSearchResult(
         matching_item_count=len(values),
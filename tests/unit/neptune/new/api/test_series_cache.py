@@ -0,0 +1,162 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+from datetime import (
+    datetime,
+    timezone,
+)
+
+import numpy as np
+from mock import (
+    Mock,
+    call,
+)
+
+from neptune.api.models import (
+    FloatPointValue,
+    FloatSeriesValues,
+    StringPointValue,
+    StringSeriesValues,
+)
+from neptune.api.series_cache import SeriesCache
+
+KEY = ("project-id", "run", "RUN-1", "train/loss")
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Series:
+    def __init__(self, steps, point_type=FloatPointValue, values_type=FloatSeriesValues, value=float):
+        self.points = [point_type(step=step, value=value(step), timestamp=NOW) for step in steps]
+        self.values_type = values_type
+        self.getter = Mock(side_effect=self._get)
+
+    def _get(self, from_step, limit):
+        start = 0 if from_step is None else sum(1 for point in self.points if point.step <= from_step)
+        return self.values_type(total=len(self.points), values=self.points[start : start + limit])
+
+
+def test_caches_fetched_series(tmp_path):
+    # given
+    cache = SeriesCache(tmp_path)
+    series = Series(range(1, 6))
+
+    # when
+    first = cache.fetch(KEY, series.getter, "train/loss", step_size=2)
+    series.getter.reset_mock()
+    second = cache.fetch(KEY, series.getter, "train/loss", step_size=2)
+
+    # then
+    np.testing.assert_array_equal(first.steps, [1, 2, 3, 4, 5])
+    np.testing.assert_array_equal(second.steps, first.steps)
+    np.testing.assert_array_equal(second.values, first.values)
+    np.testing.assert_array_equal(second.timestamps, first.timestamps)
+    assert series.getter.call_args_list == [call(from_step=None, limit=1)]
+
+
+def test_fetches_only_new_points(tmp_path):
+    # given
+    cache = SeriesCache(tmp_path)
+    series = Series(range(1, 6))
+    cache.fetch(KEY, series.getter, "train/loss", step_size=2)
+
+    # when
+    series.points += Series([6, 7]).points
+    series.getter.reset_mock()
+    result = cache.fetch(KEY, series.getter, "train/loss", step_size=2)
+
+    # then
+    np.testing.assert_array_equal(result.steps, [1, 2, 3, 4, 5, 6, 7])
+    np.testing.assert_array_equal(result.values, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+    assert series.getter.call_args_list == [
+        call(from_step=None, limit=1),
+        call(from_step=5.0, limit=2),
+        call(from_step=7, limit=2),
+    ]
+
+
+def test_refetches_series_that_shrank(tmp_path):
+    # given
+    cache = SeriesCache(tmp_path)
+    series = Series(range(1, 6))
+    cache.fetch(KEY, series.getter, "train/loss", step_size=2)
+
+    # when
+    series.points = Series([1, 2]).points
+    result = cache.fetch(KEY, series.getter, "train/loss", step_size=2)
+
+    # then
+    np.testing.assert_array_equal(result.steps, [1, 2])
+    np.testing.assert_array_equal(cache.fetch(KEY, series.getter, "train/loss").steps, [1, 2])
+
+
+def test_refetches_series_logged_anew(tmp_path):
+    # given
+    cache = SeriesCache(tmp_path)
+    series = Series(range(1, 6))
+    cache.fetch(KEY, series.getter, "train/loss", step_size=2)
+
+    # when
+    series.points = Series(range(10, 20)).points
+    result = cache.fetch(KEY, series.getter, "train/loss", step_size=2)
+
+    # then
+    np.testing.assert_array_equal(result.steps, list(range(10, 20)))
+
+
+def test_caches_string_series(tmp_path):
+    # given
+    cache = SeriesCache(tmp_path)
+    series = Series(range(1, 4), point_type=StringPointValue, values_type=StringSeriesValues, value=str)
+
+    # when
+    cache.fetch(KEY, series.getter, "monitoring/stdout")
+    result = cache.fetch(KEY, series.getter, "monitoring/stdout")
+
+    # then
+    assert list(result.values) == ["1", "2", "3"]
+
+
+def test_caches_string_values_as_fetched(tmp_path):
+    # given
+    cache = SeriesCache(tmp_path)
+    lines = ["a" * 100_000, "trailing\0", "zażółć", ""]
+    series = Series(range(4), point_type=StringPointValue, values_type=StringSeriesValues, value=lines.__getitem__)
+
+    # when
+    cache.fetch(KEY, series.getter, "monitoring/stdout")
+    result = cache.fetch(KEY, series.getter, "monitoring/stdout")
+
+    # then
+    assert list(result.values) == lines
+    assert cache.path_for(KEY).stat().st_size < 2 * len(lines[0])
+
+
+def test_evicts_least_recently_used_series(tmp_path):
+    # given
+    series = Series(range(1000))
+    cache = SeriesCache(tmp_path / "cache")
+    keys = [KEY[:-1] + (f"metric_{index}",) for index in range(3)]
+    for last_used, key in enumerate(keys):
+        cache.fetch(key, series.getter, key[-1])
+        os.utime(cache.path_for(key), (last_used, last_used))
+
+    # when
+    cache = SeriesCache(tmp_path / "cache", max_size=int(os.path.getsize(cache.path_for(keys[0])) * 2.5))
+    cache.fetch(KEY, series.getter, "train/loss")
+
+    # then
+    assert [cache.path_for(key).exists() for key in keys] == [False, False, True]
+    assert cache.path_for(KEY).exists()
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import numpy as np
+import pandas as pd
 import pytest
 from mock import (
     MagicMock,
@@ -21,6 +23,7 @@ from mock import (
 
 from neptune.attributes.series.float_series import FloatSeries
 from neptune.exceptions import NeptuneUnsupportedFunctionalityException
+from neptune.internal.operation import LogFloats
 from neptune.internal.warnings import NeptuneUnsupportedValue
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
@@ -39,6 +42,36 @@ class TestFloatSeries(TestAttributeBase):
             with self.assertRaises(Exception):
                 FloatSeries(MagicMock(), MagicMock()).log(value)
 
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_extend_with_arrays(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            path = self._random_path()
+            var = FloatSeries(exp, path)
+            with pytest.warns(NeptuneUnsupportedValue):
+                var.extend(
+                    np.array([1.0, float("nan"), 3.0]), steps=np.arange(3), timestamps=pd.Series([7.0, 8.0, 9.0])
+                )
+
+            processor.enqueue_operations.assert_called_once_with(
+                [LogFloats.from_columns(path, [1.0, 3.0], [0, 2], [7.0, 9.0])], wait=False
+            )
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_extend_splits_into_batches(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            var = FloatSeries(exp, self._random_path())
+            var.extend(list(range(2500)), steps=list(range(2500)))
+
+            (ops,), _ = processor.enqueue_operations.call_args
+            assert [len(op.values) for op in ops] == [1000, 1000, 500]
+            assert ops[1].values[0] == LogFloats.ValueType(1000.0, 1000, self._now())
+
     @pytest.mark.xfail(reason="fetch_last disabled", strict=True, raises=NeptuneUnsupportedFunctionalityException)
     def test_get(self):
         with self._exp() as exp:
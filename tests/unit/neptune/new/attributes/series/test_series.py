@@ -15,7 +15,6 @@
 #
 from mock import (
     MagicMock,
-    call,
     patch,
 )
 
@@ -50,29 +49,16 @@ class TestSeries(TestAttributeBase):
         with self._exp() as exp:
             var = FloatSeries(exp, path)
             var.assign(value, wait=wait)
-            processor.enqueue_operation.assert_has_calls(
+            processor.enqueue_operations.assert_called_once_with(
                 [
-                    call(ConfigFloatSeries(path, min=0, max=100, unit="%"), wait=False),
-                    call(ClearFloatLog(path), wait=False),
-                    call(
-                        LogFloats(
-                            path,
-                            [
-                                LogFloats.ValueType(17, None, self._now()),
-                            ],
-                        ),
-                        wait=wait,
+                    ConfigFloatSeries(path, min=0, max=100, unit="%"),
+                    ClearFloatLog(path),
+                    LogFloats(
+                        path,
+                        [LogFloats.ValueType(17, None, self._now()), LogFloats.ValueType(3.6, None, self._now())],
                     ),
-                    call(
-                        LogFloats(
-                            path,
-                            [
-                                LogFloats.ValueType(3.6, None, self._now()),
-                            ],
-                        ),
-                        wait=wait,
-                    ),
-                ]
+                ],
+                wait=wait,
             )
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
@@ -87,7 +73,7 @@ class TestSeries(TestAttributeBase):
             )
             var = StringSeries(exp, path)
             var.assign(StringSeriesVal([]), wait=wait)
-            processor.enqueue_operation.assert_called_with(ClearStringLog(path), wait=wait)
+            processor.enqueue_operations.assert_called_with([ClearStringLog(path)], wait=wait)
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_log(self, get_operation_processor):
@@ -131,7 +117,7 @@ class TestSeries(TestAttributeBase):
                 )
                 var = FloatSeries(exp, path)
                 var.log(value, wait=wait)
-                processor.enqueue_operation.assert_has_calls([call(LogFloats(path, [e]), wait=wait) for e in expected])
+                processor.enqueue_operations.assert_called_with([LogFloats(path, expected)], wait=wait)
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_log_with_step(self, get_operation_processor):
@@ -154,7 +140,7 @@ class TestSeries(TestAttributeBase):
                 )
                 var = FloatSeries(exp, path)
                 var.log(value, step=step, wait=wait)
-                processor.enqueue_operation.assert_called_with(LogFloats(path, [expected]), wait=wait)
+                processor.enqueue_operations.assert_called_with([LogFloats(path, [expected])], wait=wait)
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_log_with_timestamp(self, get_operation_processor):
@@ -174,7 +160,7 @@ class TestSeries(TestAttributeBase):
                 )
                 var = FloatSeries(exp, path)
                 var.log(value, timestamp=ts, wait=wait)
-                processor.enqueue_operation.assert_called_with(LogFloats(path, [expected]), wait=wait)
+                processor.enqueue_operations.assert_called_with([LogFloats(path, [expected])], wait=wait)
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_log_value_errors(self, get_operation_processor):
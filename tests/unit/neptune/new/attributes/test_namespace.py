@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from mock import (
+    MagicMock,
+    patch,
+)
+
+from neptune.attributes.namespace import Namespace
+from neptune.internal.operation import (
+    AssignFloat,
+    AssignString,
+    ClearFloatLog,
+    ConfigFloatSeries,
+    LogFloats,
+)
+from neptune.types.series.float_series import FloatSeries as FloatSeriesVal
+from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
+
+
+@patch("time.time", new=TestAttributeBase._now)
+class TestNamespace(TestAttributeBase):
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_assign_enqueues_operations_in_single_call(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            path, wait = (
+                self._random_path(),
+                self._random_wait(),
+            )
+            exp.set_attribute("/".join(path), Namespace(exp, path))
+            processor.reset_mock()
+
+            exp["/".join(path)].assign(
+                {"lr": 0.1, "nested": {"name": "test"}, "loss": FloatSeriesVal([0.5], steps=[1])}, wait=wait
+            )
+
+            processor.enqueue_operation.assert_not_called()
+            processor.enqueue_operations.assert_called_once_with(
+                [
+                    AssignFloat(path + ["lr"], 0.1),
+                    AssignString(path + ["nested", "name"], "test"),
+                    ConfigFloatSeries(path + ["loss"], min=None, max=None, unit=None),
+                    ClearFloatLog(path + ["loss"]),
+                    LogFloats(path + ["loss"], [LogFloats.ValueType(0.5, 1, self._now())]),
+                ],
+                wait=wait,
+            )
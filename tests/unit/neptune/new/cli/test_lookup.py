@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+from unittest.mock import MagicMock
+
+from neptune.api.models import (
+    BoolField,
+    LeaderboardEntry,
+    StringField,
+)
+from neptune.cli.lookup import (
+    ContainerLookupCache,
+    get_metadata_containers,
+)
+from neptune.exceptions import MetadataContainerNotFound
+from neptune.internal.backends.api_model import (
+    ApiExperiment,
+    Project,
+)
+from neptune.internal.container_type import ContainerType
+from neptune.internal.id_formats import UniqueId
+
+PROJECT = Project(id=UniqueId("project-id"), name="project", workspace="workspace", sys_id="PRO")
+
+
+def experiment(custom_id: str) -> ApiExperiment:
+    return ApiExperiment(
+        id=UniqueId(f"uuid-{custom_id}"),
+        type=ContainerType.RUN,
+        sys_id=f"PRO-{custom_id}",
+        workspace=PROJECT.workspace,
+        project_name=PROJECT.name,
+    )
+
+
+class Server:
+    """Runs of a single project, searchable by their custom run ids."""
+
+    def __init__(self, custom_ids):
+        self.runs = {custom_id: experiment(custom_id) for custom_id in custom_ids}
+        self.backend = MagicMock()
+        self.backend.get_project.return_value = PROJECT
+        self.backend.search_leaderboard_entries.side_effect = self._search
+        self.backend.get_metadata_container.side_effect = self._get
+
+    def _search(self, project_id, types, query, columns, limit, progress_bar):
+        assert project_id == PROJECT.id
+        for custom_id in re.findall(r'`sys/custom_run_id`:string = "([^"]*)"', str(query)):
+            if custom_id in self.runs:
+                run = self.runs[custom_id]
+                yield LeaderboardEntry(
+                    object_id=run.id,
+                    fields=[
+                        StringField(path="sys/id", value=run.sys_id),
+                        StringField(path="sys/custom_run_id", value=custom_id),
+                        BoolField(path="sys/trashed", value=False),
+                    ],
+                )
+
+    def _get(self, container_id, expected_container_type):
+        if container_id not in self.runs:
+            raise MetadataContainerNotFound.of_container_type(
+                container_type=expected_container_type, container_id=container_id
+            )
+        return self.runs[container_id]
+
+
+def keys(custom_ids):
+    return [(ContainerType.RUN, UniqueId(custom_id)) for custom_id in custom_ids]
+
+
+def test_searches_containers_of_their_projects_in_chunks():
+    # given
+    server = Server([str(i) for i in range(120)])
+
+    # when
+    result = get_metadata_containers(
+        server.backend, keys(server.runs), projects={key: "workspace/project" for key in keys(server.runs)}
+    )
+
+    # then
+    assert result == {key: experiment(key[1]) for key in keys(server.runs)}
+    assert server.backend.search_leaderboard_entries.call_count == 3
+    server.backend.get_metadata_container.assert_not_called()
+
+
+def test_looks_up_containers_of_unknown_projects_one_by_one():
+    # given
+    server = Server([str(i) for i in range(10)])
+
+    # when
+    result = get_metadata_containers(
+        server.backend, keys([*server.runs, "deleted"]), projects={keys(["0"])[0]: "workspace/project"}, max_workers=2
+    )
+
+    # then
+    assert result == {**{key: experiment(key[1]) for key in keys(server.runs)}, (ContainerType.RUN, "deleted"): None}
+    assert server.backend.get_metadata_container.call_count == 10
+    server.backend.search_leaderboard_entries.assert_called_once()
+
+
+def test_looks_up_containers_missing_sys_id_one_by_one():
+    # given
+    server = Server(["a"])
+    search = server.backend.search_leaderboard_entries.side_effect
+    server.backend.search_leaderboard_entries.side_effect = lambda **kwargs: [
+        LeaderboardEntry(object_id=entry.object_id, fields=[f for f in entry.fields if f.path != "sys/id"])
+        for entry in search(**kwargs)
+    ]
+
+    # when
+    result = get_metadata_containers(server.backend, keys(["a"]), projects={keys(["a"])[0]: "workspace/project"})
+
+    # then
+    assert result == {keys(["a"])[0]: experiment("a")}
+    server.backend.get_metadata_container.assert_called_once()
+
+
+def test_caches_looked_up_containers(tmp_path):
+    # given
+    server = Server(["a", "b"])
+    get_metadata_containers(server.backend, keys(["a", "b", "deleted"]), cache=ContainerLookupCache(tmp_path / "c"))
+    server.backend.reset_mock()
+
+    # when
+    result = get_metadata_containers(
+        server.backend, keys(["a", "b", "deleted"]), cache=ContainerLookupCache(tmp_path / "c")
+    )
+
+    # then
+    assert result == {**{key: experiment(key[1]) for key in keys(["a", "b"])}, (ContainerType.RUN, "deleted"): None}
+    server.backend.get_metadata_container.assert_not_called()
+    server.backend.search_leaderboard_entries.assert_not_called()
+
+
+def test_looks_up_containers_again_once_cache_expires(tmp_path):
+    # given
+    server = Server(["a"])
+    get_metadata_containers(server.backend, keys(["a"]), cache=ContainerLookupCache(tmp_path / "c", ttl=-1))
+    server.backend.reset_mock()
+
+    # when
+    get_metadata_containers(server.backend, keys(["a"]), cache=ContainerLookupCache(tmp_path / "c", ttl=-1))
+
+    # then
+    server.backend.get_metadata_container.assert_called_once()
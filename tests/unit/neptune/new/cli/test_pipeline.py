@@ -0,0 +1,135 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+import pytest
+
+from neptune.cli.pipeline import (
+    AdaptiveBatchSize,
+    BatchReader,
+)
+from neptune.core.components.queue.disk_queue import DiskQueue
+from neptune.exceptions import MalformedOperation
+
+
+def _disk_queue(path, from_dict=lambda x: x):
+    return DiskQueue(data_path=path, to_dict=lambda x: x, from_dict=from_dict, lock=threading.RLock())
+
+
+def test_batch_size_grows_when_requests_are_fast():
+    # given
+    batch_size = AdaptiveBatchSize(initial=100, maximum=400, target_latency=2.0)
+
+    # when
+    batch_size.record(count=100, size_bytes=1000, latency=0.1)
+
+    # then
+    assert batch_size.value == 150
+
+    # when
+    for _ in range(10):
+        batch_size.record(count=batch_size.value, size_bytes=1000, latency=0.1)
+
+    # then
+    assert batch_size.value == 400
+
+
+def test_batch_size_shrinks_when_requests_are_slow():
+    # given
+    batch_size = AdaptiveBatchSize(initial=1000, minimum=300, target_latency=2.0)
+
+    # when
+    batch_size.record(count=1000, size_bytes=1000, latency=5.0)
+
+    # then
+    assert batch_size.value == 500
+
+    # when
+    batch_size.record(count=500, size_bytes=1000, latency=5.0)
+
+    # then
+    assert batch_size.value == 300
+
+
+def test_batch_size_does_not_grow_past_payload_limit():
+    # given
+    batch_size = AdaptiveBatchSize(initial=100, target_latency=2.0, max_payload_bytes=1200)
+
+    # when
+    batch_size.record(count=100, size_bytes=1000, latency=0.1)
+
+    # then
+    assert batch_size.value == 120
+
+
+def test_batch_size_ignores_partial_batches():
+    # given
+    batch_size = AdaptiveBatchSize(initial=100, target_latency=2.0)
+
+    # when
+    batch_size.record(count=10, size_bytes=100, latency=0.1)
+
+    # then
+    assert batch_size.value == 100
+
+
+def test_reader_yields_batches_in_order(tmp_path):
+    # given
+    with _disk_queue(tmp_path) as disk_queue:
+        for i in range(25):
+            disk_queue.put(f"op-{i}")
+        disk_queue.flush()
+
+        # when
+        with BatchReader(disk_queue, AdaptiveBatchSize(initial=10), lock=threading.Lock(), read_ahead=1) as reader:
+            batches = list(reader)
+
+    # then
+    assert [batch.version for batch in batches] == [10, 20, 25]
+    assert [op for batch in batches for op in batch.operations] == [f"op-{i}" for i in range(25)]
+    assert all(batch.size_bytes > 0 for batch in batches)
+
+
+def test_reader_propagates_decoding_errors(tmp_path):
+    # given
+    def from_dict(_):
+        raise ValueError("cannot decode")
+
+    with _disk_queue(tmp_path, from_dict=from_dict) as disk_queue:
+        disk_queue.put("op-0")
+        disk_queue.flush()
+
+        # expect
+        with pytest.raises(MalformedOperation):
+            with BatchReader(disk_queue, AdaptiveBatchSize(), lock=threading.Lock()) as reader:
+                list(reader)
+
+
+def test_reader_stops_when_consumer_exits_early(tmp_path):
+    # given
+    with _disk_queue(tmp_path) as disk_queue:
+        for i in range(100):
+            disk_queue.put(f"op-{i}")
+        disk_queue.flush()
+
+        # when
+        with BatchReader(disk_queue, AdaptiveBatchSize(initial=1), lock=threading.Lock(), read_ahead=1) as reader:
+            first = next(iter(reader))
+
+    # then
+    assert first.operations == ["op-0"]
+    assert not reader._thread.is_alive()
@@ -0,0 +1,50 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from mock import patch
+
+from neptune.cli.progress import SyncProgress
+
+
+@patch("neptune.cli.progress.time.monotonic")
+def test_throughput_and_eta(monotonic):
+    # given
+    monotonic.return_value = 100.0
+    progress = SyncProgress(total_containers=2)
+
+    # when
+    progress.add_pending(300)
+    monotonic.return_value = 110.0
+    progress.advance(100)
+    progress.container_done()
+
+    # then
+    assert progress.synced_operations == 100
+    assert progress.pending_operations == 200
+    assert progress.synced_containers == 1
+    assert progress.throughput == 10.0
+    assert progress.eta == 20.0
+
+
+@patch("neptune.cli.progress.time.monotonic")
+def test_eta_unknown_before_first_batch(monotonic):
+    # given
+    monotonic.return_value = 100.0
+    progress = SyncProgress(total_containers=1)
+    progress.add_pending(10)
+
+    # expect
+    assert progress.eta is None
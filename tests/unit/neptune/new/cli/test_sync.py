@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 
+import threading
 from unittest.mock import MagicMock
 
 import mock
@@ -426,3 +427,92 @@ def test_sync_non_existent_offline_containers(tmp_path, capsys, backend):
     captured = capsys.readouterr()
     assert "Offline container foo__bar not found on disk." in captured.out
     assert "Offline container model__bar not found on disk." in captured.out
+
+
+def test_sync_all_containers_concurrently(tmp_path, mocker, capsys, backend):
+    # given
+    containers = [
+        prepare_v2_container(
+            container_type=ContainerType.RUN, path=tmp_path, last_ack_version=1, pid=2500 + i, key=f"key{i}"
+        )
+        for i in range(3)
+    ]
+
+    # and
+    get_container_impl = generate_get_metadata_container(registered_containers=containers)
+    mocker.patch.object(backend, "get_metadata_container", get_container_impl)
+    mocker.patch.object(Operation, "from_dict", lambda x: x)
+
+    # and - every worker has to reach the barrier, which is only possible when containers are synced concurrently
+    barrier = threading.Barrier(len(containers), timeout=10)
+
+    def execute_operations_concurrently(**kwargs):
+        barrier.wait()
+        return execute_operations(**kwargs)
+
+    backend.execute_operations.side_effect = execute_operations_concurrently
+
+    # when
+    SyncRunner.sync_all(backend=backend, base_path=tmp_path, project_name="foo", jobs=len(containers))
+
+    # then
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "Synchronized 6 operations from 3/3 objects" in captured.out
+
+    # and - operations of every container are sent in order
+    backend.execute_operations.assert_has_calls(
+        calls=[
+            mocker.call(
+                container_id=container.id,
+                container_type=ContainerType.RUN,
+                operations=["op-1", "op-2"],
+                operation_storage=mock.ANY,
+            )
+            for container in containers
+        ],
+        any_order=True,
+    )
+
+
+def test_sync_all_concurrently_propagates_failure(tmp_path, mocker, backend):
+    # given
+    containers = [
+        prepare_v2_container(
+            container_type=ContainerType.RUN, path=tmp_path, last_ack_version=1, pid=2500 + i, key=f"key{i}"
+        )
+        for i in range(4)
+    ]
+
+    # and
+    get_container_impl = generate_get_metadata_container(registered_containers=containers)
+    mocker.patch.object(backend, "get_metadata_container", get_container_impl)
+    mocker.patch.object(Operation, "from_dict", lambda x: x)
+    backend.execute_operations.side_effect = RuntimeError("boom")
+
+    # expect
+    with pytest.raises(RuntimeError, match="boom"):
+        SyncRunner.sync_all(backend=backend, base_path=tmp_path, project_name="foo", jobs=2)
+
+
+def test_sync_acknowledges_partially_processed_batches(tmp_path, mocker, backend):
+    # given
+    container = prepare_v2_container(
+        container_type=ContainerType.RUN, path=tmp_path, last_ack_version=0, pid=2501, key="a1b2c3"
+    )
+
+    # and
+    get_container_impl = generate_get_metadata_container(registered_containers=(container,))
+    mocker.patch.object(backend, "get_metadata_container", get_container_impl)
+    mocker.patch.object(Operation, "from_dict", lambda x: x)
+    backend.execute_operations.side_effect = lambda operations, **_: (1, [])
+
+    # when
+    SyncRunner.sync_all(backend=backend, base_path=tmp_path, project_name="foo")
+
+    # then
+    assert [call.kwargs["operations"] for call in backend.execute_operations.call_args_list] == [
+        ["op-0", "op-1", "op-2"],
+        ["op-1", "op-2"],
+        ["op-2"],
+    ]
@@ -15,7 +15,12 @@
 #
 import uuid
 
-from neptune.cli.utils import detect_async_dir
+from neptune.cli.containers import ExecutionDirectory
+from neptune.cli.utils import (
+    detect_async_dir,
+    get_recorded_project,
+)
+from neptune.core.components.metadata_file import MetadataFile
 from neptune.internal.container_type import ContainerType
 from neptune.internal.id_formats import UniqueId
 from neptune.objects.structure_version import StructureVersion
@@ -66,3 +71,19 @@ def test__split_dir_name():
         random_id,
         StructureVersion.DIRECT_DIRECTORY,
     )
+
+
+def test_get_recorded_project(tmp_path):
+    # given
+    legacy, recent = tmp_path / "legacy", tmp_path / "recent"
+    legacy.mkdir()
+    recent.mkdir()
+    MetadataFile(data_path=legacy, metadata={"mode": "async"})
+    MetadataFile(data_path=recent, metadata={"mode": "async", "project": "workspace/project"})
+
+    def execution_dir(path):
+        return ExecutionDirectory(path=path, synced=False, structure_version=StructureVersion.DIRECT_DIRECTORY)
+
+    # then
+    assert get_recorded_project([execution_dir(legacy)]) is None
+    assert get_recorded_project([execution_dir(legacy), execution_dir(recent)]) == "workspace/project"
@@ -24,11 +24,13 @@ from mock import patch
 
 from neptune import ANONYMOUS_API_TOKEN
 from neptune.api.models import (
+    BoolField,
     DateTimeField,
     FieldDefinition,
     FieldType,
     FloatField,
     FloatSeriesField,
+    IntField,
     LeaderboardEntry,
     ObjectStateField,
     StringField,
@@ -78,8 +80,8 @@ class AbstractTablesTestMixin:
             FloatField(path="float", value=12.5),
             StringField(path="string", value="some text"),
             DateTimeField(path="datetime", value=now),
-            FloatSeriesField(path="float/series", last=8.7),
-            StringSeriesField(path="string/series", last="last text"),
+            FloatSeriesField(path="float/series", last=8.7, last_step=3.0),
+            StringSeriesField(path="string/series", last="last text", last_step=3.0),
             StringSetField(path="string/set", values={"a", "b"}),
         ]
 
@@ -116,6 +118,34 @@ class AbstractTablesTestMixin:
         self.assertEqual("last text", df["string/series"][1])
         self.assertEqual({"a", "b"}, set(df["string/set"][1].split(",")))
 
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_as_pandas_column_types(self, search_leaderboard_entries):
+        # given
+        search_leaderboard_entries.return_value = [
+            LeaderboardEntry(
+                object_id=str(uuid.uuid4()),
+                fields=[IntField(path="int", value=1), IntField(path="sparse_int", value=2)],
+            ),
+            LeaderboardEntry(object_id=str(uuid.uuid4()), fields=[]),
+            LeaderboardEntry(
+                object_id=str(uuid.uuid4()),
+                fields=[IntField(path="int", value=3), FloatField(path="sparse_int", value=4.5)],
+            ),
+        ]
+        for entry in search_leaderboard_entries.return_value:
+            entry.fields.append(BoolField(path="bool", value=True))
+
+        # when
+        df = self.get_table().to_pandas()
+
+        # then
+        self.assertEqual([0, 1, 2], list(df.index))
+        self.assertEqual(["bool", "int", "sparse_int"], list(df.columns))
+        self.assertEqual("bool", df["bool"].dtype)
+        self.assertEqual("float64", df["int"].dtype)
+        self.assertEqual([1.0, 3.0], list(df["int"].dropna()))
+        self.assertEqual([2.0, 4.5], list(df["sparse_int"].dropna()))
+
     @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
     def test_get_table_as_rows(self, search_leaderboard_entries):
         # given
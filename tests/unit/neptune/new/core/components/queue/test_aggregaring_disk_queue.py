@@ -151,6 +151,42 @@ def test_get_batch_with_category(category_series: List[Optional[int]], expected_
                 )
 
 
+def test_put_many_with_categories():
+    with TemporaryDirectory() as data_path:
+        with AggregatingDiskQueue[Obj, int](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # given
+            categories = [1, 1, None, 2, 2]
+
+            # when
+            queue.put_many([Obj(i, str(i)) for i in range(5)], categories=categories)
+            queue.flush()
+
+            # then
+            assert [
+                get_queue_element(Obj(i, str(i)), i + 1, 1234, category=categories[i]) for i in range(3)
+            ] == queue.get_batch(10)
+            assert [
+                get_queue_element(Obj(i, str(i)), i + 1, 1234, category=categories[i]) for i in range(3, 5)
+            ] == queue.get_batch(10)
+
+
+def test_put_many_categories_length_mismatch():
+    with TemporaryDirectory() as data_path:
+        with AggregatingDiskQueue[Obj, int](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            with pytest.raises(ValueError):
+                queue.put_many([Obj(1, "1"), Obj(2, "2")], categories=[1])
+
+
 def test_batch_limit():
     with TemporaryDirectory() as data_path:
         with AggregatingDiskQueue[Obj, int](
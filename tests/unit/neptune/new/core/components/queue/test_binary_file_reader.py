@@ -0,0 +1,82 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from neptune.core.components.queue.binary_file_reader import BinaryFileReader
+from neptune.core.components.queue.log_format import (
+    FILE_HEADER,
+    LogFormat,
+    encode_record,
+)
+from tests.unit.neptune.new.utils.file_helpers import create_file
+
+
+def test_simple_file():
+    content = (
+        FILE_HEADER
+        + encode_record({"a": 5, "b": "text"}, LogFormat.BINARY)
+        + encode_record({"a": 13}, LogFormat.BINARY)
+        + encode_record({}, LogFormat.BINARY)
+    )
+
+    with create_file(content, binary_mode=True) as filename:
+        with BinaryFileReader(filename) as reader:
+            assert reader.get() == {"a": 5, "b": "text"}
+            assert reader.get() == {"a": 13}
+            assert reader.get() == {}
+            assert reader.get() is None
+
+
+def test_append_partial_frame():
+    first = encode_record({"a": 5}, LogFormat.BINARY)
+    second = encode_record({"q": 555, "r": [1, 2, 3]}, LogFormat.BINARY)
+
+    with create_file(FILE_HEADER + first, binary_mode=True) as filename, open(filename, "ab") as fp:
+        with BinaryFileReader(filename) as reader:
+            assert reader.get() == {"a": 5}
+            assert reader.get() is None
+
+            fp.write(second[:5])
+            fp.flush()
+            assert reader.get() is None
+
+            fp.write(second[5:])
+            fp.flush()
+            assert reader.get_with_size() == ({"q": 555, "r": [1, 2, 3]}, len(second) - 8)
+            assert reader.get() is None
+            assert not reader.corrupted
+
+
+def test_header_written_later():
+    with create_file(binary_mode=True) as filename, open(filename, "ab") as fp:
+        with BinaryFileReader(filename) as reader:
+            assert reader.get() is None
+
+            fp.write(FILE_HEADER + encode_record({"a": 1}, LogFormat.BINARY))
+            fp.flush()
+            assert reader.get() == {"a": 1}
+
+
+def test_corrupted_tail():
+    valid = encode_record({"a": 5}, LogFormat.BINARY)
+    corrupted = bytearray(encode_record({"b": "some text"}, LogFormat.BINARY))
+    corrupted[-1] ^= 0xFF
+
+    with create_file(FILE_HEADER + valid + bytes(corrupted) + valid, binary_mode=True) as filename:
+        with BinaryFileReader(filename) as reader:
+            assert reader.get() == {"a": 5}
+            assert reader.get() is None
+            assert reader.corrupted
+            assert reader.get() is None
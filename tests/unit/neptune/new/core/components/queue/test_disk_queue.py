@@ -28,6 +28,11 @@ from pytest import fixture
 from neptune.core.components.queue.disk_queue import (
     DiskQueue,
     QueueElement,
+    inspect_queue,
+)
+from neptune.core.components.queue.log_format import (
+    LogFormat,
+    detect_log_format,
 )
 
 
@@ -221,12 +226,386 @@ def test_cleaning_up():
     assert list(Path(data_path).glob("*")) == []
 
 
+def test_put_many():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+        ) as queue:
+            # given
+            queue.put(Obj(0, "0"))
+
+            # when
+            last_version = queue.put_many([Obj(i, str(i)) for i in range(1, 101)])
+            queue.flush()
+
+            # then
+            assert last_version == 101
+            assert queue.size() == 101
+            assert read_offset(data_path, "last_put_version") == "101"
+            assert len(glob(data_path + "/data-*.log")) > 10
+
+            # and
+            assert get_queue_element(Obj(0, "0"), 1, 1234) == queue.get()
+            for i in range(1, 101):
+                assert get_queue_element(Obj(i, str(i)), i + 1, 1235) == queue.get()
+
+
+def test_put_many_empty():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # when
+            last_version = queue.put_many([])
+
+            # then
+            assert last_version == 0
+            assert queue.is_empty()
+
+
+def test_group_commit_of_offsets():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            offset_commit_count=10,
+        ) as queue:
+            # given
+            for i in range(1, 16):
+                queue.put(Obj(i, str(i)))
+
+            # then
+            assert queue.size() == 15
+            assert read_offset(data_path, "last_put_version") == "10"
+
+            # when
+            queue.flush()
+
+            # then
+            assert read_offset(data_path, "last_put_version") == "15"
+
+            # when
+            queue.ack(3)
+
+            # then
+            assert queue.size() == 12
+            assert read_offset(data_path, "last_ack_version") == ""
+
+            # when
+            queue.flush()
+
+            # then
+            assert read_offset(data_path, "last_ack_version") == "3"
+
+
+def test_group_commit_of_idle_queue_on_flush():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            offset_commit_period=3600,
+        ) as queue:
+            # given
+            queue.put(Obj(1, "1"))
+
+            # then
+            assert read_offset(data_path, "last_put_version") == ""
+
+            # when
+            queue.flush()
+
+            # then
+            assert read_offset(data_path, "last_put_version") == "1"
+
+
+def test_recovering_put_version_from_data_files():
+    with TemporaryDirectory() as data_path:
+        queue = DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            offset_commit_period=3600,
+        )
+        # given
+        for i in range(1, 21):
+            queue.put(Obj(i, str(i)))
+
+        # when simulating a crash: data reached the disk, but the offsets were not committed
+        for log_file in queue._log_files:
+            log_file.flush()
+        assert read_offset(data_path, "last_put_version") == ""
+
+        # and partially written record at the end of the last file
+        with open(queue._log_files[-1].file_path, "a") as file:
+            file.write('{"obj": {"num": 21, "tx')
+
+        # then
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            offset_commit_period=3600,
+        ) as resumed_queue:
+            assert resumed_queue.size() == 20
+            assert resumed_queue.put(Obj(21, "21")) == 21
+
+
+def test_binary_format():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            log_format=LogFormat.BINARY,
+        ) as queue:
+            # given
+            for i in range(1, 51):
+                queue.put(Obj(i, str(i)))
+            queue.put_many([Obj(i, str(i)) for i in range(51, 101)])
+
+            # when
+            queue.flush()
+
+            # then
+            data_files = glob(data_path + "/data-*.log")
+            assert len(data_files) > 10
+            assert all(detect_log_format(Path(file)) == LogFormat.BINARY for file in data_files)
+
+            # and
+            for i in range(1, 101):
+                element = queue.get()
+                assert (element.obj, element.ver) == (Obj(i, str(i)), i)
+
+
+def test_pending_bytes():
+    for log_format in LogFormat:
+        with TemporaryDirectory() as data_path:
+            with DiskQueue[Obj](
+                data_path=Path(data_path),
+                to_dict=serializer,
+                from_dict=deserializer,
+                lock=threading.RLock(),
+                max_file_size=300,
+                log_format=log_format,
+            ) as queue:
+                # given
+                queue.put(Obj(1, "1"))
+                queue.put_many([Obj(i, str(i)) for i in range(2, 21)])
+                queue.flush_writer()
+                written = sum(Path(file).stat().st_size for file in glob(data_path + "/data-*.log"))
+
+                # then
+                assert 0 < queue.pending_bytes <= written
+
+                # when
+                queue.get_batch(10)
+
+                # then
+                assert 0 < queue.pending_bytes < written
+
+                # when
+                queue.get_batch(10)
+
+                # then
+                assert queue.pending_bytes == 0
+
+
+def test_resuming_json_queue_in_binary_format():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # given
+            for i in range(1, 6):
+                queue.put(Obj(i, str(i)))
+            queue.ack(2)
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            log_format=LogFormat.BINARY,
+        ) as queue:
+            queue.put_many([Obj(i, str(i)) for i in range(6, 11)])
+            queue.flush()
+
+            # then
+            assert detect_log_format(Path(data_path) / "data-1.log") == LogFormat.JSON
+            assert detect_log_format(Path(data_path) / "data-6.log") == LogFormat.BINARY
+
+            # and
+            assert [(element.obj, element.ver) for element in queue.get_batch(10)] == [
+                (Obj(i, str(i)), i) for i in range(3, 11)
+            ]
+
+
+def test_resuming_binary_queue_with_partial_frame():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            log_format=LogFormat.BINARY,
+        ) as queue:
+            # given
+            for i in range(1, 6):
+                queue.put(Obj(i, str(i)))
+
+        # and record interrupted while writing
+        with open(Path(data_path) / "data-1.log", "ab") as file:
+            file.write(b"\x20\x00\x00")
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            log_format=LogFormat.BINARY,
+        ) as queue:
+            queue.put(Obj(6, "6"))
+            queue.flush()
+
+            # then
+            assert [(element.obj, element.ver) for element in queue.get_batch(10)] == [
+                (Obj(i, str(i)), i) for i in range(1, 7)
+            ]
+
+
+def test_inspecting_queue_with_manifest():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+        ) as queue:
+            # given
+            for i in range(1, 21):
+                queue.put(Obj(i, str(i)))
+            queue.ack(15)
+            queue.flush()
+            files = sorted(Path(data_path).iterdir())
+
+            # when
+            manifest = inspect_queue(Path(data_path))
+
+            # then
+            assert (manifest.last_put_version, manifest.last_ack_version, manifest.pending) == (20, 15, 5)
+            assert manifest.first_version == queue._log_files[0].min_version
+            assert manifest.size_bytes == sum(log_file.file_path.stat().st_size for log_file in queue._log_files)
+            assert manifest.created_at is not None and manifest.updated_at >= manifest.created_at
+            assert sorted(Path(data_path).iterdir()) == files
+
+            # when acknowledged after the manifest was written
+            queue.ack(20)
+
+            # then
+            assert inspect_queue(Path(data_path)).is_empty
+
+
+def test_inspecting_queue_written_to_after_manifest():
+    with TemporaryDirectory() as data_path:
+        # given
+        queue = DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            offset_commit_period=3600,
+        )
+        queue.put(Obj(1, "1"))
+        queue.flush()
+        queue.put(Obj(2, "2"))
+
+        # when simulating a crash: data reached the disk, but neither the offsets nor the manifest were written
+        queue._writer.flush()
+
+        # then
+        assert inspect_queue(Path(data_path)).last_put_version == 2
+
+
+def test_inspecting_queue_without_manifest():
+    with TemporaryDirectory() as data_path:
+        # given
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=100,
+        ) as queue:
+            for i in range(1, 6):
+                queue.put(Obj(i, str(i)))
+            queue.ack(2)
+        (Path(data_path) / "queue_manifest.json").unlink()
+
+        # when
+        manifest = inspect_queue(Path(data_path))
+
+        # then
+        assert (manifest.last_put_version, manifest.last_ack_version, manifest.pending) == (5, 2, 3)
+        assert manifest.size_bytes == sum(path.stat().st_size for path in Path(data_path).glob("data-*.log"))
+
+
+def test_holds_disk_utilization_monitor_until_closed():
+    with TemporaryDirectory() as data_path:
+        with patch("neptune.core.components.queue.disk_queue.get_disk_utilization_monitor") as get_monitor:
+            # given
+            monitor = get_monitor.return_value
+            queue = DiskQueue[Obj](
+                data_path=Path(data_path),
+                to_dict=serializer,
+                from_dict=deserializer,
+                lock=threading.RLock(),
+            )
+
+            # then
+            monitor.acquire.assert_called_once()
+
+            # when
+            queue.close()
+            queue.close()
+
+            # then
+            monitor.release.assert_called_once()
+
+
 @dataclass
 class Obj:
     num: int
     txt: str
 
 
+def read_offset(data_path: str, file_name: str) -> str:
+    with open(Path(data_path) / file_name) as file:
+        return file.read()
+
+
 def get_obj_size_bytes(obj, version, at: Optional[int] = None) -> int:
     return len(json.dumps({"obj": obj.__dict__, "version": version, "at": at}))
 
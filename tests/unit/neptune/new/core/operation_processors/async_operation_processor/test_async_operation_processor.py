@@ -27,9 +27,6 @@ from unittest.mock import (
 from neptune.constants import ASYNC_DIRECTORY
 from neptune.core.components.abstract import WithResources
 from neptune.core.operation_processors.async_operation_processor import AsyncOperationProcessor
-from neptune.core.operation_processors.async_operation_processor.async_operation_processor import (
-    _queue_has_enough_space,
-)
 from neptune.core.operation_processors.operation_processor import OperationProcessor
 from neptune.core.typing.container_type import ContainerType
 from neptune.core.typing.id_formats import (
@@ -114,10 +111,23 @@ class TestAsyncOperationProcessorInit(unittest.TestCase):
     new=lambda _: 10,
 )
 class TestAsyncOperationProcessorEnqueueOperation(unittest.TestCase):
-    def test_check_queue_size(self):
-        assert not _queue_has_enough_space(queue_size=1, batch_size=10)
-        assert not _queue_has_enough_space(queue_size=5, batch_size=10)
-        assert _queue_has_enough_space(queue_size=6, batch_size=10)
+    def test_wakes_consumer_up_as_scheduled(self):
+        # given
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=random.choice(list(ContainerType)),
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+        )
+        processor._consumer = Mock()
+        processor.processing_resources.batch_scheduler.on_enqueued = Mock(side_effect=[True, False])
+
+        # when
+        processor.enqueue_operation(Mock(), wait=False)
+        processor.enqueue_operation(Mock(), wait=False)
+
+        # then
+        processor._consumer.wake_up.assert_called_once()
 
     def test_enqueue_operation_without_wait(self):
         # given
@@ -165,6 +175,30 @@ class TestAsyncOperationProcessorEnqueueOperation(unittest.TestCase):
         processor.processing_resources.disk_queue.put.assert_called_once_with(op, category=10)
         mock_wait.assert_called_once()
 
+    def test_enqueue_operations(self):
+        # given
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=random.choice(list(ContainerType)),
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+        )
+
+        processor.processing_resources.disk_queue.put_many = Mock(return_value=3)
+        processor.processing_resources.disk_queue.size.return_value = 100
+
+        ops = [Mock(), Mock(), Mock()]
+        mock_wait = Mock()
+        processor.wait = mock_wait
+
+        # when
+        processor.enqueue_operations(ops, wait=True)
+
+        # then
+        processor.processing_resources.disk_queue.put_many.assert_called_once_with(ops, categories=[10, 10, 10])
+        assert processor._last_version == 3
+        mock_wait.assert_called_once()
+
     def test_enqueue_operation_not_accepting_operations_raises_warning_and_doesnt_put_to_queue(self):
         # given
         processor = AsyncOperationProcessor(
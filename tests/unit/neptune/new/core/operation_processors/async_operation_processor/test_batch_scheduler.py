@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from neptune.core.operation_processors.async_operation_processor.batch_scheduler import BatchScheduler
+
+
+def scheduler(size=0, pending_bytes=0, linger=1.0, max_batch_ops=100, max_batch_bytes=1000, adaptive=True):
+    queue = Mock(pending_bytes=pending_bytes)
+    queue.size.return_value = size
+    return BatchScheduler(
+        queue=queue, linger=linger, max_batch_ops=max_batch_ops, max_batch_bytes=max_batch_bytes, adaptive=adaptive
+    )
+
+
+@patch("neptune.core.operation_processors.async_operation_processor.batch_scheduler.monotonic")
+def test_pending_operations_are_due_after_linger(monotonic):
+    # given
+    batch_scheduler = scheduler(size=1)
+    monotonic.return_value = 10.0
+
+    # then
+    assert batch_scheduler.on_enqueued()
+    assert not batch_scheduler.on_enqueued()
+    assert not batch_scheduler.is_due()
+
+    # when
+    monotonic.return_value = 10.25
+
+    # then
+    assert batch_scheduler.time_until_due() == 0.75
+    assert not batch_scheduler.is_due()
+
+    # when
+    monotonic.return_value = 11.0
+
+    # then
+    assert batch_scheduler.time_until_due() == 0.0
+    assert batch_scheduler.is_due()
+
+
+def test_full_batch_is_due_immediately():
+    for size, pending_bytes in ((100, 0), (1, 1000)):
+        # given
+        batch_scheduler = scheduler(size=size, pending_bytes=pending_bytes)
+        batch_scheduler.on_enqueued()
+
+        # then
+        assert batch_scheduler.on_enqueued()
+        assert batch_scheduler.is_due()
+
+
+def test_drain_request_makes_pending_operations_due():
+    # given
+    batch_scheduler = scheduler(size=1)
+    batch_scheduler.on_enqueued()
+
+    # when
+    batch_scheduler.request_drain()
+
+    # then
+    assert batch_scheduler.time_until_due() == 0.0
+    assert batch_scheduler.is_due()
+
+    # when
+    batch_scheduler.on_drain()
+
+    # then
+    assert batch_scheduler.time_until_due() is None
+
+
+def test_consumer_is_woken_up_again_once_queue_empties():
+    # given
+    batch_scheduler = scheduler(size=0)
+    batch_scheduler.on_enqueued()
+
+    # when
+    assert batch_scheduler.time_until_due() is None
+
+    # then
+    assert batch_scheduler.on_enqueued()
+    assert not batch_scheduler.is_due()
+
+
+def test_batch_shrinks_on_backoff_and_grows_while_latency_is_stable():
+    # given
+    batch_scheduler = scheduler(max_batch_ops=160)
+
+    # when
+    assert batch_scheduler.on_sent(1.0, backed_off=True)
+    assert batch_scheduler.on_sent(1.0, backed_off=True)
+
+    # then
+    assert batch_scheduler.batch_ops == 40
+
+    # when
+    assert not batch_scheduler.on_sent(1.0, backed_off=False)
+    assert not batch_scheduler.on_sent(2.0, backed_off=False)
+    assert batch_scheduler.on_sent(1.0, backed_off=False)
+
+    # then
+    assert batch_scheduler.batch_ops == 50
+
+    # when
+    for _ in range(20):
+        batch_scheduler.on_sent(1.0, backed_off=False)
+
+    # then
+    assert batch_scheduler.batch_ops == 160
+
+
+def test_batch_never_shrinks_below_minimum_nor_adapts_when_disabled():
+    # given
+    adaptive = scheduler(max_batch_ops=32)
+    fixed = scheduler(max_batch_ops=32, adaptive=False)
+
+    # when
+    for _ in range(10):
+        adaptive.on_sent(1.0, backed_off=True)
+        fixed.on_sent(1.0, backed_off=True)
+
+    # then
+    assert adaptive.batch_ops == 2
+    assert fixed.batch_ops == 32
@@ -14,14 +14,28 @@
 # limitations under the License.
 #
 
+import threading
 import unittest
+from pathlib import Path
+from queue import Queue
+from tempfile import TemporaryDirectory
 from unittest.mock import (
     MagicMock,
     Mock,
     patch,
 )
 
+from neptune_api.proto.neptune_pb.ingest.v1.common_pb2 import Value
+
+from neptune.api.ingestion_sink import LocalIngestionSink
 from neptune.core.operation_processors.async_operation_processor.consumer_thread import ConsumerThread
+from neptune.core.operation_processors.async_operation_processor.processing_resources import ProcessingResources
+from neptune.core.operations import (
+    AssignInt,
+    LogFloats,
+)
+from neptune.core.typing.container_type import ContainerType
+from neptune.core.typing.id_formats import CustomId
 
 
 class TestConsumerThread(unittest.TestCase):
@@ -66,6 +80,56 @@ class TestConsumerThread(unittest.TestCase):
         customer_thread.process_batch.assert_called_once()
         signal_batch_started.assert_called_once()
 
+    def test_work_waits_until_operations_are_due(self):
+        # given
+        customer_thread = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(),
+        )
+        customer_thread._processing_resources.batch_scheduler.is_due.return_value = False
+
+        # when
+        customer_thread.work()
+
+        # then
+        customer_thread._processing_resources.disk_queue.get_batch.assert_not_called()
+
+    def test_sleeps_until_operations_are_due(self):
+        # given
+        customer_thread = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(),
+        )
+        scheduler = customer_thread._processing_resources.batch_scheduler
+
+        # then
+        scheduler.time_until_due.return_value = None
+        assert customer_thread._next_sleep_time() == 30
+
+        scheduler.time_until_due.return_value = 0.25
+        assert customer_thread._next_sleep_time() == 0.25
+
+        customer_thread.disable_sleep()
+        assert customer_thread._next_sleep_time() == 0
+
+    @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_scheduling")
+    def test_process_batch_reports_adapted_batch(self, signal_batch_scheduling):
+        # given
+        customer_thread = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(sink=LocalIngestionSink()),
+        )
+        customer_thread._processing_resources.waiting_cond = MagicMock()
+        customer_thread._processing_resources.batch_scheduler.on_sent.side_effect = [False, True]
+
+        # when
+        customer_thread.process_batch(batch=[AssignInt(["a"], 1)], version=1)
+        customer_thread.process_batch(batch=[AssignInt(["a"], 2)], version=2)
+
+        # then
+        assert customer_thread._processing_resources.batch_scheduler.on_sent.call_args.kwargs == {"backed_off": False}
+        signal_batch_scheduling.assert_called_once()
+
     @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_processed")
     @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_lag")
     def test_process_batch_occurred_at_not_supplied(self, signal_batch_lag, signal_batch_processed):
@@ -107,3 +171,56 @@ class TestConsumerThread(unittest.TestCase):
         signal_batch_processed.assert_called_once_with(queue=customer_thread._processing_resources.signals_queue)
         customer_thread._processing_resources.disk_queue.ack.assert_called_once()
         customer_thread._processing_resources.waiting_cond.notify_all.assert_called_once()
+
+    @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_processed")
+    def test_process_batch_sends_coalesced_snapshots_and_acks_partially(self, signal_batch_processed):
+        # given
+        sink = LocalIngestionSink(max_batch_size=1)
+        customer_thread = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(sink=sink),
+        )
+        customer_thread._processing_resources.waiting_cond = MagicMock()
+        batch = [
+            LogFloats.from_columns(["a"], [1.0, 2.0], [1, 2], [0.0, 0.0]),
+            AssignInt(["b"], 3),
+            LogFloats.from_columns(["c"], [4.0], [3], [0.0]),
+        ]
+
+        # when
+        customer_thread.process_batch(batch=batch, version=13)
+
+        # then
+        assert [op.update.HasField("step") for op in sink.received] == [True, True, False, True]
+        assert [op.update.step.whole for op in sink.received] == [1, 2, 0, 3]
+        assert dict(sink.received[2].update.assign) == {"b": Value(int64=3)}
+        customer_thread._processing_resources.disk_queue.ack.assert_has_calls([((11,),), ((12,),), ((13,),)])
+        customer_thread._processing_resources.waiting_cond.notify_all.assert_called_once()
+
+    @patch("neptune.core.operation_processors.async_operation_processor.processing_resources.MetadataFile", new=Mock)
+    def test_work_sends_queued_operations(self):
+        with TemporaryDirectory() as data_path:
+            # given
+            sink = LocalIngestionSink()
+            processing_resources = ProcessingResources(
+                custom_id=CustomId("test_id"),
+                container_type=ContainerType.RUN,
+                lock=threading.RLock(),
+                signal_queue=Queue(),
+                batch_size=10,
+                data_path=Path(data_path),
+                sink=sink,
+            )
+            processing_resources.disk_queue.put_many([AssignInt(["a"], 1), AssignInt(["b"], 2)], categories=[1, 1])
+            customer_thread = ConsumerThread(sleep_time=30, processing_resources=processing_resources)
+
+            # when
+            customer_thread.work()
+
+            # then
+            assert {key: value.int64 for op in sink.received for key, value in op.update.assign.items()} == {
+                "a": 1,
+                "b": 2,
+            }
+            assert processing_resources.disk_queue.is_empty()
+            processing_resources.close()
@@ -38,6 +38,12 @@ def test_call_propagation_to_wrapped():
     # then
     operation_processor.enqueue_operation.assert_called_once_with(arg_mock, wait=True)
 
+    # when
+    lazy_wrapper.enqueue_operations([arg_mock], wait=False)
+
+    # then
+    operation_processor.enqueue_operations.assert_called_once_with([arg_mock], wait=False)
+
     # when
     with mock.patch.object(
         LazyOperationProcessorWrapper, "operation_storage", new_callable=mock.PropertyMock
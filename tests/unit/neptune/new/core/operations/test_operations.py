@@ -192,6 +192,26 @@ class TestLogFloats:
         # then
         assert log_floats == LogFloats(["test", "path"], values)
 
+    def test__log_floats_operation__columnar_round_trip(self):
+        # given
+        log_floats = LogFloats.from_columns(["test", "path"], [1.5, 2.5, 3.5], [1, 2, None], [10.0, 11.0, 12.0])
+
+        # when
+        data = log_floats.to_dict()
+
+        # then
+        assert data == {
+            "type": "LogFloats",
+            "path": ["test", "path"],
+            "values": {"value": [1.5, 2.5, 3.5], "step": [1, 2, None], "ts": [10.0, 11.0, 12.0]},
+        }
+        assert LogFloats.from_dict(data) == log_floats
+        assert list(LogFloats.from_dict(data).values) == [
+            LogFloats.ValueType(1.5, 1, 10.0),
+            LogFloats.ValueType(2.5, 2, 11.0),
+            LogFloats.ValueType(3.5, None, 12.0),
+        ]
+
 
 @pytest.mark.parametrize(
     "operation",
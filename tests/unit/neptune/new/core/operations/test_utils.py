@@ -0,0 +1,45 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from neptune.core.operations import (
+    AssignFloat,
+    LogFloats,
+)
+from neptune.core.operations.utils import (
+    MULTIPLE_STEPS,
+    try_get_step,
+)
+from neptune.internal import operation as legacy_operation
+
+
+def test_try_get_step__non_series_operation():
+    assert try_get_step(AssignFloat(["a"], 1.0)) is None
+
+
+def test_try_get_step__single_step():
+    assert try_get_step(LogFloats(["a"], [LogFloats.ValueType(1.0, 3, 0.0)])) == 3
+    assert try_get_step(LogFloats.from_columns(["a"], [1.0, 2.0], [3, 3], [0.0, 0.0])) == 3
+
+
+def test_try_get_step__multiple_steps():
+    assert try_get_step(LogFloats.from_columns(["a"], [1.0, 2.0], [3, 4], [0.0, 0.0])) == MULTIPLE_STEPS
+
+
+def test_try_get_step__legacy_operations():
+    assert try_get_step(legacy_operation.LogFloats(["a"], [legacy_operation.LogFloats.ValueType(1.0, 2, 0.0)])) == 2
+    assert (
+        try_get_step(legacy_operation.LogFloats.from_columns(["a"], [1.0, 2.0], [1, 2], [0.0, 0.0])) == MULTIPLE_STEPS
+    )
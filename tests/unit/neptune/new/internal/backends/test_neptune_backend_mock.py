@@ -175,7 +175,7 @@ class TestNeptuneBackendMock(unittest.TestCase):
                 ret = self.backend.get_float_series_attribute(container_id, container_type, path)
 
                 # then
-                self.assertEqual(FloatSeriesField(last=9, path="x"), ret)
+                self.assertEqual(FloatSeriesField(last=9, last_step=3, path="x"), ret)
 
     def test_get_string_series_attribute(self):
         # given
@@ -217,7 +217,7 @@ class TestNeptuneBackendMock(unittest.TestCase):
                 ret = self.backend.get_string_series_attribute(container_id, container_type, path)
 
                 # then
-                self.assertEqual(StringSeriesField(last="qwe", path="x"), ret)
+                self.assertEqual(StringSeriesField(last="qwe", last_step=3, path="x"), ret)
 
     def test_get_string_set_attribute(self):
         # given
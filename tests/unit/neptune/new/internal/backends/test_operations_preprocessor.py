@@ -168,6 +168,54 @@ class TestOperationsPreprocessor(TestAttributeBase):
         )
         self.assertEqual(processor.processed_ops_count, len(operations))
 
+    def test_series_columns_are_merged_once(self):
+        # given
+        processor = OperationsPreprocessor()
+
+        operations = [
+            LogFloats.from_columns(["a"], [1.0, 2.0], [1, 2], [10.0, 20.0]),
+            LogFloats.from_columns(["a"], [3.0], [3], [30.0]),
+            LogFloats.from_columns(["a"], [4.0, 5.0], [4, None], [40.0, 50.0]),
+        ]
+
+        # when
+        processor.process(operations)
+
+        # then
+        result = processor.get_operations()
+        self.assertEqual(
+            result.other_operations,
+            [
+                LogFloats.from_columns(
+                    ["a"], [1.0, 2.0, 3.0, 4.0, 5.0], [1, 2, 3, 4, None], [10.0, 20.0, 30.0, 40.0, 50.0]
+                )
+            ],
+        )
+        self.assertEqual(result.other_operations[0].to_dict()["values"]["value"], [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    def test_delete_after_merged_series(self):
+        # given
+        processor = OperationsPreprocessor()
+
+        operations = [
+            LogFloats(["a"], [FLog(1, 2, 3)]),
+            LogFloats(["a"], [FLog(10, 20, 30)]),
+            DeleteAttribute(["a"]),
+        ]
+
+        # when
+        processor.process(operations)
+
+        # then
+        result = processor.get_operations()
+        self.assertEqual(
+            result.other_operations,
+            [
+                LogFloats(["a"], [FLog(1, 2, 3), FLog(10, 20, 30)]),
+                DeleteAttribute(["a"]),
+            ],
+        )
+
     def test_sets(self):
         # given
         processor = OperationsPreprocessor()
@@ -16,7 +16,10 @@
 import unittest
 from unittest.mock import MagicMock
 
-from neptune.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
+from neptune.internal.backends.swagger_client_wrapper import (
+    LazySwaggerClientWrapper,
+    SwaggerClientWrapper,
+)
 
 
 class TestSwaggerClientWrapper(unittest.TestCase):
@@ -41,3 +44,23 @@ class TestSwaggerClientWrapper(unittest.TestCase):
         api.method.assert_called_once_with("arg1", kwarg="kwarg1")
         api.callable_object.assert_called_once_with("arg2", kwarg="kwarg2")
         self.assertEqual(13, wrapper.api.callable_object.sub_property)
+
+    def test_lazy_wrapper_builds_client_on_first_use(self):
+        # given
+        swagger_client = MagicMock()
+        factory = MagicMock(return_value=swagger_client)
+
+        # when
+        wrapper = LazySwaggerClientWrapper(factory)
+
+        # then
+        factory.assert_not_called()
+
+        # when
+        wrapper.api.method("arg1")
+        wrapper.api.method("arg2")
+
+        # then
+        factory.assert_called_once_with()
+        self.assertEqual(2, swagger_client.api.method.call_count)
+        self.assertIs(swagger_client.swagger_spec, wrapper.swagger_spec)
@@ -0,0 +1,97 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import time
+
+import pytest
+import requests
+from mock import MagicMock
+
+from neptune.internal.backends.swagger_spec_cache import SwaggerSpecCache
+
+URL = "https://app.neptune.ai/api/backend/swagger.json"
+SPEC = {"swagger": "2.0", "paths": {}}
+
+
+def response(status_code, json=None, headers=None):
+    return MagicMock(status_code=status_code, json=MagicMock(return_value=json), headers=headers or {})
+
+
+def test_downloads_and_stores_spec(tmp_path):
+    # given
+    cache = SwaggerSpecCache(tmp_path, max_age=60)
+    session = MagicMock()
+    session.get.return_value = response(200, SPEC, {"ETag": '"v1"'})
+
+    # expect
+    assert cache.load(URL, session) == SPEC
+    assert cache.load(URL, session) == SPEC
+    session.get.assert_called_once()
+    assert cache.path_for(URL).exists()
+
+
+def test_revalidates_stale_spec(tmp_path):
+    # given
+    cache = SwaggerSpecCache(tmp_path, max_age=60)
+    session = MagicMock()
+    session.get.return_value = response(200, SPEC, {"ETag": '"v1"', "Last-Modified": "yesterday"})
+    cache.load(URL, session)
+    stale = time.time() - 120
+    os.utime(cache.path_for(URL), (stale, stale))
+
+    # when
+    session.get.return_value = response(304)
+    spec = cache.load(URL, session)
+
+    # then
+    assert spec == SPEC
+    _, kwargs = session.get.call_args
+    assert kwargs["headers"] == {"If-None-Match": '"v1"', "If-Modified-Since": "yesterday"}
+    assert cache.path_for(URL).stat().st_mtime > stale
+
+
+def test_replaces_changed_spec(tmp_path):
+    # given
+    cache = SwaggerSpecCache(tmp_path, max_age=0)
+    session = MagicMock()
+    session.get.return_value = response(200, SPEC)
+    cache.load(URL, session)
+
+    # when
+    new_spec = {**SPEC, "info": {"version": "2"}}
+    session.get.return_value = response(200, new_spec)
+
+    # then
+    assert cache.load(URL, session) == new_spec
+    session.get.return_value = response(304)
+    assert cache.load(URL, session) == new_spec
+
+
+def test_falls_back_to_cached_spec_when_offline(tmp_path):
+    # given
+    cache = SwaggerSpecCache(tmp_path, max_age=0)
+    session = MagicMock()
+    session.get.return_value = response(200, SPEC)
+    cache.load(URL, session)
+
+    # when
+    session.get.side_effect = requests.ConnectionError()
+
+    # then
+    assert cache.load(URL, session) == SPEC
+    with pytest.raises(requests.ConnectionError):
+        cache.load("https://other/swagger.json", session)
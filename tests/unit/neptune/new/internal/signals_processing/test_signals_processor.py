@@ -25,6 +25,7 @@ from neptune.internal.signals_processing.signals_processor import SignalsProcess
 from neptune.internal.signals_processing.utils import (
     signal_batch_lag,
     signal_batch_processed,
+    signal_batch_scheduling,
     signal_batch_started,
 )
 
@@ -544,3 +545,25 @@ def test__lag__longer_interval_different_cycles(monotonic):
         ),
         any_order=True,
     )
+
+
+def test__batch_scheduling__last_reported_values_kept():
+    # given
+    queue = Queue()
+    signal_batch_scheduling(queue=queue, linger=0.5, max_batch_ops=1000, max_batch_bytes=1024, occured_at=1.0)
+    signal_batch_scheduling(queue=queue, linger=0.5, max_batch_ops=500, max_batch_bytes=1024, occured_at=2.0)
+
+    # and
+    processor = SignalsProcessor(
+        period=10,
+        container=MagicMock(),
+        queue=queue,
+        async_lag_threshold=1.0,
+        async_no_progress_threshold=1.0,
+    )
+
+    # when
+    processor.work()
+
+    # then
+    assert (processor.batch_scheduling.linger, processor.batch_scheduling.max_batch_ops) == (0.5, 500)
@@ -0,0 +1,184 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import itertools
+import os
+import stat
+import threading
+import time
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+import jwt
+import pytest
+
+from neptune.internal.oauth import (
+    NeptuneAuth,
+    NeptuneAuthenticator,
+    TokenRefresher,
+)
+from neptune.internal.token_cache import TokenCache
+
+_counter = itertools.count()
+
+
+def access_token(lifetime=300.0):
+    now = time.time()
+    payload = {
+        "exp": now + lifetime,
+        "iat": now,
+        "azp": "client",
+        "iss": "https://auth/realms/neptune",
+        "n": next(_counter),
+    }
+    return jwt.encode(payload, "secret", algorithm="HS256")
+
+
+def backend_client(lifetime=300.0):
+    client = MagicMock()
+    client.api.exchangeApiToken.side_effect = lambda **_: MagicMock(
+        **{
+            "response.return_value.result": MagicMock(
+                accessToken=access_token(lifetime), refreshToken=f"r{next(_counter)}"
+            )
+        }
+    )
+    return client
+
+
+def authenticator(client, cache_dir):
+    with patch("neptune.internal.oauth.get_token_cache", new=lambda api_token: TokenCache(cache_dir, api_token)):
+        return NeptuneAuthenticator("api-token", client, ssl_verify=True, proxies=None)
+
+
+@pytest.fixture(autouse=True)
+def no_background_refresh():
+    with patch.object(NeptuneAuth, "_ensure_background_refresh"):
+        yield
+
+
+def refresh(session, *_, **__):
+    session.token = {"access_token": access_token(), "refresh_token": f"r{next(_counter)}", "expires_in": 300}
+
+
+def test_processes_share_exchanged_tokens(tmp_path):
+    # given
+    client = backend_client()
+
+    # when
+    first = authenticator(client, tmp_path)
+    second = authenticator(client, tmp_path)
+
+    # then
+    client.api.exchangeApiToken.assert_called_once()
+    assert first.auth.session.token["access_token"] == second.auth.session.token["access_token"]
+    assert first.auth.token_expires_at > time.time() + 250
+
+    # and
+    [cache_file] = tmp_path.glob("*.json")
+    assert "api-token" not in cache_file.name
+    if os.name == "posix":
+        assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+
+
+def test_refresh_reuses_token_refreshed_by_another_process(tmp_path):
+    # given
+    client = backend_client()
+    first = authenticator(client, tmp_path)
+    second = authenticator(client, tmp_path)
+
+    # when
+    with patch("requests_oauthlib.OAuth2Session.refresh_token", autospec=True, side_effect=refresh) as refresh_token:
+        first.auth.refresh_token_if_needed(force=True)
+        second.auth.refresh_token_if_needed(force=True)
+
+    # then
+    refresh_token.assert_called_once()
+    assert first.auth.session.token["access_token"] == second.auth.session.token["access_token"]
+    assert second.auth.session.token["refresh_token"] == first.auth.session.token["refresh_token"]
+
+
+def test_concurrent_requests_refresh_token_once(tmp_path):
+    # given
+    auth = authenticator(backend_client(lifetime=10), tmp_path).auth
+
+    def slow_refresh(session, *args, **kwargs):
+        time.sleep(0.05)
+        refresh(session)
+
+    # when
+    with patch(
+        "requests_oauthlib.OAuth2Session.refresh_token", autospec=True, side_effect=slow_refresh
+    ) as refresh_token:
+        threads = [threading.Thread(target=auth.refresh_token_if_needed) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # then
+    refresh_token.assert_called_once()
+
+
+def test_token_is_refreshed_ahead_of_expiry(tmp_path):
+    # given
+    auth = authenticator(backend_client(), tmp_path).auth
+
+    # then
+    assert auth.token_expires_at - 121 < auth.token_refresh_at < auth.token_expires_at - 119
+
+    # when
+    with patch("requests_oauthlib.OAuth2Session.refresh_token", autospec=True, side_effect=refresh) as refresh_token:
+        auth.refresh_token_ahead_of_expiry()
+        auth.token_refresh_at = time.time()
+        auth.refresh_token_ahead_of_expiry()
+
+    # then
+    refresh_token.assert_called_once()
+
+
+def test_background_refresher_renews_token_before_it_expires(tmp_path):
+    # given
+    auth = authenticator(backend_client(lifetime=2), tmp_path).auth
+    expires_at = auth.token_expires_at
+    refresher = TokenRefresher(auth)
+
+    # when
+    with patch("requests_oauthlib.OAuth2Session.refresh_token", autospec=True, side_effect=refresh):
+        refresher.start()
+        while auth.token_expires_at == expires_at and time.time() < expires_at:
+            time.sleep(0.05)
+        refresher.interrupt()
+        refresher.join()
+
+    # then
+    assert auth.token_expires_at > expires_at
+
+
+def test_background_refresher_stops_until_next_request(tmp_path):
+    # given
+    auth = authenticator(backend_client(), tmp_path).auth
+    refresher = TokenRefresher(auth)
+    auth._refresher = refresher
+    refresher.start()
+
+    # when
+    auth.stop_background_refresh()
+
+    # then
+    assert not refresher.is_alive()
+    assert auth._refresher is None
@@ -60,6 +60,17 @@ class TestOperations(unittest.TestCase):
         # expect no Operation subclass left
         self.assertEqual(classes, set())
 
+    def test_deserialization_of_malformed_operations(self):
+        with self.assertRaises(ValueError):
+            Operation.from_dict({"path": ["a"]})
+
+        with self.assertRaises(ValueError):
+            Operation.from_dict({"type": "UnknownOperation", "path": ["a"]})
+
+        # abstract operations cannot be decoded
+        with self.assertRaises(ValueError):
+            Operation.from_dict({"type": "LogOperation", "path": ["a"]})
+
     @staticmethod
     def _list_objects():
         now = datetime.now()
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import itertools
 import sys
 import threading
 import unittest
@@ -26,11 +27,19 @@ from neptune.internal.streams.std_stream_capture_logger import (
 )
 
 
+def mock_container(first_step=0):
+    container = MagicMock()
+    steps = itertools.count(first_step)
+    series = container.__getitem__.return_value.series_logger.return_value
+    series.reserve_steps.side_effect = lambda count: [next(steps) for _ in range(count)]
+    return container
+
+
 class TestStdStreamCaptureLogger(unittest.TestCase):
     def test_catches_stdout(self):
         stdout = StringIO()
         with redirect_stdout(stdout):
-            mock_run = MagicMock()
+            mock_run = mock_container()
             attr_name = "sys/stdout"
             logger = StdoutCaptureLogger(mock_run, attr_name)
             stdout_fp = sys.stdout
@@ -38,19 +47,34 @@ class TestStdStreamCaptureLogger(unittest.TestCase):
             logger.close()
 
             self.assertListEqual(
-                mock_run[attr_name].append.call_args_list,
+                mock_run[attr_name].series_logger().extend.call_args_list,
                 [
-                    (("testing",), {}),
-                    (("\n",), {}),
+                    ((["testing\n"],), {"steps": [0]}),
                 ],
             )
         stdout.seek(0)
         self.assertEqual(stdout.read(), "testing\n")
 
+    def test_continues_after_steps_of_resumed_series(self):
+        stream = StringIO()
+        mock_run = mock_container(first_step=42)
+        attr_name = "sys/stdout"
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream)
+        logger.write("resumed\n")
+        logger.close()
+
+        self.assertListEqual(
+            mock_run[attr_name].series_logger().extend.call_args_list,
+            [
+                ((["resumed\n"],), {"steps": [42]}),
+            ],
+        )
+
     def test_does_not_report_if_used_after_stop(self):
         stdout = StringIO()
         with redirect_stdout(stdout):
-            mock_run = MagicMock()
+            mock_run = mock_container()
             attr_name = "sys/stdout"
             logger = StdoutCaptureLogger(mock_run, attr_name)
             stdout_fp = sys.stdout
@@ -63,7 +87,7 @@ class TestStdStreamCaptureLogger(unittest.TestCase):
 
     def test_logger_with_lock_does_not_cause_deadlock(self):
         stream = StringIO()
-        mock_run = MagicMock()
+        mock_run = mock_container()
         attr_name = "sys/stdout"
 
         logger = StdStreamCaptureLogger(mock_run, attr_name, stream)
@@ -79,10 +103,70 @@ class TestStdStreamCaptureLogger(unittest.TestCase):
         done_waiting.set()
         logger.close()
         self.assertListEqual(
-            mock_run[attr_name].append.call_args_list,
+            mock_run[attr_name].series_logger().extend.call_args_list,
             [
-                (("testing",), {}),
+                ((["testing"],), {"steps": [0]}),
             ],
         )
         stream.seek(0)
         self.assertEqual(stream.read(), "testing")
+
+    def test_coalesces_writes_into_lines(self):
+        stream = StringIO()
+        mock_run = mock_container()
+        attr_name = "sys/stdout"
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream, flush_period=60)
+        for char in "first\nsecond\nthi":
+            logger.write(char)
+        logger.write("rd")
+        logger.close()
+
+        self.assertListEqual(
+            mock_run[attr_name].series_logger().extend.call_args_list,
+            [
+                ((["first\n", "second\n"],), {"steps": [0, 1]}),
+                # incomplete line is held back until closing
+                ((["third"],), {"steps": [2]}),
+            ],
+        )
+        stream.seek(0)
+        self.assertEqual(stream.read(), "first\nsecond\nthird")
+
+    def test_flushes_when_size_budget_exceeded(self):
+        stream = StringIO()
+        mock_run = mock_container()
+        attr_name = "sys/stdout"
+        flushed = threading.Event()
+        mock_run[attr_name].series_logger().extend.side_effect = lambda *args, **kwargs: flushed.set()
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream, flush_period=60, flush_size=10)
+        logger.write("0123456789\n")
+
+        self.assertTrue(flushed.wait(timeout=10))
+        logger.close()
+        self.assertListEqual(
+            mock_run[attr_name].series_logger().extend.call_args_list,
+            [
+                ((["0123456789\n"],), {"steps": [0]}),
+            ],
+        )
+
+    def test_drops_oldest_writes_over_memory_cap(self):
+        stream = StringIO()
+        mock_run = mock_container()
+        attr_name = "sys/stdout"
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream, flush_period=60, max_buffered_size=10)
+        logger.pause()
+        for i in range(5):
+            logger.write(f"line {i}\n")
+        logger.resume()
+        logger.close()
+
+        self.assertListEqual(
+            mock_run[attr_name].series_logger().extend.call_args_list,
+            [
+                ((["line 4\n"],), {"steps": [0]}),
+            ],
+        )
@@ -0,0 +1,35 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest.mock import patch
+
+from neptune.internal.token_cache import get_token_cache
+
+
+def test_token_cache_is_opt_in_and_kept_in_home_directory(monkeypatch, tmp_path):
+    # given
+    monkeypatch.delenv("NEPTUNE_TOKEN_CACHE", raising=False)
+
+    # then
+    assert get_token_cache("api-token") is None
+
+    # when
+    monkeypatch.setenv("NEPTUNE_TOKEN_CACHE", "True")
+    with patch("pathlib.Path.home", return_value=tmp_path):
+        cache = get_token_cache("api-token")
+
+    # then
+    assert cache is not None
+    assert cache.path.parent == tmp_path / ".neptune" / "token_cache"
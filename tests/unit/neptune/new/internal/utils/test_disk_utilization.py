@@ -34,12 +34,17 @@ from neptune.envs import (
 )
 from neptune.exceptions import NeptuneMaxDiskUtilizationExceeded
 from neptune.internal.utils.disk_utilization import (
+    DiskUtilizationMonitor,
     NonRaisingErrorHandler,
     RaisingErrorHandler,
     ensure_disk_not_overutilize,
+    get_disk_utilization_monitor,
+    get_disk_utilization_percent,
 )
 
 
+# every test gets its own monitors, not held by queues left open by other tests
+@patch.dict("neptune.internal.utils.disk_utilization._monitors", clear=True)
 class TestDiskUtilization(unittest.TestCase):
     @patch.dict(os.environ, {NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED: "True"})
     def test_handle_invalid_env_values(self):
@@ -103,6 +108,12 @@ class TestDiskUtilization(unittest.TestCase):
             wrapped_func()  # asserting is not required as expecting that any error will be caught
             mocked_func.assert_called_once()
 
+    @patch("psutil.disk_usage")
+    def test_utilization_of_missing_directory(self, disk_usage_mock):
+        disk_usage_mock.side_effect = FileNotFoundError()
+
+        assert get_disk_utilization_percent("missing") is None
+
     @patch.dict(os.environ, {NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED: "True"})
     @patch.dict(os.environ, {NEPTUNE_MAX_DISK_USAGE: "100"})
     @patch("psutil.disk_usage")
@@ -140,6 +151,116 @@ class TestDiskUtilization(unittest.TestCase):
 
         mocked_func.assert_not_called()
 
+    @patch.dict(os.environ, {NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED: "True"})
+    @patch.dict(os.environ, {NEPTUNE_MAX_DISK_USAGE: "60"})
+    @patch("psutil.disk_usage")
+    def test_utilization_is_not_sampled_on_every_call(self, disk_usage_mock):
+        disk_usage_mock.return_value.percent = 10
+        disk_usage_mock.return_value.total = 1000
+        mocked_func = MagicMock()
+        wrapped_func = ensure_disk_not_overutilize(mocked_func)
+        monitor = get_disk_utilization_monitor()
+        monitor.acquire()
+
+        try:
+            for _ in range(100):
+                wrapped_func()
+        finally:
+            monitor.release()
+
+        assert mocked_func.call_count == 100
+        assert disk_usage_mock.call_count < 100
+
+    @patch.dict(os.environ, {NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED: "True"})
+    @patch.dict(os.environ, {NEPTUNE_MAX_DISK_USAGE: "60"})
+    @patch("neptune.internal.utils.disk_utilization.get_disk_utilization_monitor")
+    def test_monitor_is_not_created_on_decoration(self, get_monitor_mock):
+        mocked_func = MagicMock()
+        wrapped_func = ensure_disk_not_overutilize(mocked_func)
+
+        get_monitor_mock.assert_not_called()
+
+        get_monitor_mock.return_value.utilization = 10.0
+        wrapped_func()
+        wrapped_func()
+
+        get_monitor_mock.assert_called_once()
+        assert mocked_func.call_count == 2
+
+    def test_hysteresis(self):
+        monitor = MagicMock()
+        mocked_func = MagicMock()
+        handler = RaisingErrorHandler(60.0, mocked_func, get_monitor=lambda: monitor, hysteresis=10.0)
+
+        for utilization, should_write in [(55, True), (60, False), (55, False), (49, True), (55, True)]:
+            monitor.utilization = utilization
+            mocked_func.reset_mock()
+            if should_write:
+                handler.run()
+                mocked_func.assert_called_once()
+            else:
+                with pytest.raises(NeptuneMaxDiskUtilizationExceeded):
+                    handler.run()
+                mocked_func.assert_not_called()
+
+
+class TestDiskUtilizationMonitor(unittest.TestCase):
+    @patch("psutil.disk_usage")
+    def test_projects_written_bytes(self, disk_usage_mock):
+        disk_usage_mock.return_value.percent = 50.0
+        disk_usage_mock.return_value.total = 1000
+        monitor = DiskUtilizationMonitor(path="/", sampling_period=60)
+        monitor.acquire()
+        try:
+            assert monitor.start()
+
+            monitor.record_written(100)
+            assert monitor.utilization == 60.0
+
+            monitor.notify_file_rotated()
+            assert monitor.utilization == 50.0
+        finally:
+            monitor.release()
+
+    @patch("psutil.disk_usage")
+    def test_samples_only_while_held_by_queues(self, disk_usage_mock):
+        disk_usage_mock.return_value.percent = 50.0
+        disk_usage_mock.return_value.total = 1000
+        monitor = DiskUtilizationMonitor(path="/", sampling_period=60)
+
+        assert not monitor.start()
+
+        monitor.acquire()
+        monitor.acquire()
+        assert monitor.start()
+
+        monitor.release()
+        assert monitor._thread is not None
+
+        monitor.release()
+        assert monitor._thread is None
+        assert not monitor.start()
+
+    @patch("psutil.disk_usage")
+    def test_written_bytes_ignored_when_not_started(self, disk_usage_mock):
+        disk_usage_mock.return_value.percent = 50.0
+        disk_usage_mock.return_value.total = 1000
+        monitor = DiskUtilizationMonitor(path="/", sampling_period=60)
+        monitor.refresh()
+
+        monitor.record_written(100)
+
+        assert monitor.utilization == 50.0
+
+    @patch("psutil.disk_usage")
+    def test_sampling_error(self, disk_usage_mock):
+        disk_usage_mock.side_effect = Error()
+        monitor = DiskUtilizationMonitor(path="/", sampling_period=60)
+
+        monitor.refresh()
+
+        assert monitor.utilization is None
+
 
 class TestDiskErrorHandler(unittest.TestCase):
     @patch("neptune.internal.utils.disk_utilization.RaisingErrorHandler")
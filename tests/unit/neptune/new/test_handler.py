@@ -30,11 +30,13 @@ from neptune import (
     ANONYMOUS_API_TOKEN,
     init_run,
 )
+from neptune.api.models import StringSeriesField
 from neptune.attributes.atoms.boolean import Boolean
 from neptune.attributes.atoms.datetime import Datetime
 from neptune.attributes.atoms.float import Float
 from neptune.attributes.atoms.integer import Integer
 from neptune.attributes.atoms.string import String
+from neptune.attributes.series.string_series import StringSeries
 from neptune.attributes.sets.string_set import StringSet
 from neptune.envs import (
     API_TOKEN_ENV_NAME,
@@ -44,6 +46,7 @@ from neptune.exceptions import (
     NeptuneUnsupportedFunctionalityException,
     NeptuneUserApiInputException,
 )
+from neptune.internal.operation import LogFloats
 from neptune.internal.warnings import (
     NeptuneUnsupportedType,
     warned_once,
@@ -252,6 +255,46 @@ class TestSeries:
             assert exp["some"]["num"]["val"].fetch_last() == 15
             assert exp["some"]["str"]["val"].fetch_last() == "other"
 
+    def test_series_logger(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            ops = []
+            with patch.object(exp._op_processor, "enqueue_operation", lambda op, wait: ops.append(op)), patch.object(
+                exp._op_processor, "enqueue_operations", lambda batch, wait: ops.extend(batch)
+            ):
+                loss = exp["train/loss"].series_logger()
+                assert exp["train"]["loss"].series_logger() is loss
+
+                for step in range(3):
+                    loss.append(step / 2, step=step)
+                exp["train/loss"].append(2, step=3, timestamp=1.0)
+                exp["train/loss"].append(float("nan"), step=4)
+                loss.extend([3.0, 4.0], steps=[5, 6])
+
+                assert all(isinstance(op, LogFloats) and op.path == ["train", "loss"] for op in ops)
+                assert [value.value for op in ops for value in op.values] == [0.0, 0.5, 1.0, 2.0, 3.0, 4.0]
+                assert [value.step for op in ops for value in op.values] == [0, 1, 2, 3, 5, 6]
+                assert ops[3].values[0].ts == 1.0
+
+                # values other than numbers take the regular path
+                tokens = exp["train/tokens"].series_logger()
+                tokens.append("text", step=0)
+                tokens.append("more", step=1)
+
+                assert isinstance(exp.get_structure()["train"]["tokens"], StringSeries)
+                assert [value.value for value in ops[-2].values + ops[-1].values] == ["text", "more"]
+
+    def test_series_logger_reserves_steps_after_last_step_of_resumed_run(self):
+        with init_run(mode="debug", flush_period=0.5, custom_run_id="resumed") as exp:
+            assert exp["logs"].series_logger().reserve_steps(2) == [0, 1]
+
+            exp._series_loggers.clear()
+            last_field = StringSeriesField(path="logs", last="line", last_step=7)
+            with patch.object(exp._backend, "get_string_series_attribute", return_value=last_field) as get_attribute:
+                assert exp["logs"].series_logger().reserve_steps(2) == [8, 9]
+                assert exp["logs"].series_logger().reserve_steps(1) == [10]
+
+            get_attribute.assert_called_once_with("resumed", exp.container_type, ["logs"])
+
     def test_append_many_values_cause_error(self):
         with init_run(mode="debug", flush_period=0.5) as exp:
             with assert_unsupported_warning():
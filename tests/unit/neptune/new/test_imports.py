@@ -0,0 +1,51 @@
+#
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import subprocess
+import sys
+
+# modules that must not be loaded by a plain `import neptune`
+HEAVY_MODULES = [
+    "bravado",
+    "bravado_core",
+    "google.protobuf",
+    "jsonschema",
+    "neptune.objects.run",
+    "neptune_api",
+    "pandas",
+    "psutil",
+    "requests",
+    "websocket",
+]
+
+
+def _loaded_modules(code: str):
+    output = subprocess.check_output(
+        [sys.executable, "-c", f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"],
+    )
+    return set(json.loads(output.decode().splitlines()[-1]))
+
+
+def test_import_neptune_does_not_load_heavy_modules():
+    assert set(HEAVY_MODULES) & _loaded_modules("import neptune") == set()
+
+
+def test_objects_are_imported_on_first_access():
+    loaded = _loaded_modules("import neptune\nassert neptune.init_run is neptune.Run")
+
+    assert "neptune.objects.run" in loaded
+    assert "neptune.internal.patches.bravado" in loaded
@@ -15,7 +15,9 @@
 #
 import logging
 import os
+import time
 import unittest
+from contextlib import contextmanager
 
 import pytest
 from mock import patch
@@ -28,7 +30,11 @@ from neptune.envs import (
     API_TOKEN_ENV_NAME,
     PROJECT_ENV_NAME,
 )
-from neptune.integrations.python_logger import NeptuneHandler
+from neptune.integrations.python_logger import (
+    AsyncNeptuneHandler,
+    NeptuneHandler,
+)
+from neptune.internal.operation import LogStrings
 from neptune.objects.neptune_object import NeptuneObject
 
 
@@ -144,3 +150,122 @@ class TestLogHandler(unittest.TestCase):
 
             log_entries = list(exp["monitoring"]["some_hash"]["python_logger"].fetch_values().value)
             self.assertListEqual(log_entries, ["error message", "test message", "error message"])
+
+
+@patch.object(
+    NeptuneObject,
+    "_async_create_run",
+    lambda self: self._backend._create_container(self._custom_id, self.container_type, self._project_id),
+)
+class TestAsyncLogHandler:
+    @classmethod
+    def setup_class(cls) -> None:
+        os.environ[PROJECT_ENV_NAME] = "organization/project"
+        os.environ[API_TOKEN_ENV_NAME] = ANONYMOUS_API_TOKEN
+
+    @staticmethod
+    @contextmanager
+    def captured_values(exp):
+        values = []
+
+        def capture(ops):
+            values.extend((value.value, value.step) for op in ops if isinstance(op, LogStrings) for value in op.values)
+
+        with patch.object(exp._op_processor, "enqueue_operation", lambda op, wait: capture([op])), patch.object(
+            exp._op_processor, "enqueue_operations", lambda ops, wait: capture(ops)
+        ):
+            yield values
+
+    @staticmethod
+    def logger_with(handler):
+        logger = logging.getLogger(f"test_async_log_handler_{id(handler)}")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(handler)
+        return logger
+
+    def test_logs_records_in_background(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            with self.captured_values(exp) as values:
+                handler = AsyncNeptuneHandler(run=exp, path="logs", flush_size=2, flush_period=60)
+                logger = self.logger_with(handler)
+
+                logger.info("first")
+                logger.warning("second %s", "message")
+                for _ in range(100):
+                    if len(values) == 2:
+                        break
+                    time.sleep(0.05)
+
+                assert values == [("first", 0), ("second message", 1)]
+
+                logger.info("third")
+                handler.close()
+
+                assert values == [("first", 0), ("second message", 1), ("third", 2)]
+
+    @pytest.mark.parametrize(
+        "policy, expected",
+        [
+            ("drop_oldest", ["7", "8", "9"]),
+            ("sample", ["1", "2", "6"]),
+        ],
+    )
+    def test_overflow_policies(self, policy, expected):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            with self.captured_values(exp) as values:
+                handler = AsyncNeptuneHandler(
+                    run=exp,
+                    path="logs",
+                    flush_period=60,
+                    max_buffered_records=3,
+                    overflow_policy=policy,
+                    sample_every=4,
+                )
+                logger = self.logger_with(handler)
+
+                for i in range(10):
+                    logger.info("%d", i)
+                handler.close()
+
+                assert [value for value, _ in values] == expected
+                assert handler.dropped_records == 7
+
+    def test_blocking_overflow_policy(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            with self.captured_values(exp) as values:
+                handler = AsyncNeptuneHandler(
+                    run=exp, path="logs", flush_period=60, max_buffered_records=2, overflow_policy="block"
+                )
+                logger = self.logger_with(handler)
+
+                for i in range(10):
+                    logger.info("%d", i)
+                handler.close()
+
+                assert [value for value, _ in values] == [str(i) for i in range(10)]
+                assert handler.dropped_records == 0
+
+    def test_handlers_of_same_path_share_steps_and_keep_record_times(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            logged = []
+
+            def capture(ops):
+                logged.extend((v.value, v.step, v.ts) for op in ops if isinstance(op, LogStrings) for v in op.values)
+
+            with patch.object(exp._op_processor, "enqueue_operation", lambda op, wait: capture([op])), patch.object(
+                exp._op_processor, "enqueue_operations", lambda ops, wait: capture(ops)
+            ):
+                first_handler = AsyncNeptuneHandler(run=exp, path="logs", flush_period=60)
+                second_handler = NeptuneHandler(run=exp, path="logs")
+                created = []
+                for handler in (first_handler, second_handler):
+                    handler.addFilter(lambda record: created.append(record.created) or True)
+                first_logger, second_logger = self.logger_with(first_handler), self.logger_with(second_handler)
+
+                first_logger.info("first")
+                first_handler.close()
+                second_logger.info("second")
+
+            assert [(value, step) for value, step, _ in logged] == [("first", 0), ("second", 1)]
+            assert [ts for _, _, ts in logged] == created
@@ -0,0 +1,48 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+from mock import Mock
+
+from neptune.api.models import (
+    FieldType,
+    FloatField,
+    StringField,
+)
+from neptune.internal.container_type import ContainerType
+from neptune.table import TableEntry
+
+
+def test_table_entry_lookup():
+    # given
+    entry = TableEntry(
+        backend=Mock(),
+        container_type=ContainerType.RUN,
+        _id="RUN-1",
+        attributes=[
+            StringField(path="sys/id", value="RUN-1"),
+            FloatField(path="metrics/loss", value=0.5),
+            FloatField(path="metrics/loss", value=0.7),
+        ],
+    )
+
+    # then
+    assert entry["sys"]["id"].get() == "RUN-1"
+    assert entry.get_attribute_value("metrics/loss") == 0.5
+    assert entry.get_attribute_type("metrics/loss") == FieldType.FLOAT
+    with pytest.raises(ValueError):
+        entry.get_attribute_value("metrics/accuracy")
+    with pytest.raises(ValueError):
+        entry.get_attribute_type("metrics/accuracy")